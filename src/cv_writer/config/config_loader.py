@@ -20,21 +20,140 @@ class Config:
             "provider": "openai",
             "model": "gpt-4o",
             "temperature": 0.7,
+            "prompt_caching": True,
+            "base_url": None,
+            "client_pool": True,
+            "max_connections": 20,
         },
         "optimizer": {
             "max_iterations": 3,
             "save_intermediate_versions": False,
+            "candidates": 1,
+            "candidate_temperatures": None,
+            "candidate_scoring": "local",
+            "keyword_gate": False,
+            "min_keyword_coverage": 0.0,
+            "review_mode": "full",
+            "write_mode": "full",
+            "section_concurrency": 4,
         },
         "output": {
             "directory": "./output",
-            "cv_filename_pattern": "cv_optimized_{timestamp}.md",
-            "feedback_filename_pattern": "cv_review_history_{timestamp}.md",
+            "cv_filename_pattern": "cv_optimized_{run_id}.md",
+            "feedback_filename_pattern": "cv_review_history_{run_id}.md",
+        },
+        "runs": {
+            "enabled": True,
+            "database": None,
+            "memoize": True,
+        },
+        "run_log": {
+            "enabled": True,
+            "directory": None,
+            "include_text": False,
+        },
+        "requirements": {
+            "enabled": False,
+            "mode": "local",
+            "llm_provider": None,
+            "llm_model": None,
+            "cache_dir": None,
+        },
+        "prompt_budget": {
+            "enabled": True,
+            "output_reserve_tokens": 4096,
+            "overhead_tokens": 1000,
+            "policy": ["supporting_docs", "job_description"],
+            "min_job_description_tokens": 300,
+            "context_windows": {},
         },
         "translation": {
             "enabled": False,
             "target_language": None,
             "llm_provider": None,
             "llm_model": None,
+            "speculative": False,
+            "memory": False,
+            "memory_database": None,
+        },
+        "rate_limits": {
+            "enabled": False,
+            "requests_per_minute": 60,
+            "tokens_per_minute": 100000,
+            "max_retries": 5,
+            "backoff_base_seconds": 1.0,
+            "backoff_max_seconds": 60.0,
+            "shared_state_dir": None,
+            "concurrency": {
+                "initial": 2,
+                "min": 1,
+                "max": 8,
+                "latency_inflation": 2.0,
+            },
+            "models": {},
+        },
+        "crews": {
+            "reviewer": {
+                "llm_provider": None,
+                "llm_model": None,
+            },
+            "writer": {
+                "llm_provider": None,
+                "llm_model": None,
+            },
+        },
+        "routing": {
+            "enabled": False,
+            "fast_llm_provider": None,
+            "fast_llm_model": None,
+            "fast_crews": ["reviewer"],
+            "max_fast_prompt_chars": None,
+            "fast_max_iteration": None,
+            "final_iteration_strong": True,
+        },
+        "hedging": {
+            "enabled": False,
+            "percentile": 95,
+            "initial_delay_seconds": 90.0,
+            "min_delay_seconds": 10.0,
+            "max_delay_seconds": 180.0,
+            "min_samples": 5,
+            "fallback_provider": None,
+            "fallback_model": None,
+            "failure_threshold": 3,
+            "reset_timeout_seconds": 60.0,
+        },
+        "metrics": {
+            "textfile": None,
+            "port": None,
+        },
+        "timeouts": {
+            "llm_call_seconds": None,
+            "scraper_seconds": 30.0,
+            "run_deadline_seconds": None,
+        },
+        "dry_run": {
+            "typical_iterations": 2,
+            "review_output_tokens": 700,
+            "prices": {},
+            "latencies": {},
+        },
+        "cassette": {
+            "record": False,
+            "directory": None,
+            "replay_latency": "original",
+        },
+        "ranking": {
+            "method": "tfidf",
+            "top_k": 10,
+            "fetch_concurrency": 8,
+            "embedding_model": "all-MiniLM-L6-v2",
+        },
+        "ollama": {
+            "keep_alive": "30m",
+            "warm_up": True,
+            "num_parallel": None,
+            "probe_timeout_seconds": 5.0,
         },
     }
 
@@ -97,6 +216,12 @@ class Config:
             config["llm"]["model"] = os.getenv("LLM_MODEL")
         if os.getenv("LLM_TEMPERATURE"):
             config["llm"]["temperature"] = float(os.getenv("LLM_TEMPERATURE"))
+        if os.getenv("LLM_BASE_URL"):
+            config["llm"]["base_url"] = os.getenv("LLM_BASE_URL")
+        if os.getenv("LLM_PROMPT_CACHING"):
+            config["llm"]["prompt_caching"] = os.getenv(
+                "LLM_PROMPT_CACHING", ""
+            ).lower() in ("1", "true", "yes")
 
         # Optimizer configuration
         if os.getenv("MAX_ITERATIONS"):
@@ -106,11 +231,45 @@ class Config:
         if os.getenv("OUTPUT_DIRECTORY"):
             config["output"]["directory"] = os.getenv("OUTPUT_DIRECTORY")
 
+        # Run store configuration
+        if os.getenv("RUNS_DATABASE"):
+            config["runs"]["database"] = os.getenv("RUNS_DATABASE")
+        if os.getenv("RUN_LOG_DIRECTORY"):
+            config["run_log"]["directory"] = os.getenv("RUN_LOG_DIRECTORY")
+
         # Ollama base URL
         if os.getenv("OLLAMA_BASE_URL"):
             if "ollama" not in config["llm"]:
                 config["llm"]["ollama"] = {}
             config["llm"]["ollama_base_url"] = os.getenv("OLLAMA_BASE_URL")
+        if os.getenv("OLLAMA_KEEP_ALIVE"):
+            keep_alive = os.getenv("OLLAMA_KEEP_ALIVE", "")
+            # Ollama reads bare numbers as seconds but rejects them as strings
+            config["ollama"]["keep_alive"] = (
+                int(keep_alive) if keep_alive.lstrip("-").isdigit() else keep_alive
+            )
+        if os.getenv("OLLAMA_NUM_PARALLEL"):
+            config["ollama"]["num_parallel"] = int(os.getenv("OLLAMA_NUM_PARALLEL"))
+
+        # Per-crew LLM configuration
+        for crew in ("reviewer", "writer"):
+            prefix = crew.upper()
+            if os.getenv(f"{prefix}_LLM_PROVIDER"):
+                config["crews"][crew]["llm_provider"] = os.getenv(
+                    f"{prefix}_LLM_PROVIDER"
+                )
+            if os.getenv(f"{prefix}_LLM_MODEL"):
+                config["crews"][crew]["llm_model"] = os.getenv(f"{prefix}_LLM_MODEL")
+
+        # Rate limiting configuration
+        if os.getenv("RATE_LIMITS_ENABLED"):
+            config["rate_limits"]["enabled"] = os.getenv(
+                "RATE_LIMITS_ENABLED", ""
+            ).lower() in ("1", "true", "yes")
+        if os.getenv("RATE_LIMITS_STATE_DIR"):
+            config["rate_limits"]["shared_state_dir"] = os.getenv(
+                "RATE_LIMITS_STATE_DIR"
+            )
 
         # Translation configuration
         if os.getenv("TRANSLATE_TO"):
@@ -196,11 +355,31 @@ class Config:
         """Get LLM temperature."""
         return self.get("llm.temperature", 0.7)
 
+    @property
+    def llm_base_url(self) -> str | None:
+        """Get the API endpoint override for the main LLM provider."""
+        return self.get("llm.base_url")
+
+    @property
+    def llm_client_pool(self) -> bool:
+        """Get whether LLM clients and their connections are shared."""
+        return self.get("llm.client_pool", True)
+
+    @property
+    def llm_prompt_caching(self) -> bool:
+        """Get whether provider-side prompt caching is requested."""
+        return self.get("llm.prompt_caching", True)
+
     @property
     def max_iterations(self) -> int:
         """Get max iterations."""
         return self.get("optimizer.max_iterations", 3)
 
+    @property
+    def optimizer_candidates(self) -> int:
+        """Get number of writer candidates per revision."""
+        return self.get("optimizer.candidates", 1) or 1
+
     @property
     def output_directory(self) -> str:
         """Get output directory."""
@@ -209,15 +388,71 @@ class Config:
     @property
     def cv_filename_pattern(self) -> str:
         """Get CV filename pattern."""
-        return self.get("output.cv_filename_pattern", "cv_optimized_{timestamp}.md")
+        return self.get("output.cv_filename_pattern", "cv_optimized_{run_id}.md")
 
     @property
     def feedback_filename_pattern(self) -> str:
         """Get feedback filename pattern."""
         return self.get(
-            "output.feedback_filename_pattern", "cv_review_history_{timestamp}.md"
+            "output.feedback_filename_pattern", "cv_review_history_{run_id}.md"
         )
 
+    @property
+    def runs_enabled(self) -> bool:
+        """Get whether runs are recorded in the run store."""
+        return self.get("runs.enabled", True)
+
+    @property
+    def runs_memoize(self) -> bool:
+        """Get whether identical completed runs are reused."""
+        return self.get("runs.memoize", True)
+
+    @property
+    def runs_database(self) -> str:
+        """Get run store database path (defaults to the output directory)."""
+        database = self.get("runs.database", None)
+        if database:
+            return database
+        return str(Path(self.output_directory) / "runs.db")
+
+    @property
+    def run_log_enabled(self) -> bool:
+        """Get whether the per-run event log is written."""
+        return self.get("run_log.enabled", True)
+
+    @property
+    def run_log_directory(self) -> str:
+        """Get event log directory (defaults to the output directory)."""
+        return self.get("run_log.directory", None) or self.output_directory
+
+    @property
+    def cassette_directory(self) -> str:
+        """Get cassette directory (defaults to the output directory)."""
+        return self.get("cassette.directory", None) or self.output_directory
+
+    @property
+    def requirements_enabled(self) -> bool:
+        """Get whether crews receive an extracted requirement profile."""
+        return self.get("requirements.enabled", False)
+
+    @property
+    def requirements_mode(self) -> str:
+        """Get requirement extraction mode (local or llm)."""
+        return self.get("requirements.mode", "local")
+
+    @property
+    def requirements_cache_dir(self) -> str:
+        """Get requirement profile cache directory."""
+        cache_dir = self.get("requirements.cache_dir", None)
+        if cache_dir:
+            return cache_dir
+        return str(Path(self.output_directory) / ".cache" / "requirements")
+
+    @property
+    def prompt_budget_enabled(self) -> bool:
+        """Get whether prompts are fitted into model context windows."""
+        return self.get("prompt_budget.enabled", True)
+
     @property
     def translation_enabled(self) -> bool:
         """Get translation enabled status."""
@@ -238,6 +473,94 @@ class Config:
         """Get translation LLM model (None means use main LLM)."""
         return self.get("translation.llm_model", None)
 
+    @property
+    def rate_limits_enabled(self) -> bool:
+        """Get rate limiting enabled status."""
+        return self.get("rate_limits.enabled", False)
+
+    @property
+    def translation_memory_enabled(self) -> bool:
+        """Get whether translated segments are reused."""
+        return self.get("translation.memory", False)
+
+    @property
+    def translation_memory_database(self) -> str:
+        """Get translation memory database path (defaults to the output directory)."""
+        database = self.get("translation.memory_database", None)
+        if database:
+            return database
+        return str(Path(self.output_directory) / "translation_memory.db")
+
+    @property
+    def translation_speculative(self) -> bool:
+        """Get speculative translation status (translate during review)."""
+        return self.get("translation.speculative", False)
+
+    @property
+    def reviewer_llm_provider(self) -> str | None:
+        """Get reviewer LLM provider (None means use main LLM)."""
+        return self.get("crews.reviewer.llm_provider", None)
+
+    @property
+    def reviewer_llm_model(self) -> str | None:
+        """Get reviewer LLM model (None means use main LLM)."""
+        return self.get("crews.reviewer.llm_model", None)
+
+    @property
+    def writer_llm_provider(self) -> str | None:
+        """Get writer LLM provider (None means use main LLM)."""
+        return self.get("crews.writer.llm_provider", None)
+
+    @property
+    def writer_llm_model(self) -> str | None:
+        """Get writer LLM model (None means use main LLM)."""
+        return self.get("crews.writer.llm_model", None)
+
+    @property
+    def routing_enabled(self) -> bool:
+        """Get model routing enabled status."""
+        return self.get("routing.enabled", False)
+
+    @property
+    def routing_fast_llm_provider(self) -> str | None:
+        """Get fast LLM provider for routing (None means use main provider)."""
+        return self.get("routing.fast_llm_provider", None)
+
+    @property
+    def routing_fast_llm_model(self) -> str | None:
+        """Get fast LLM model for routing."""
+        return self.get("routing.fast_llm_model", None)
+
+    @property
+    def hedging_enabled(self) -> bool:
+        """Get hedging enabled status."""
+        return self.get("hedging.enabled", False)
+
+    @property
+    def hedging_fallback_provider(self) -> str | None:
+        """Get fallback LLM provider for hedges/failover (None means same LLM)."""
+        return self.get("hedging.fallback_provider", None)
+
+    @property
+    def hedging_fallback_model(self) -> str | None:
+        """Get fallback LLM model for hedges/failover."""
+        return self.get("hedging.fallback_model", None)
+
+    @property
+    def ollama_keep_alive(self) -> str | int:
+        """Get how long Ollama keeps a model loaded after a call."""
+        return self.get("ollama.keep_alive", "30m")
+
+    @property
+    def ollama_warm_up(self) -> bool:
+        """Get whether Ollama models are preloaded at the start of a run."""
+        return self.get("ollama.warm_up", True)
+
+    @property
+    def ollama_num_parallel(self) -> int | None:
+        """Get the Ollama server's parallel slots (None means unknown)."""
+        return self.get("ollama.num_parallel", None)
+
     def to_dict(self) -> dict[str, Any]:
         """Return configuration as dictionary."""
         return self.config.copy()
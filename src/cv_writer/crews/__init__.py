@@ -1,6 +1,15 @@
 """Crews for CV Optimizer."""
 
+from cv_writer.crews.requirements_crew import RequirementsCrew
 from cv_writer.crews.reviewer_crew import ReviewerCrew
+from cv_writer.crews.section_reviewer_crew import SectionReviewerCrew
+from cv_writer.crews.section_writer_crew import SectionWriterCrew
 from cv_writer.crews.writer_crew import WriterCrew
 
-__all__ = ["ReviewerCrew", "WriterCrew"]
+__all__ = [
+    "RequirementsCrew",
+    "ReviewerCrew",
+    "SectionReviewerCrew",
+    "SectionWriterCrew",
+    "WriterCrew",
+]
@@ -0,0 +1,5 @@
+"""Requirements crew for job description analysis."""
+
+from cv_writer.crews.requirements_crew.requirements_crew import RequirementsCrew
+
+__all__ = ["RequirementsCrew"]
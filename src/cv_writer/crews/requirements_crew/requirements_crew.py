@@ -0,0 +1,47 @@
+"""Requirements crew for extracting job requirement profiles."""
+
+from typing import Any
+
+from crewai import Agent, Crew, Process, Task
+from crewai.project import CrewBase, agent, crew, task
+
+
+@CrewBase
+class RequirementsCrew:
+    """Crew for extracting a compact requirement profile from a job description."""
+
+    agents_config = "config/agents.yaml"
+    tasks_config = "config/tasks.yaml"
+
+    def __init__(self, llm: Any):
+        """
+        Initialize Requirements crew.
+
+        Args:
+            llm: Language model instance (a fast, cheap model is sufficient)
+        """
+        self.llm = llm
+
+    @agent
+    def requirements_analyst(self) -> Agent:
+        return Agent(
+            config=self.agents_config["requirements_analyst"],
+            llm=self.llm,
+        )
+
+    @task
+    def extract_requirements(self) -> Task:
+        return Task(
+            config=self.tasks_config["extract_requirements"],
+            agent=self.requirements_analyst(),
+        )
+
+    @crew
+    def crew(self) -> Crew:
+        """Creates the Requirements Crew"""
+        return Crew(
+            agents=self.agents,  # Automatically created by the @agent decorator
+            tasks=self.tasks,  # Automatically created by the @task decorator
+            process=Process.sequential,
+            verbose=False,
+        )
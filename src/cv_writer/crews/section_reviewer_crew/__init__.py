@@ -0,0 +1,7 @@
+"""Section reviewer crew for long CVs."""
+
+from cv_writer.crews.section_reviewer_crew.section_reviewer_crew import (
+    SectionReviewerCrew,
+)
+
+__all__ = ["SectionReviewerCrew"]
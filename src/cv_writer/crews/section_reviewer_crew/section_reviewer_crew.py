@@ -0,0 +1,47 @@
+"""Section reviewer crew for reviewing one CV section at a time."""
+
+from typing import Any
+
+from crewai import Agent, Crew, Process, Task
+from crewai.project import CrewBase, agent, crew, task
+
+
+@CrewBase
+class SectionReviewerCrew:
+    """Crew for reviewing a single CV section against the job description."""
+
+    agents_config = "config/agents.yaml"
+    tasks_config = "config/tasks.yaml"
+
+    def __init__(self, llm: Any):
+        """
+        Initialize section reviewer crew.
+
+        Args:
+            llm: Language model instance
+        """
+        self.llm = llm
+
+    @agent
+    def cv_section_reviewer(self) -> Agent:
+        return Agent(
+            config=self.agents_config["cv_section_reviewer"],
+            llm=self.llm,
+        )
+
+    @task
+    def review_section(self) -> Task:
+        return Task(
+            config=self.tasks_config["review_section"],
+            agent=self.cv_section_reviewer(),
+        )
+
+    @crew
+    def crew(self) -> Crew:
+        """Creates the Section Reviewer Crew"""
+        return Crew(
+            agents=self.agents,  # Automatically created by the @agent decorator
+            tasks=self.tasks,  # Automatically created by the @task decorator
+            process=Process.sequential,
+            verbose=False,
+        )
@@ -0,0 +1,5 @@
+"""Section writer crew for targeted CV revisions."""
+
+from cv_writer.crews.section_writer_crew.section_writer_crew import SectionWriterCrew
+
+__all__ = ["SectionWriterCrew"]
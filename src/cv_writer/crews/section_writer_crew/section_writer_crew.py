@@ -0,0 +1,47 @@
+"""Section writer crew for rewriting one CV section at a time."""
+
+from typing import Any
+
+from crewai import Agent, Crew, Process, Task
+from crewai.project import CrewBase, agent, crew, task
+
+
+@CrewBase
+class SectionWriterCrew:
+    """Crew for rewriting a single CV section based on reviewer feedback."""
+
+    agents_config = "config/agents.yaml"
+    tasks_config = "config/tasks.yaml"
+
+    def __init__(self, llm: Any):
+        """
+        Initialize section writer crew.
+
+        Args:
+            llm: Language model instance
+        """
+        self.llm = llm
+
+    @agent
+    def cv_section_writer(self) -> Agent:
+        return Agent(
+            config=self.agents_config["cv_section_writer"],
+            llm=self.llm,
+        )
+
+    @task
+    def write_section(self) -> Task:
+        return Task(
+            config=self.tasks_config["write_section"],
+            agent=self.cv_section_writer(),
+        )
+
+    @crew
+    def crew(self) -> Crew:
+        """Creates the Section Writer Crew"""
+        return Crew(
+            agents=self.agents,  # Automatically created by the @agent decorator
+            tasks=self.tasks,  # Automatically created by the @task decorator
+            process=Process.sequential,
+            verbose=False,
+        )
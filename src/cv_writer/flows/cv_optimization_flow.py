@@ -1,31 +1,170 @@
 """CV Optimization Flow using CrewAI Flow."""
 
 import re
+import sys
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Literal
 
 from crewai.flow import Flow, listen, or_, router, start
 
+from cv_writer.crews.requirements_crew import RequirementsCrew
 from cv_writer.crews.reviewer_crew import ReviewerCrew
+from cv_writer.crews.section_reviewer_crew import SectionReviewerCrew
+from cv_writer.crews.section_writer_crew import SectionWriterCrew
 from cv_writer.crews.translator_crew import TranslatorCrew
 from cv_writer.crews.writer_crew import WriterCrew
 from cv_writer.models.state_models import CVOptimizerState, ReviewFeedback
+from cv_writer.tools.cv_sections import (
+    diff_segments,
+    mark_segments,
+    parse_marked,
+    section_keys,
+    split_sections,
+    split_segments,
+)
+from cv_writer.tools.keyword_scorer import KeywordCoverageScorer
+from cv_writer.tools.requirement_extractor import RequirementExtractor
+from cv_writer.tools.section_review import (
+    is_approved,
+    map_feedback_to_sections,
+    reduce_section_reviews,
+    unmapped_action_items,
+)
+from cv_writer.utils.cassette import Cassette
+from cv_writer.utils.deadline import Deadline, call_with_timeout
+from cv_writer.utils.hedging import HedgingPolicy
+from cv_writer.utils.llm_factory import LLMFactory
+from cv_writer.utils.llm_router import LLMRouter
+from cv_writer.utils.metrics import (
+    CACHE_LOOKUPS,
+    LLM_CALL_SECONDS,
+    LLM_CALLS,
+    LLM_TOKENS,
+    PHASE_SECONDS,
+    RUN_ITERATIONS,
+    RUNS,
+)
+from cv_writer.utils.profiler import PhaseProfiler
+from cv_writer.utils.prompt_budget import PromptBudget, count_tokens
+from cv_writer.utils.rate_limiter import RateLimiter, estimate_tokens
+from cv_writer.utils.run_log import RunLog
+from cv_writer.utils.translation_memory import TranslationMemory
 
 
 class CVOptimizationFlow(Flow[CVOptimizerState]):
     """Flow for iterative CV optimization."""
 
-    def __init__(self, llm: Any, translation_llm: Any | None = None):
+    def __init__(
+        self,
+        llm: Any,
+        translation_llm: Any | None = None,
+        rate_limiter: RateLimiter | None = None,
+        hedging: HedgingPolicy | None = None,
+        fallback_llm: Any | None = None,
+        reviewer_llm: Any | None = None,
+        writer_llm: Any | None = None,
+        router: LLMRouter | None = None,
+        speculative_translation: bool = False,
+        candidate_llms: list[Any] | None = None,
+        candidate_scoring: str = "local",
+        run_log: RunLog | None = None,
+        profiler: PhaseProfiler | None = None,
+        prompt_budget: PromptBudget | None = None,
+        requirement_extractor: RequirementExtractor | None = None,
+        requirements_llm: Any | None = None,
+        keyword_gate: bool = False,
+        min_keyword_coverage: float = 0.0,
+        translation_memory: TranslationMemory | None = None,
+        review_mode: str = "full",
+        write_mode: str = "full",
+        section_concurrency: int = 4,
+        call_timeout: float | None = None,
+        deadline: Deadline | None = None,
+        cassette: Cassette | None = None,
+    ):
         """
         Initialize CV Optimization Flow.
 
         Args:
             llm: Language model instance for optimization
             translation_llm: Optional separate LLM for translation (uses main LLM if None)
+            rate_limiter: Optional shared rate limiter applied to all crew calls
+            hedging: Optional hedging policy for slow or failing crew calls
+            fallback_llm: Optional secondary LLM used for hedges and failover
+            reviewer_llm: Optional separate LLM for reviews (uses main LLM if None)
+            writer_llm: Optional separate LLM for writing (uses main LLM if None)
+            router: Optional routing policy sending cheap calls to a fast LLM
+            speculative_translation: Translate each new CV version in the
+                background while it is being reviewed
+            candidate_llms: Optional writer LLMs (e.g. varied temperature) used
+                to generate competing candidates in each revision
+            candidate_scoring: How candidates are ranked ("local" keyword
+                coverage or "reviewer" pass)
+            run_log: Optional event log receiving one record per flow step
+            profiler: Optional CPU/memory profiler wrapped around each phase
+            prompt_budget: Optional budget that fits inputs into each model's
+                context window
+            requirement_extractor: Optional extractor whose requirement
+                profile replaces the full job description in crew prompts
+            requirements_llm: Optional (cheap) LLM for requirement extraction;
+                local heuristics are used if None
+            keyword_gate: Skip the LLM review of a revision whose keyword
+                coverage dropped and send it straight back to the writer
+            min_keyword_coverage: Keyword coverage (0-1) an approved CV must
+                reach before the flow finalizes
+            translation_memory: Optional memory of translated segments; only
+                new or changed segments are sent to the translator
+            review_mode: "full" reviews the whole CV in one call; "sections"
+                reviews its sections concurrently and combines the verdicts
+            write_mode: "full" rewrites the whole CV in one call; "sections"
+                rewrites only the sections the feedback concerns, concurrently
+            section_concurrency: Maximum concurrent section calls
+            call_timeout: Seconds after which a single crew call is abandoned
+                and fails with TimeoutError (no limit if None)
+            deadline: Optional wall-clock budget of the run; when another
+                review/revise cycle no longer fits, the flow finalizes early
+            cassette: Optional cassette recording every crew call, or
+                replaying recorded calls instead of calling the LLMs
         """
         super().__init__()
         self.llm = llm
         self.translation_llm = translation_llm or llm
+        self.rate_limiter = rate_limiter
+        self.hedging = hedging
+        self.fallback_llm = fallback_llm
+        self.reviewer_llm = reviewer_llm or llm
+        self.writer_llm = writer_llm or llm
+        self.router = router
+        self.speculative_translation = speculative_translation
+        self._speculative: tuple[str, Future] | None = None
+        self._speculative_executor: ThreadPoolExecutor | None = None
+        self.candidate_llms = candidate_llms or []
+        self.candidate_scoring = candidate_scoring
+        self._review_cache: dict[str, str] = {}
+        self.run_log = run_log
+        self.profiler = profiler
+        self.prompt_budget = prompt_budget
+        self._template_tokens: dict[type, int] = {}
+        self._budget_lock = threading.Lock()
+        self.requirement_extractor = requirement_extractor
+        self.requirements_llm = requirements_llm
+        self.keyword_gate = keyword_gate
+        self.min_keyword_coverage = min_keyword_coverage
+        self._keyword_scorer: KeywordCoverageScorer | None = None
+        self._last_reviewed_cv: str | None = None
+        self.translation_memory = translation_memory
+        self.review_mode = review_mode
+        self.write_mode = write_mode
+        self.section_concurrency = max(1, section_concurrency)
+        self.call_timeout = call_timeout
+        self.deadline = deadline
+        self._deadline_reached = False
+        self.cassette = cassette
 
     @start()
     def initialize_flow(self):
@@ -41,6 +180,20 @@ class CVOptimizationFlow(Flow[CVOptimizerState]):
         # Initialize current_cv with the draft
         self.state.current_cv = self.state.cv_draft
         self.state.status = "REVIEWING"
+        if self.state.previous_cv:
+            self._continue_previous_run()
+
+        if self.requirement_extractor is not None:
+            self._extract_requirements()
+        self._log_event(
+            "start",
+            job_description_chars=len(self.state.job_description),
+            cv_chars=len(self.state.cv_draft),
+            supporting_docs=len(self.state.supporting_docs),
+            max_iterations=self.state.max_iterations,
+        )
+
+        self._start_speculative_translation()
 
     @listen("decision_to_revise")
     def revise_cv(self):
@@ -48,6 +201,7 @@ class CVOptimizationFlow(Flow[CVOptimizerState]):
         print(f"\n{'=' * 80}")
         print(f"ITERATION {self.state.iteration_count} - WRITING PHASE")
         print(f"{'=' * 80}\n")
+        started = self._start_phase("write")
 
         # Get latest feedback
         latest_feedback = self.state.feedback_history[-1].comments
@@ -56,24 +210,21 @@ class CVOptimizationFlow(Flow[CVOptimizerState]):
         supporting_docs_text = self._format_supporting_docs()
 
         # Run writer crew
-        result = (
-            WriterCrew(self.llm)
-            .crew()
-            .kickoff(
-                inputs={
-                    "job_description": self.state.job_description,
-                    "current_cv": self.state.current_cv,
-                    "cv_draft": self.state.cv_draft,
-                    "supporting_docs": supporting_docs_text,
-                    "latest_feedback": latest_feedback,
-                }
-            )
-        )
-
-        revised_cv = result.raw if hasattr(result, "raw") else str(result)
-
-        # Clean up the CV (remove any markdown code blocks if present)
-        revised_cv = self._clean_cv_output(revised_cv)
+        inputs = {
+            "job_description": self._job_input(),
+            "current_cv": self.state.current_cv,
+            "cv_draft": self.state.cv_draft,
+            "supporting_docs": supporting_docs_text,
+            "draft_changes": self._draft_changes_input(),
+            "latest_feedback": latest_feedback,
+        }
+        try:
+            revised_cv = self._write_revision(inputs)
+        except TimeoutError as e:
+            self._stop_at_deadline(e)
+            print("   Keeping the current CV version\n")
+            self._record_timing("write", started)
+            return
 
         # Update state
         self.state.current_cv = revised_cv
@@ -81,12 +232,24 @@ class CVOptimizationFlow(Flow[CVOptimizerState]):
         print(f"\nRevised CV length: {len(revised_cv)} characters")
         print(f"Completed iteration {self.state.iteration_count}\n")
 
+        self._start_speculative_translation()
+        self._log_event(
+            "revision",
+            text={"cv": revised_cv},
+            iteration=self.state.iteration_count,
+            seconds=self._record_timing("write", started),
+            cv_chars=len(revised_cv),
+            candidates=max(1, len(self.candidate_llms)),
+        )
+
         # Loop back to review
         self.state.status = "REVIEWING"
 
     @listen(or_(initialize_flow, revise_cv))
     def review_cv(self):
         """Review the current CV version."""
+        if self._deadline_reached:
+            return
 
         # Increment iteration count
         self.state.iteration_count += 1
@@ -94,31 +257,37 @@ class CVOptimizationFlow(Flow[CVOptimizerState]):
         print(f"\n{'=' * 80}")
         print(f"ITERATION {self.state.iteration_count} - REVIEW PHASE")
         print(f"{'=' * 80}\n")
+        started = self._start_phase("review")
 
-        # Prepare supporting docs text
-        supporting_docs_text = self._format_supporting_docs()
+        # Reuse the review made while scoring candidates, if any
+        review_output = self._review_cache.pop(self.state.current_cv, None)
+        self._review_cache.clear()
+        reused_review = review_output is not None
+        if len(self.candidate_llms) > 1:
+            CACHE_LOOKUPS.inc(cache="review", result="hit" if reused_review else "miss")
+        coverage = self._scorer().score(self.state.current_cv)
+        print(f"Keyword coverage: {coverage:.0%}")
+        if review_output is None:
+            review_output = self._keyword_gate_review(coverage)
+        gated = review_output is not None and not reused_review
 
-        # Run reviewer crew
-        result = (
-            ReviewerCrew(self.llm)
-            .crew()
-            .kickoff(
-                inputs={
-                    "job_description": self.state.job_description,
-                    "current_cv": self.state.current_cv,
-                    "cv_draft": self.state.cv_draft,
-                    "supporting_docs": supporting_docs_text,
-                    "iteration_count": self.state.iteration_count,
-                    "max_iterations": self.state.max_iterations,
-                }
-            )
-        )
-
-        review_output = result.raw if hasattr(result, "raw") else str(result)
+        if review_output is None:
+            # Run reviewer crew
+            try:
+                review_output = self._run_review(
+                    self.state.current_cv, self.state.iteration_count
+                )
+            except TimeoutError as e:
+                self._stop_at_deadline(e)
+                self._keep_best_unreviewed(coverage)
+                self.state.iteration_count -= 1
+                self._record_timing("review", started)
+                return
+        elif reused_review:
+            print("Using review from candidate scoring...")
 
         # Parse the review to check if approved
-        review_upper = review_output.upper()
-        if "DECISION: APPROVED" in review_upper or "DECISION:APPROVED" in review_upper:
+        if self._is_approved(review_output):
             decision = "APPROVED"
             comments = review_output
             print("✅ Draft APPROVED by reviewer!")
@@ -134,8 +303,10 @@ class CVOptimizationFlow(Flow[CVOptimizerState]):
             iteration=self.state.iteration_count,
             decision=decision,
             comments=comments,
+            keyword_coverage=coverage,
             timestamp=datetime.now(),
         )
+        self._last_reviewed_cv = self.state.current_cv
 
         # Add to history
         self.state.feedback_history.append(feedback)
@@ -145,6 +316,18 @@ class CVOptimizationFlow(Flow[CVOptimizerState]):
 
         # Store decision for routing
         self.state.final_decision = decision
+        self._log_event(
+            "review",
+            text={"review": review_output},
+            iteration=self.state.iteration_count,
+            decision=decision,
+            seconds=self._record_timing("review", started),
+            cv_chars=len(self.state.current_cv),
+            feedback_chars=len(review_output),
+            reused=reused_review,
+            keyword_coverage=round(coverage, 4),
+            gated=gated,
+        )
 
     @router(review_cv)
     def route_decision(self) -> Literal["decision_to_finalize", "decision_to_revise"]:
@@ -155,6 +338,8 @@ class CVOptimizationFlow(Flow[CVOptimizerState]):
             Next method to execute
         """
         decision = self.state.final_decision
+        if decision == "APPROVED" and not self._meets_keyword_coverage():
+            decision = "REVISE"
 
         # Check if approved
         if decision == "APPROVED":
@@ -172,6 +357,17 @@ class CVOptimizationFlow(Flow[CVOptimizerState]):
             self.state.status = "MAX_ITERATIONS_REACHED"
             return "decision_to_finalize"
 
+        # Stop early if another review/revise cycle would miss the deadline
+        if not self._cycle_fits_deadline():
+            print(f"\n{'=' * 80}")
+            print("DEADLINE REACHED - Finalizing the best CV so far")
+            print(f"{'=' * 80}\n")
+            self.state.status = "DEADLINE_REACHED"
+            return "decision_to_finalize"
+
+        # The reviewed version will be rewritten, so its translation is stale
+        self._speculative = None
+
         # Continue to revision
         print("\nContinuing to revision phase...")
         self.state.status = "REVISING"
@@ -208,26 +404,45 @@ class CVOptimizationFlow(Flow[CVOptimizerState]):
         print(f"\n{'=' * 80}")
         print(f"TRANSLATION PHASE - Translating to {self.state.translate_to.upper()}")
         print(f"{'=' * 80}\n")
+        started = self._start_phase("translate")
 
-        # Run translator crew with appropriate LLM
-        result = (
-            TranslatorCrew(self.translation_llm)
-            .crew()
-            .kickoff(
-                inputs={
-                    "cv_content": self.state.current_cv,
-                    "target_language": self.state.translate_to,
-                }
+        translated_cv = None
+        speculative = False
+        if self._speculative and self._speculative[0] == self.state.current_cv:
+            print("Using speculative translation started during review...")
+            try:
+                translated_cv = self._speculative[1].result()
+                speculative = True
+            except Exception as e:
+                print(f"⚠️  Speculative translation failed: {str(e)}")
+                print("   Translating again\n")
+        self._speculative = None
+        if self.speculative_translation:
+            CACHE_LOOKUPS.inc(
+                cache="speculative_translation", result="hit" if speculative else "miss"
             )
-        )
 
-        translated_cv = result.raw if hasattr(result, "raw") else str(result)
-
-        # Clean up the translated CV
-        translated_cv = self._clean_cv_output(translated_cv)
+        if translated_cv is None:
+            try:
+                translated_cv = self._translate(
+                    self.state.current_cv, self.state.translate_to
+                )
+            except TimeoutError as e:
+                self._stop_at_deadline(e)
+                print("   Skipping translation\n")
+                self._record_timing("translate", started)
+                return
 
         # Update state
         self.state.translated_cv = translated_cv
+        self._log_event(
+            "translation",
+            text={"translated_cv": translated_cv},
+            language=self.state.translate_to,
+            seconds=self._record_timing("translate", started),
+            chars=len(translated_cv),
+            speculative=speculative,
+        )
 
         print(f"\nTranslated CV length: {len(translated_cv)} characters")
         print(f"Translation to {self.state.translate_to.upper()} complete\n")
@@ -239,6 +454,861 @@ class CVOptimizationFlow(Flow[CVOptimizerState]):
         print("FLOW FINALIZED")
         print(f"{'=' * 80}\n")
 
+        if self._speculative_executor is not None:
+            self._speculative_executor.shutdown(wait=False, cancel_futures=True)
+            self._speculative_executor = None
+
+        RUNS.inc(status=self.state.status)
+        RUN_ITERATIONS.observe(self.state.iteration_count)
+        self._log_event(
+            "finish",
+            status=self.state.status,
+            iterations=self.state.iteration_count,
+            timings=self.state.timings,
+        )
+
+    def _extract_requirements(self) -> None:
+        """Extract (or load) the requirement profile of the job description."""
+        job_description = self.state.job_description
+        llm_extract = None
+        model = ""
+        if self.requirements_llm is not None:
+            model = "/".join(LLMFactory.describe_llm(self.requirements_llm))
+
+            def llm_extract(text: str) -> str:
+                return self._kickoff_crew(
+                    RequirementsCrew, self.requirements_llm, {"job_description": text}
+                )
+
+        try:
+            profile, cached = self.requirement_extractor.extract(
+                job_description, llm_extract, model
+            )
+        except Exception as e:
+            print(f"⚠️  Requirement extraction failed: {str(e)}")
+            print("   Using local extraction instead\n")
+            profile, cached = self.requirement_extractor.extract(job_description)
+
+        self.state.requirements = profile
+        CACHE_LOOKUPS.inc(cache="requirements", result="hit" if cached else "miss")
+        profile_chars = len(profile.to_markdown())
+        source = "loaded from cache" if cached else "extracted"
+        print(
+            f"✅ Requirement profile {source}: {len(profile.must_have)} must-haves, "
+            f"{len(profile.nice_to_have)} nice-to-haves "
+            f"({profile_chars} instead of {len(job_description)} characters)\n"
+        )
+        self._log_event(
+            "requirements",
+            cached=cached,
+            llm=llm_extract is not None,
+            job_description_chars=len(job_description),
+            profile_chars=profile_chars,
+        )
+
+    def _scorer(self) -> KeywordCoverageScorer:
+        """Get the keyword scorer of the job description (built once)."""
+        if self._keyword_scorer is None:
+            self._keyword_scorer = KeywordCoverageScorer(self.state.job_description)
+        return self._keyword_scorer
+
+    def _keyword_gate_review(self, coverage: float) -> str | None:
+        """
+        Reject a revision locally if its keyword coverage regressed.
+
+        The final iteration is always reviewed by the LLM.
+
+        Args:
+            coverage: Keyword coverage of the current CV
+
+        Returns:
+            Review asking to restore the lost keywords, or None if the CV
+            needs an LLM review
+        """
+        history = self.state.feedback_history
+        if (
+            not self.keyword_gate
+            or self._last_reviewed_cv is None
+            or not history
+            or history[-1].keyword_coverage is None
+            or coverage >= history[-1].keyword_coverage
+            or self.state.iteration_count >= self.state.max_iterations
+        ):
+            return None
+
+        scorer = self._scorer()
+        previously_missing = set(scorer.missing_keywords(self._last_reviewed_cv))
+        lost = [
+            keyword
+            for keyword in scorer.missing_keywords(self.state.current_cv)
+            if keyword not in previously_missing
+        ]
+        print(
+            f"⚠️  Keyword coverage dropped from {history[-1].keyword_coverage:.0%} "
+            f"to {coverage:.0%}. Skipping LLM review."
+        )
+        return (
+            "DECISION: REVISE\n\n"
+            f"The revision lowered job keyword coverage from "
+            f"{history[-1].keyword_coverage:.0%} to {coverage:.0%}. Keep the "
+            "improvements, but restore these job keywords that the previous "
+            f"version covered: {', '.join(lost)}.\n\n"
+            f"Previous feedback:\n{history[-1].comments}"
+        )
+
+    def _meets_keyword_coverage(self) -> bool:
+        """
+        Check an approved CV against the minimum keyword coverage.
+
+        If the coverage is too low and iterations remain, the approval is
+        turned into a revision request listing the missing keywords.
+
+        Returns:
+            True if the approval stands
+        """
+        feedback = self.state.feedback_history[-1]
+        if (
+            not self.min_keyword_coverage
+            or feedback.keyword_coverage is None
+            or feedback.keyword_coverage >= self.min_keyword_coverage
+            or self.state.iteration_count >= self.state.max_iterations
+        ):
+            return True
+
+        missing = self._scorer().missing_keywords(self.state.current_cv)
+        print(
+            f"⚠️  Approved, but keyword coverage {feedback.keyword_coverage:.0%} is "
+            f"below the required {self.min_keyword_coverage:.0%}. Revising."
+        )
+        feedback.decision = "REVISE"
+        feedback.comments = (
+            f"{feedback.comments}\n\nThe CV covers {feedback.keyword_coverage:.0%} "
+            f"of the job keywords; at least {self.min_keyword_coverage:.0%} is "
+            "required. Where the candidate's experience supports it, work in "
+            f"these missing job keywords: {', '.join(missing[:20])}."
+        )
+        self.state.final_decision = "REVISE"
+        return False
+
+    def _continue_previous_run(self) -> None:
+        """
+        Start from the optimized CV of a previous run.
+
+        The new draft is compared with the previous run's draft segment by
+        segment; reviewer and writer are told which parts changed so they
+        only work on those.
+        """
+        added, removed = diff_segments(
+            self.state.previous_cv_draft, self.state.cv_draft
+        )
+        self.state.current_cv = self.state.previous_cv
+
+        lines = [
+            "The CURRENT CV version is the optimized result of a previous run. "
+            "Since then, the candidate edited the ORIGINAL CV version."
+        ]
+        if not added and not removed:
+            lines.append("No parts of the ORIGINAL CV version changed.")
+        if added:
+            lines.append("\nAdded or changed in the ORIGINAL CV version:")
+            lines += [f"<<<\n{segment}\n>>>" for segment in added]
+        if removed:
+            lines.append("\nRemoved from or replaced in the ORIGINAL CV version:")
+            lines += [f"<<<\n{segment}\n>>>" for segment in removed]
+        self.state.draft_changes = "\n".join(lines)
+
+        print(
+            f"✅ Continuing from previous run: {len(added)} added or changed, "
+            f"{len(removed)} removed segment(s) in the CV draft\n"
+        )
+        self._log_event("continue", added=len(added), removed=len(removed))
+
+    def _draft_changes_input(self) -> str:
+        """Get the draft changes text for crew prompts."""
+        return self.state.draft_changes or "None (first optimization of this CV)."
+
+    def _job_input(self) -> str:
+        """
+        Get the job text for crew prompts.
+
+        Returns:
+            Requirement profile markdown if extracted, else the job description
+        """
+        if self.state.requirements is not None:
+            return self.state.requirements.to_markdown()
+        return self.state.job_description
+
+    def _run_review(self, cv_text: str, iteration: int) -> str:
+        """
+        Review a CV version with the reviewer crew.
+
+        Args:
+            cv_text: CV content to review
+            iteration: Iteration number the review belongs to
+
+        Returns:
+            Raw review output
+        """
+        if self.review_mode == "sections":
+            sections = split_sections(cv_text)
+            if len(sections) > 1:
+                return self._run_section_review(sections, iteration)
+
+        inputs = {
+            "job_description": self._job_input(),
+            "current_cv": cv_text,
+            "cv_draft": self.state.cv_draft,
+            "supporting_docs": self._format_supporting_docs(),
+            "draft_changes": self._draft_changes_input(),
+            "iteration_count": iteration,
+            "max_iterations": self.state.max_iterations,
+        }
+        final = iteration >= self.state.max_iterations
+        llm = self._select_llm("reviewer", self.reviewer_llm, inputs, final)
+        return self._kickoff_crew(ReviewerCrew, llm, inputs)
+
+    def _run_section_review(
+        self, sections: list[tuple[str, str]], iteration: int
+    ) -> str:
+        """
+        Review CV sections concurrently and reduce them into one review.
+
+        Each section is reviewed with the job description, the outline of
+        the CV and the matching section of the original CV, so prompts stay
+        small and review latency follows the largest section.
+
+        Args:
+            sections: List of (section title, section text) pairs
+            iteration: Iteration number the review belongs to
+
+        Returns:
+            Combined review output
+        """
+        original = self._original_sections(sections)
+        outline = "\n".join(f"- {title or 'Header'}" for title, _ in sections)
+        constant_inputs = {
+            "job_description": self._job_input(),
+            "supporting_docs": self._format_supporting_docs(),
+            "draft_changes": self._draft_changes_input(),
+            "cv_outline": outline,
+        }
+        final = iteration >= self.state.max_iterations
+
+        def review(index: int) -> str:
+            title, text = sections[index]
+            inputs = {
+                **constant_inputs,
+                "original_section": original[index],
+                "section_title": title or "Header",
+                "section": text,
+            }
+            llm = self._select_llm("reviewer", self.reviewer_llm, inputs, final)
+            return self._kickoff_crew(SectionReviewerCrew, llm, inputs)
+
+        print(f"Reviewing {len(sections)} sections in parallel...")
+        workers = min(self.section_concurrency, len(sections))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            reviews = list(executor.map(review, range(len(sections))))
+
+        return reduce_section_reviews(
+            [(title, text) for (title, _), text in zip(sections, reviews, strict=True)]
+        )
+
+    def _write_revision(self, inputs: dict[str, Any]) -> str:
+        """
+        Write the next CV version with the configured writing strategy.
+
+        Args:
+            inputs: Inputs for the writer task template
+
+        Returns:
+            Revised CV
+        """
+        if len(self.candidate_llms) > 1:
+            return self._best_candidate(inputs)
+
+        # The final write is the one followed by the last review
+        final = self.state.iteration_count + 1 >= self.state.max_iterations
+        if self.write_mode == "sections":
+            revised_cv = self._write_sections(inputs, final)
+            if revised_cv is not None:
+                return revised_cv
+
+        llm = self._select_llm("writer", self.writer_llm, inputs, final)
+        revised_cv = self._kickoff_crew(WriterCrew, llm, inputs)
+
+        # Clean up the CV (remove any markdown code blocks if present)
+        return self._clean_cv_output(revised_cv)
+
+    def _stop_at_deadline(self, error: TimeoutError) -> None:
+        """
+        Handle a timed-out crew call.
+
+        Args:
+            error: Timeout raised by the call
+
+        Raises:
+            TimeoutError: If the run deadline has not passed (a single call
+                exceeded its own timeout)
+        """
+        if self.deadline is None or not self.deadline.expired():
+            raise error
+        self._deadline_reached = True
+        print(f"⚠️  {str(error)}: run deadline reached")
+        self._log_event("deadline", status=self.state.status, error=str(error))
+
+    def _keep_best_unreviewed(self, coverage: float) -> None:
+        """
+        Choose between an unreviewed revision and the last reviewed version.
+
+        The unreviewed revision is kept unless it lost job keywords.
+
+        Args:
+            coverage: Keyword coverage of the unreviewed revision
+        """
+        if self._last_reviewed_cv is None or not self.state.feedback_history:
+            return
+        reviewed_coverage = self.state.feedback_history[-1].keyword_coverage
+        if reviewed_coverage is not None and coverage < reviewed_coverage:
+            print("   Unreviewed revision lost job keywords; keeping the reviewed CV\n")
+            self.state.current_cv = self._last_reviewed_cv
+
+    def _cycle_fits_deadline(self) -> bool:
+        """
+        Check whether another revise/review cycle fits before the deadline.
+
+        The cycle is estimated from observed phase durations, plus the final
+        translation if one is requested.
+
+        Returns:
+            True if there is no deadline or the cycle is expected to fit
+        """
+        if self.deadline is None:
+            return True
+        if self._deadline_reached:
+            return False
+        phases = ["write", "review"]
+        if self.state.translate_to:
+            phases.append("translate")
+        return self.deadline.fits(*phases)
+
+    def _write_sections(self, inputs: dict[str, Any], final: bool) -> str | None:
+        """
+        Rewrite only the CV sections the reviewer feedback concerns.
+
+        Touched sections are rewritten concurrently; all other sections are
+        kept byte for byte. Action items that concern no section are given
+        to the header (first section) and to every touched section.
+
+        Args:
+            inputs: Inputs for the writer task template
+            final: Whether the revision belongs to the final iteration
+
+        Returns:
+            Reassembled CV, or None if the CV has no sections or the feedback
+            does not name any of them (the whole CV is rewritten then)
+        """
+        sections = split_sections(inputs["current_cv"])
+        if len(sections) < 2:
+            return None
+        titles = [title for title, _ in sections]
+        feedback = map_feedback_to_sections(inputs["latest_feedback"], titles)
+        if not feedback:
+            print("⚠️  Feedback names no CV section. Rewriting the whole CV.")
+            return None
+        unmapped = unmapped_action_items(inputs["latest_feedback"], titles)
+        if unmapped:
+            print(
+                f"⚠️  {len(unmapped)} action items name no CV section. "
+                "Adding them to the header and every rewritten section."
+            )
+            feedback = {
+                title: [*feedback.get(title, []), *unmapped]
+                for title in titles
+                if title in feedback or title == titles[0]
+            }
+
+        original = self._original_sections(sections)
+        constant_inputs = {
+            "job_description": inputs["job_description"],
+            "supporting_docs": inputs["supporting_docs"],
+            "draft_changes": inputs["draft_changes"],
+            "cv_outline": "\n".join(f"- {title or 'Header'}" for title, _ in sections),
+            "latest_feedback": inputs["latest_feedback"],
+        }
+
+        def write(index: int) -> str:
+            title, text = sections[index]
+            section_inputs = {
+                **constant_inputs,
+                "original_section": original[index],
+                "section_feedback": "\n".join(feedback[title]),
+                "section_title": title or "Header",
+                "section": text,
+            }
+            llm = self._select_llm("writer", self.writer_llm, section_inputs, final)
+            output = self._kickoff_crew(SectionWriterCrew, llm, section_inputs)
+            return self._splice_section(text, self._clean_cv_output(output))
+
+        touched = [i for i, (title, _) in enumerate(sections) if title in feedback]
+        print(
+            f"Rewriting {len(touched)} of {len(sections)} sections in parallel: "
+            f"{', '.join(sections[i][0] or 'Header' for i in touched)}"
+        )
+        workers = min(self.section_concurrency, len(touched))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            rewritten = dict(zip(touched, executor.map(write, touched), strict=True))
+
+        return "".join(rewritten.get(i, text) for i, (_, text) in enumerate(sections))
+
+    def _original_sections(self, sections: list[tuple[str, str]]) -> list[str]:
+        """
+        Find the section of the original CV matching each given section.
+
+        Sections are matched by title and, for repeated titles, occurrence.
+
+        Args:
+            sections: List of (section title, section text) pairs
+
+        Returns:
+            Original section text for each section; the whole original CV
+            for sections renamed or added by the writer
+        """
+        draft = split_sections(self.state.cv_draft)
+        original = dict(
+            zip(section_keys(draft), (text for _, text in draft), strict=True)
+        )
+        return [
+            original.get(key, self.state.cv_draft) for key in section_keys(sections)
+        ]
+
+    @staticmethod
+    def _splice_section(original: str, rewritten: str) -> str:
+        """
+        Fit a rewritten section into the place of the original section.
+
+        Keeps the original heading if the writer dropped it and the original
+        whitespace between this section and the next.
+
+        Args:
+            original: Original section text
+            rewritten: Cleaned writer output
+
+        Returns:
+            Section text to insert
+        """
+        rewritten = rewritten.strip()
+        if not rewritten:
+            return original
+        heading = original.lstrip().splitlines()[0]
+        if heading.startswith("#") and not rewritten.startswith("#"):
+            rewritten = f"{heading}\n{rewritten}"
+        body = original.rstrip()
+        return rewritten + original[len(body) :]
+
+    @staticmethod
+    def _is_approved(review_output: str) -> bool:
+        """Check whether a review output approves the CV."""
+        return is_approved(review_output)
+
+    def _best_candidate(self, inputs: dict[str, Any]) -> str:
+        """
+        Generate writer candidates concurrently and return the best one.
+
+        Candidates are ranked by local keyword coverage; with reviewer scoring,
+        approved candidates rank first and the winner's review is reused by
+        the next review phase.
+
+        Args:
+            inputs: Inputs for the writer task template
+
+        Returns:
+            Best cleaned CV candidate
+        """
+        print(f"Generating {len(self.candidate_llms)} candidates in parallel...")
+
+        def write(llm: Any) -> str:
+            return self._clean_cv_output(self._kickoff_crew(WriterCrew, llm, inputs))
+
+        candidates = []
+        last_error: Exception | None = None
+        with ThreadPoolExecutor(max_workers=len(self.candidate_llms)) as executor:
+            futures = [executor.submit(write, llm) for llm in self.candidate_llms]
+            for future in futures:
+                try:
+                    candidates.append(future.result())
+                except Exception as e:
+                    last_error = e
+                    print(f"⚠️  Candidate generation failed: {str(e)}")
+
+        if not candidates:
+            raise last_error
+
+        coverage = self._scorer().score_many(candidates).tolist()
+        reviews: list[str] = []
+        approved = [False] * len(candidates)
+
+        if self.candidate_scoring == "reviewer":
+            next_iteration = self.state.iteration_count + 1
+            with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+                reviews = list(
+                    executor.map(
+                        lambda cv: self._run_review(cv, next_iteration), candidates
+                    )
+                )
+            approved = [self._is_approved(review) for review in reviews]
+
+        best = max(range(len(candidates)), key=lambda i: (approved[i], coverage[i]))
+        if reviews:
+            self._review_cache = {candidates[best]: reviews[best]}
+
+        for i, score in enumerate(coverage):
+            marker = "→" if i == best else " "
+            status = " (approved)" if approved[i] else ""
+            print(f" {marker} Candidate {i + 1}: keyword coverage {score:.0%}{status}")
+
+        return candidates[best]
+
+    def _translate(self, cv_text: str, target_language: str) -> str:
+        """
+        Translate a CV version with the translator crew.
+
+        With a translation memory, the CV is split into segments (headings,
+        list items, paragraphs) and only segments without a stored
+        translation are sent to the translator, marked with their index.
+        If the answer does not keep the markers, the whole CV is translated.
+
+        Args:
+            cv_text: CV content to translate
+            target_language: Target language code
+
+        Returns:
+            Cleaned translated CV
+        """
+        if self.translation_memory is None:
+            return self._translate_document(cv_text, target_language)
+
+        model = "/".join(LLMFactory.describe_llm(self.translation_llm))
+        segments = split_segments(cv_text)
+        indexes = [i for i, (body, _) in enumerate(segments) if body.strip()]
+        stored = self.translation_memory.lookup(
+            [segments[i][0] for i in indexes], target_language, model
+        )
+        translations = {
+            i: text for i, text in zip(indexes, stored, strict=True) if text is not None
+        }
+        missing = {i: segments[i][0] for i in indexes if i not in translations}
+        CACHE_LOOKUPS.inc(len(translations), cache="translation_memory", result="hit")
+        CACHE_LOOKUPS.inc(len(missing), cache="translation_memory", result="miss")
+        print(
+            f"Translation memory: {len(translations)}/{len(indexes)} segments "
+            f"reused, {len(missing)} to translate"
+        )
+
+        if missing:
+            output = self._kickoff_crew(
+                TranslatorCrew,
+                self.translation_llm,
+                {
+                    "cv_content": mark_segments(missing),
+                    "target_language": target_language,
+                },
+            )
+            try:
+                translated = parse_marked(self._clean_cv_output(output))
+                if set(translated) != set(missing):
+                    raise ValueError("Segment markers were changed")
+            except ValueError as e:
+                print(f"⚠️  Segment translation unusable: {str(e)}")
+                print("   Translating the whole CV instead\n")
+                return self._translate_document(cv_text, target_language)
+
+            self.translation_memory.store(
+                [(missing[i], translated[i]) for i in missing], target_language, model
+            )
+            translations.update(translated)
+
+        return self._clean_cv_output(
+            "".join(
+                translations.get(i, body) + separator
+                for i, (body, separator) in enumerate(segments)
+            )
+        )
+
+    def _translate_document(self, cv_text: str, target_language: str) -> str:
+        """
+        Translate a whole CV version in one translator call.
+
+        Args:
+            cv_text: CV content to translate
+            target_language: Target language code
+
+        Returns:
+            Cleaned translated CV
+        """
+        # Run translator crew with appropriate LLM
+        translated_cv = self._kickoff_crew(
+            TranslatorCrew,
+            self.translation_llm,
+            {
+                "cv_content": cv_text,
+                "target_language": target_language,
+            },
+        )
+
+        # Clean up the translated CV
+        return self._clean_cv_output(translated_cv)
+
+    def _start_speculative_translation(self) -> None:
+        """
+        Start translating the current CV in the background.
+
+        The translation runs concurrently with the next review. If the review
+        approves this version, translate_cv uses the result right away;
+        otherwise the result is discarded.
+        """
+        if not self.speculative_translation or not self.state.translate_to:
+            return
+
+        if self._speculative_executor is None:
+            # Two workers so a stale translation never delays the next one
+            self._speculative_executor = ThreadPoolExecutor(max_workers=2)
+
+        cv_text = self.state.current_cv
+        future = self._speculative_executor.submit(
+            self._translate, cv_text, self.state.translate_to
+        )
+        self._speculative = (cv_text, future)
+        print(f"Speculative translation to {self.state.translate_to.upper()} started\n")
+
+    def _select_llm(
+        self, crew: str, default_llm: Any, inputs: dict[str, Any], final: bool
+    ) -> Any:
+        """
+        Select the LLM for a crew call using the routing policy.
+
+        Args:
+            crew: Crew name ("reviewer" or "writer")
+            default_llm: The crew's configured LLM
+            inputs: Inputs for the crew's task templates
+            final: Whether the call belongs to the final iteration
+
+        Returns:
+            Language model instance to use
+        """
+        if self.router is None:
+            return default_llm
+
+        prompt_chars = sum(len(str(value)) for value in inputs.values())
+        return self.router.select(
+            crew, default_llm, self.state.iteration_count, prompt_chars, final
+        )
+
+    def _kickoff_crew(self, crew_class: type, llm: Any, inputs: dict[str, Any]) -> str:
+        """
+        Run a crew and return its raw text output.
+
+        All LLM work of the flow goes through this method, so call policies
+        such as rate limiting and hedging are applied in one place.
+
+        Args:
+            crew_class: Crew class to instantiate (e.g. WriterCrew)
+            llm: Language model instance for the crew
+            inputs: Inputs for the crew's task templates
+
+        Returns:
+            Raw crew output
+        """
+
+        if self.hedging is None:
+            return self._crew_call(crew_class, llm, inputs)[1]()
+
+        secondary = None
+        if self.fallback_llm is not None:
+            secondary = self._crew_call(crew_class, self.fallback_llm, inputs)
+        return self.hedging.run(
+            self._crew_call(crew_class, llm, inputs),
+            secondary,
+            latency_key=crew_class.__name__,
+        )
+
+    def _crew_call(
+        self, crew_class: type, llm: Any, inputs: dict[str, Any]
+    ) -> tuple[str, Callable[[], str]]:
+        """
+        Build a (rate-limited) crew call for one LLM.
+
+        Args:
+            crew_class: Crew class to instantiate
+            llm: Language model instance for the crew
+            inputs: Inputs for the crew's task templates
+
+        Returns:
+            Tuple of ("provider/model" key, zero-argument callable)
+        """
+        provider, model = LLMFactory.describe_llm(llm)
+        if self.prompt_budget is not None:
+            inputs = self._fit_prompt(crew_class, provider, model, inputs)
+
+        labels = {"crew": crew_class.__name__, "provider": provider, "model": model}
+
+        def run() -> str:
+            timeout = self.call_timeout
+            if self.deadline is not None:
+                timeout = self.deadline.timeout(timeout)
+
+            def kickoff() -> Any:
+                return (
+                    crew_class(LLMFactory.crew_llm(llm)).crew().kickoff(inputs=inputs)
+                )
+
+            call = kickoff
+            if self.cassette is not None:
+                call = self.cassette.wrap(
+                    crew_class.__name__, f"{provider}/{model}", inputs, kickoff
+                )
+            started = time.monotonic()
+            try:
+                result = call_with_timeout(call, timeout, name=crew_class.__name__)
+            except Exception as e:
+                outcome = "timeout" if isinstance(e, TimeoutError) else "error"
+                LLM_CALLS.inc(outcome=outcome, **labels)
+                raise
+            finally:
+                LLM_CALL_SECONDS.observe(time.monotonic() - started, **labels)
+            LLM_CALLS.inc(outcome="success", **labels)
+            output = result.raw if hasattr(result, "raw") else str(result)
+            self._count_tokens(
+                labels, inputs, output, getattr(result, "token_usage", None)
+            )
+            return output
+
+        def run_limited() -> str:
+            tokens = estimate_tokens("".join(str(v) for v in inputs.values()))
+            return self.rate_limiter.call(
+                provider,
+                model,
+                run,
+                estimated_tokens=tokens,
+                kind=crew_class.__name__,
+            )
+
+        call = run if self.rate_limiter is None else run_limited
+        return f"{provider}/{model}", call
+
+    @staticmethod
+    def _count_tokens(
+        labels: dict[str, str], inputs: dict[str, Any], output: str, usage: Any
+    ) -> None:
+        """
+        Add the tokens of a crew call to the token metrics.
+
+        Uses the usage reported by the crew and falls back to estimates from
+        the input and output sizes if none was reported.
+
+        Args:
+            labels: Crew, provider and model labels
+            inputs: Inputs of the call
+            output: Raw output of the call
+            usage: Crew token usage (e.g. CrewOutput.token_usage), if any
+        """
+        prompt = getattr(usage, "prompt_tokens", 0) or 0
+        completion = getattr(usage, "completion_tokens", 0) or 0
+        cached = getattr(usage, "cached_prompt_tokens", 0) or 0
+        if not prompt and not completion:
+            prompt = estimate_tokens("".join(str(v) for v in inputs.values()))
+            completion = estimate_tokens(output)
+        LLM_TOKENS.inc(prompt, kind="prompt", **labels)
+        LLM_TOKENS.inc(completion, kind="completion", **labels)
+        if cached:
+            LLM_TOKENS.inc(cached, kind="cached_prompt", **labels)
+
+    def _fit_prompt(
+        self, crew_class: type, provider: str, model: str, inputs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Fit crew inputs into the model's context window and record reductions.
+
+        Args:
+            crew_class: Crew class whose templates are rendered
+            provider: Provider of the target LLM
+            model: Model of the target LLM
+            inputs: Inputs for the crew's task templates
+
+        Returns:
+            Inputs that fit the prompt budget
+
+        Raises:
+            ValueError: If the inputs cannot be made to fit
+        """
+        with self._budget_lock:
+            if crew_class not in self._template_tokens:
+                config_dir = Path(sys.modules[crew_class.__module__].__file__).parent
+                self._template_tokens[crew_class] = sum(
+                    count_tokens(path.read_text(encoding="utf-8"), model)
+                    for path in sorted((config_dir / "config").glob("*.yaml"))
+                )
+            template_tokens = self._template_tokens[crew_class]
+
+        fitted, reductions = self.prompt_budget.fit(
+            inputs, provider, model, template_tokens
+        )
+        for reduction in reductions:
+            record = {"crew": crew_class.__name__, "llm": f"{provider}/{model}"}
+            record.update(reduction)
+            with self._budget_lock:
+                if record in self.state.prompt_reductions:
+                    continue
+                self.state.prompt_reductions.append(record)
+            print(
+                f"⚠️  {record['field'].replace('_', ' ').capitalize()} "
+                f"{record['action']} to fit {record['llm']} "
+                f"({record['tokens_before']} → {record['tokens_after']} tokens)"
+            )
+            self._log_event("prompt_budget", **record)
+        return fitted
+
+    def _start_phase(self, phase: str) -> float:
+        """
+        Mark the start of a flow phase and start profiling it if enabled.
+
+        Args:
+            phase: Phase name (e.g. "review")
+
+        Returns:
+            time.monotonic() value at the start of the phase
+        """
+        if self.profiler is not None:
+            self.profiler.start(phase)
+        return time.monotonic()
+
+    def _record_timing(self, phase: str, started: float) -> float:
+        """
+        Add the time spent in a flow phase to the state timings.
+
+        Also stops profiling the phase if a profiler is set.
+
+        Args:
+            phase: Phase name (e.g. "review")
+            started: time.monotonic() value at the start of the phase
+
+        Returns:
+            Seconds spent in this occurrence of the phase
+        """
+        elapsed = time.monotonic() - started
+        if self.profiler is not None:
+            self.profiler.stop()
+        self.state.timings[phase] = self.state.timings.get(phase, 0.0) + elapsed
+        PHASE_SECONDS.observe(elapsed, phase=phase)
+        if self.deadline is not None:
+            self.deadline.record(phase, elapsed)
+        return elapsed
+
+    def _log_event(self, event: str, **fields: Any) -> None:
+        """Write a record to the run log, if one is configured."""
+        if self.run_log is not None:
+            self.run_log.write(event, **fields)
+
     def _format_supporting_docs(self) -> str:
         """
         Format supporting documents for display.
@@ -0,0 +1,6 @@
+"""Load-testing harness with a local OpenAI-compatible stub server."""
+
+from cv_writer.loadtest.runner import LoadTestReport, percentile, run_load_test
+from cv_writer.loadtest.stub_server import StubLLMServer
+
+__all__ = ["LoadTestReport", "StubLLMServer", "percentile", "run_load_test"]
@@ -0,0 +1,200 @@
+"""Concurrent optimization runs for load tests."""
+
+import contextlib
+import math
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+
+def percentile(samples: list[float], pct: float) -> float | None:
+    """
+    Compute a percentile with the nearest-rank method.
+
+    Args:
+        samples: Sample values
+        pct: Percentile between 0 and 100
+
+    Returns:
+        Percentile value, or None without samples
+    """
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class LoadTestReport:
+    """Throughput, latency and error statistics of a load test."""
+
+    def __init__(
+        self,
+        concurrency: int,
+        wall_seconds: float,
+        durations: list[float],
+        statuses: dict[str, int],
+        errors: list[str],
+        llm_calls: dict[str, float] | None = None,
+        server_stats: dict[str, Any] | None = None,
+    ):
+        """
+        Initialize report.
+
+        Args:
+            concurrency: Number of concurrent runs
+            wall_seconds: Wall-clock duration of the whole test
+            durations: Duration of every finished run in seconds
+            statuses: Number of finished runs by final flow status
+            errors: Error messages of failed runs
+            llm_calls: LLM calls by outcome (success, error, timeout)
+            server_stats: Request statistics of the stub server
+        """
+        self.concurrency = concurrency
+        self.wall_seconds = wall_seconds
+        self.durations = durations
+        self.statuses = statuses
+        self.errors = errors
+        self.llm_calls = llm_calls or {}
+        self.server_stats = server_stats
+
+    @property
+    def runs(self) -> int:
+        """Number of started runs."""
+        return len(self.durations) + len(self.errors)
+
+    @property
+    def throughput_per_minute(self) -> float:
+        """Finished runs per minute."""
+        if self.wall_seconds <= 0:
+            return 0.0
+        return len(self.durations) * 60 / self.wall_seconds
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of runs that failed."""
+        return len(self.errors) / self.runs if self.runs else 0.0
+
+    def summary(self) -> str:
+        """
+        Build a text summary.
+
+        Returns:
+            Multi-line report of runs, latency percentiles, LLM calls and
+            stub server requests
+        """
+
+        def seconds(value: float | None) -> str:
+            return "-" if value is None else f"{value:.2f}s"
+
+        lines = [
+            f"Runs: {self.runs} ({self.concurrency} concurrent) in "
+            f"{self.wall_seconds:.1f}s",
+            f"Throughput: {self.throughput_per_minute:.1f} runs/min",
+            f"Error rate: {self.error_rate:.1%} ({len(self.errors)} failed)",
+            "Run latency: "
+            + ", ".join(
+                f"p{pct} {seconds(percentile(self.durations, pct))}"
+                for pct in (50, 90, 99)
+            )
+            + f", max {seconds(max(self.durations, default=None))}",
+        ]
+        if self.statuses:
+            lines.append(
+                "Final status: "
+                + ", ".join(f"{s} {n}" for s, n in sorted(self.statuses.items()))
+            )
+        if self.llm_calls:
+            total = sum(self.llm_calls.values())
+            lines.append(
+                f"LLM calls: {total:.0f} ("
+                + ", ".join(
+                    f"{outcome} {count:.0f}"
+                    for outcome, count in sorted(self.llm_calls.items())
+                )
+                + f"), {total / max(self.wall_seconds, 1e-9):.2f}/s"
+            )
+        if self.server_stats is not None:
+            latencies = self.server_stats["latencies"]
+            requests = self.server_stats["requests"]
+            throttled = self.server_stats["throttled"]
+            lines.append(
+                f"Stub requests: {requests} ({throttled} throttled with 429, "
+                f"{throttled / requests if requests else 0:.1%}) over "
+                f"{self.server_stats.get('connections', 0)} connections"
+            )
+            lines.append(
+                "Stub request latency: "
+                + ", ".join(
+                    f"p{pct} {seconds(percentile(latencies, pct))}"
+                    for pct in (50, 90, 99)
+                )
+            )
+        for error in sorted(set(self.errors))[:5]:
+            lines.append(f"Error: {error}")
+        return "\n".join(lines)
+
+
+def run_load_test(
+    make_flow: Callable[[], Any],
+    job_description: str,
+    cv: str,
+    runs: int,
+    concurrency: int,
+    max_iterations: int = 2,
+    quiet: bool = True,
+) -> LoadTestReport:
+    """
+    Run many optimization flows concurrently and measure them.
+
+    Args:
+        make_flow: Function returning a new CVOptimizationFlow
+        job_description: Job description text for every run
+        cv: CV draft for every run
+        runs: Number of runs
+        concurrency: Number of runs in progress at the same time
+        max_iterations: Review iterations per run
+        quiet: Discard the flows' console output while the test runs
+
+    Returns:
+        Load test report (LLM call and server statistics are added by the
+        caller)
+    """
+    durations: list[float] = []
+    statuses: dict[str, int] = {}
+    errors: list[str] = []
+    lock = threading.Lock()
+
+    def run_once(_: int) -> None:
+        started = time.monotonic()
+        try:
+            flow = make_flow()
+            flow.state.job_description = job_description
+            flow.state.cv_draft = cv
+            flow.state.max_iterations = max_iterations
+            flow.kickoff()
+        except Exception as e:
+            with lock:
+                errors.append(f"{type(e).__name__}: {str(e)}")
+            return
+        with lock:
+            durations.append(time.monotonic() - started)
+            statuses[flow.state.status] = statuses.get(flow.state.status, 0) + 1
+
+    started = time.monotonic()
+    with contextlib.ExitStack() as stack:
+        if quiet:
+            sink = stack.enter_context(open(os.devnull, "w"))
+            stack.enter_context(contextlib.redirect_stdout(sink))
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            list(executor.map(run_once, range(runs)))
+    return LoadTestReport(
+        concurrency=concurrency,
+        wall_seconds=time.monotonic() - started,
+        durations=durations,
+        statuses=statuses,
+        errors=errors,
+    )
@@ -0,0 +1,305 @@
+"""Local OpenAI-compatible chat completions server for load tests."""
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from cv_writer.utils.rate_limiter import estimate_tokens
+
+# Prefix crewai expects in front of an agent's answer
+FINAL_ANSWER = "Thought: I now can give a great answer\nFinal Answer: "
+
+_APPROVAL = "DECISION: APPROVED\n\nThe CV covers the key requirements of the job."
+_REVISION = (
+    "DECISION: REVISE\n\n"
+    "- [HIGH] Quantify the impact of the most recent projects.\n"
+    "- [MEDIUM] Name the required technologies in the skills section.\n"
+    "- [LOW] Tighten the summary."
+)
+_FILLER_TEXT = """
+Delivered measurable improvements by designing, building and operating
+reliable services together with product and platform teams.
+"""
+_FILLER = _FILLER_TEXT.split()
+
+# Tokens per streamed chunk; keeps the event rate realistic for fast models
+_CHUNK_TOKENS = 4
+
+
+class StubLLMServer:
+    """
+    OpenAI-compatible ``/v1/chat/completions`` endpoint with simulated load.
+
+    Every request waits ``latency`` seconds (time to first token) and then
+    produces tokens at ``tokens_per_second``, streamed as server-sent events
+    if the client asks for a stream. A fraction of requests is rejected with
+    HTTP 429 to exercise retries and rate limiting. Answers are shaped like
+    the crews' output: prompts asking for a ``DECISION`` get a review
+    (approved with probability ``approve_rate``), all others get a CV-like
+    text of ``completion_tokens`` words.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.5,
+        tokens_per_second: float = 200.0,
+        completion_tokens: int = 300,
+        throttle_rate: float = 0.0,
+        approve_rate: float = 0.5,
+        retry_after: float = 0.5,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int | None = None,
+    ):
+        """
+        Initialize stub server (call start() to serve).
+
+        Args:
+            latency: Seconds before the first token
+            tokens_per_second: Generation speed (no delay if 0)
+            completion_tokens: Words in CV-like answers
+            throttle_rate: Fraction of requests rejected with HTTP 429 (0-1)
+            approve_rate: Probability that a review approves the CV (0-1)
+            retry_after: Retry-After hint of 429 responses in seconds
+            host: Interface to bind
+            port: TCP port (0 picks a free port)
+            seed: Random seed for reproducible throttling and decisions
+        """
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.completion_tokens = completion_tokens
+        self.throttle_rate = throttle_rate
+        self.approve_rate = approve_rate
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.throttled = 0
+        self.streamed = 0
+        self.connections = 0
+        self.latencies: list[float] = []
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """OpenAI base URL of the server (e.g. http://127.0.0.1:8080/v1)."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "StubLLMServer":
+        """Serve requests in a daemon thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="stub-llm-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "StubLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get request statistics.
+
+        Returns:
+            Dictionary with request, 429, stream and TCP connection counts
+            and the durations of all answered requests in seconds
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "connections": self.connections,
+                "throttled": self.throttled,
+                "streamed": self.streamed,
+                "latencies": list(self.latencies),
+            }
+
+    def _decide(self) -> tuple[bool, bool]:
+        """Draw whether to throttle a request and whether to approve."""
+        with self._lock:
+            self.requests += 1
+            throttle = self._random.random() < self.throttle_rate
+            if throttle:
+                self.throttled += 1
+            return throttle, self._random.random() < self.approve_rate
+
+    def _answer(self, prompt: str, approve: bool) -> str:
+        """Build the answer text for a prompt."""
+        if "DECISION:" in prompt:
+            return FINAL_ANSWER + (_APPROVAL if approve else _REVISION)
+        words = [_FILLER[i % len(_FILLER)] for i in range(self.completion_tokens)]
+        lines = [" ".join(words[i : i + 12]) for i in range(0, len(words), 12)]
+        return (
+            FINAL_ANSWER
+            + "# Stub CV\n\n## Experience\n"
+            + "\n".join(f"- {line}" for line in lines)
+        )
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        """Build the request handler class bound to this server."""
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, so clients that pool connections can reuse them
+            protocol_version = "HTTP/1.1"
+
+            def handle(self) -> None:
+                with stub._lock:
+                    stub.connections += 1
+                super().handle()
+
+            def do_GET(self) -> None:
+                if self.path.rstrip("/") != "/v1/models":
+                    self.send_error(404)
+                    return
+                self._send_json(200, {"object": "list", "data": [{"id": "stub"}]})
+
+            def do_POST(self) -> None:
+                if self.path.rstrip("/") != "/v1/chat/completions":
+                    self.send_error(404)
+                    return
+                started = time.monotonic()
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                except json.JSONDecodeError:
+                    self._send_json(400, {"error": {"message": "Invalid JSON"}})
+                    return
+
+                throttle, approve = stub._decide()
+                if throttle:
+                    self._send_json(
+                        429,
+                        {
+                            "error": {
+                                "message": "Rate limit reached (stub server)",
+                                "type": "rate_limit_exceeded",
+                                "code": "rate_limit_exceeded",
+                            }
+                        },
+                        {
+                            "Retry-After": f"{stub.retry_after:g}",
+                            "retry-after-ms": f"{stub.retry_after * 1000:.0f}",
+                        },
+                    )
+                    return
+
+                prompt = "\n".join(
+                    str(message.get("content", ""))
+                    for message in body.get("messages", [])
+                )
+                tokens = stub._answer(prompt, approve).split(" ")
+                model = body.get("model", "stub")
+                time.sleep(stub.latency)
+                if body.get("stream"):
+                    self._stream(tokens, model)
+                else:
+                    self._complete(tokens, model, prompt)
+                with stub._lock:
+                    stub.latencies.append(time.monotonic() - started)
+
+            def _generate(self, count: int) -> None:
+                """Simulate the generation time of tokens."""
+                if stub.tokens_per_second > 0:
+                    time.sleep(count / stub.tokens_per_second)
+
+            def _complete(self, tokens: list[str], model: str, prompt: str) -> None:
+                self._generate(len(tokens))
+                self._send_json(
+                    200,
+                    {
+                        "id": f"chatcmpl-stub-{time.monotonic_ns()}",
+                        "object": "chat.completion",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": [
+                            {
+                                "index": 0,
+                                "message": {
+                                    "role": "assistant",
+                                    "content": " ".join(tokens),
+                                },
+                                "finish_reason": "stop",
+                            }
+                        ],
+                        "usage": {
+                            "prompt_tokens": estimate_tokens(prompt),
+                            "completion_tokens": len(tokens),
+                            "total_tokens": estimate_tokens(prompt) + len(tokens),
+                        },
+                    },
+                )
+
+            def _stream(self, tokens: list[str], model: str) -> None:
+                with stub._lock:
+                    stub.streamed += 1
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                # Streams have no length, so they end with the connection
+                self.send_header("Connection", "close")
+                self.close_connection = True
+                self.end_headers()
+                chunk_id = f"chatcmpl-stub-{time.monotonic_ns()}"
+                for start in range(0, len(tokens), _CHUNK_TOKENS):
+                    piece = tokens[start : start + _CHUNK_TOKENS]
+                    self._generate(len(piece))
+                    text = ("" if start == 0 else " ") + " ".join(piece)
+                    self._event(chunk_id, model, {"content": text}, None)
+                self._event(chunk_id, model, {}, "stop")
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+
+            def _event(
+                self,
+                chunk_id: str,
+                model: str,
+                delta: dict[str, str],
+                finish_reason: str | None,
+            ) -> None:
+                chunk = {
+                    "id": chunk_id,
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [
+                        {"index": 0, "delta": delta, "finish_reason": finish_reason}
+                    ],
+                }
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                self.wfile.flush()
+
+            def _send_json(
+                self,
+                status: int,
+                payload: dict[str, Any],
+                headers: dict[str, str] | None = None,
+            ) -> None:
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format: str, *args: object) -> None:
+                return
+
+        return Handler
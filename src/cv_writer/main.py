@@ -1,13 +1,56 @@
 """Main entry point for CV Optimizer CLI."""
 
+import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any
 
 import click
 
 from cv_writer.config import Config
 from cv_writer.flows import CVOptimizationFlow
-from cv_writer.tools import DocumentParser
-from cv_writer.utils import FileHandler, LLMFactory
+from cv_writer.models import RunRecord
+from cv_writer.tools import DocumentParser, JobRanker, RequirementExtractor
+from cv_writer.tools.job_ranker import METHODS as RANKING_METHODS
+from cv_writer.utils import (
+    Cassette,
+    CostEstimator,
+    Deadline,
+    FileHandler,
+    HedgingPolicy,
+    LLMFactory,
+    LLMRouter,
+    PhaseProfiler,
+    PromptBudget,
+    RateLimiter,
+    RunLog,
+    RunStore,
+    TranslationMemory,
+)
+from cv_writer.utils.fingerprint import config_hash, content_hash, files_hash
+from cv_writer.utils.metrics import CACHE_LOOKUPS, ERRORS, LLM_CALLS, REGISTRY
+from cv_writer.utils.ollama import OllamaModel, apply_slot_limits, slot_limiter
+from cv_writer.utils.run_store import new_run_id
+
+# Crew prompt templates; part of the memo key so prompt changes invalidate it
+_CREWS_DIR = Path(__file__).parent / "crews"
+
+# Config sections that do not change the results of a run
+_MEMO_IGNORED_SECTIONS = (
+    "output",
+    "runs",
+    "run_log",
+    "rate_limits",
+    "timeouts",
+    "metrics",
+    "ollama",
+    "dry_run",
+    "cassette",
+    "ranking",
+)
 
 
 @click.command()
@@ -69,6 +112,140 @@ from cv_writer.utils import FileHandler, LLMFactory
     "--translation-llm-model",
     help="LLM model for translation (if different from main)",
 )
+@click.option(
+    "--speculative-translation/--no-speculative-translation",
+    default=None,
+    help="Translate each CV version while it is being reviewed",
+)
+@click.option(
+    "--translation-memory/--no-translation-memory",
+    default=None,
+    help="Only translate new or changed CV segments (see translation.memory)",
+)
+@click.option(
+    "--reviewer-llm-provider",
+    help="LLM provider for the reviewer crew (if different from main)",
+)
+@click.option(
+    "--reviewer-llm-model",
+    help="LLM model for the reviewer crew (if different from main)",
+)
+@click.option(
+    "--writer-llm-provider",
+    help="LLM provider for the writer crew (if different from main)",
+)
+@click.option(
+    "--writer-llm-model",
+    help="LLM model for the writer crew (if different from main)",
+)
+@click.option(
+    "--fast-llm-model",
+    help="Fast model for early reviews; enables model routing",
+)
+@click.option(
+    "--fast-llm-provider",
+    help="LLM provider for the fast model (if different from main)",
+)
+@click.option(
+    "--candidates",
+    "-n",
+    type=int,
+    help="Writer candidates generated in parallel per revision (best is kept)",
+)
+@click.option(
+    "--candidate-scoring",
+    type=click.Choice(["local", "reviewer"], case_sensitive=False),
+    help="How writer candidates are ranked (local keyword coverage or reviewer)",
+)
+@click.option(
+    "--review-mode",
+    type=click.Choice(["full", "sections"], case_sensitive=False),
+    help="Review the whole CV in one call or its sections in parallel",
+)
+@click.option(
+    "--write-mode",
+    type=click.Choice(["full", "sections"], case_sensitive=False),
+    help="Rewrite the whole CV or only the sections named in the feedback",
+)
+@click.option(
+    "--keyword-gate/--no-keyword-gate",
+    default=None,
+    help="Skip the LLM review of revisions that lose job keywords",
+)
+@click.option(
+    "--min-keyword-coverage",
+    type=click.FloatRange(0.0, 1.0),
+    help="Keyword coverage (0-1) an approved CV must reach to finish",
+)
+@click.option(
+    "--rate-limit/--no-rate-limit",
+    default=None,
+    help="Throttle LLM calls per provider/model (see rate_limits config)",
+)
+@click.option(
+    "--hedging/--no-hedging",
+    default=None,
+    help="Hedge slow LLM calls and fail over on errors (see hedging config)",
+)
+@click.option(
+    "--extract-requirements",
+    type=click.Choice(["local", "llm"], case_sensitive=False),
+    help="Send a cached requirement profile instead of the full job description",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Profile CPU time and memory per phase (writes .prof files and a summary)",
+)
+@click.option(
+    "--from-run",
+    help="Continue from the optimized CV of a previous run id (after editing the CV)",
+)
+@click.option(
+    "--deadline",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Wall-clock budget for the whole run in seconds; finishes early with the best CV so far",
+)
+@click.option(
+    "--metrics-file",
+    type=click.Path(dir_okay=False),
+    help="Add this run's metrics to a Prometheus text file (e.g. for the node exporter)",
+)
+@click.option(
+    "--metrics-port",
+    type=click.IntRange(0, 65535),
+    help="Serve Prometheus metrics on http://127.0.0.1:PORT/metrics during the run",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Run the optimization even if an identical run is stored",
+)
+@click.option(
+    "--prompt-caching/--no-prompt-caching",
+    default=None,
+    help="Request provider-side caching of the stable prompt prefix",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Estimate tokens, cost and wall time of the run without calling any LLM",
+)
+@click.option(
+    "--record",
+    is_flag=True,
+    help="Record every LLM call of the run to a cassette file for later replay",
+)
+@click.option(
+    "--replay",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Answer LLM calls from a recorded cassette instead of calling the models",
+)
+@click.option(
+    "--replay-latency",
+    type=click.Choice(["original", "none"], case_sensitive=False),
+    help="Delay of replayed calls: their recorded duration (default) or none",
+)
 def main(
     job_description: str,
     cv: str,
@@ -81,12 +258,42 @@ def main(
     translate_to: str | None,
     translation_llm_provider: str | None,
     translation_llm_model: str | None,
+    speculative_translation: bool | None,
+    translation_memory: bool | None,
+    reviewer_llm_provider: str | None,
+    reviewer_llm_model: str | None,
+    writer_llm_provider: str | None,
+    writer_llm_model: str | None,
+    fast_llm_model: str | None,
+    fast_llm_provider: str | None,
+    candidates: int | None,
+    candidate_scoring: str | None,
+    review_mode: str | None,
+    write_mode: str | None,
+    keyword_gate: bool | None,
+    min_keyword_coverage: float | None,
+    rate_limit: bool | None,
+    hedging: bool | None,
+    prompt_caching: bool | None,
+    extract_requirements: str | None,
+    profile: bool,
+    from_run: str | None,
+    deadline: float | None,
+    metrics_file: str | None,
+    metrics_port: int | None,
+    force: bool,
+    dry_run: bool,
+    record: bool,
+    replay: str | None,
+    replay_latency: str | None,
 ):
     """
     CV Optimizer - Optimize your CV for specific job descriptions.
 
     This tool uses AI to iteratively improve your CV based on job requirements.
     """
+    metrics_path = None
+    run_log = None
     try:
         # Load configuration
         cfg = Config(config_file=config)
@@ -107,6 +314,70 @@ def main(
             cfg.set("translation.llm_provider", translation_llm_provider)
         if translation_llm_model:
             cfg.set("translation.llm_model", translation_llm_model)
+        if speculative_translation is not None:
+            cfg.set("translation.speculative", speculative_translation)
+        if translation_memory is not None:
+            cfg.set("translation.memory", translation_memory)
+        if reviewer_llm_provider:
+            cfg.set("crews.reviewer.llm_provider", reviewer_llm_provider)
+        if reviewer_llm_model:
+            cfg.set("crews.reviewer.llm_model", reviewer_llm_model)
+        if writer_llm_provider:
+            cfg.set("crews.writer.llm_provider", writer_llm_provider)
+        if writer_llm_model:
+            cfg.set("crews.writer.llm_model", writer_llm_model)
+        if fast_llm_provider:
+            cfg.set("routing.fast_llm_provider", fast_llm_provider)
+        if fast_llm_model:
+            cfg.set("routing.fast_llm_model", fast_llm_model)
+            cfg.set("routing.enabled", True)
+        if candidates:
+            cfg.set("optimizer.candidates", candidates)
+        if candidate_scoring:
+            cfg.set("optimizer.candidate_scoring", candidate_scoring.lower())
+        if review_mode:
+            cfg.set("optimizer.review_mode", review_mode.lower())
+        if write_mode:
+            cfg.set("optimizer.write_mode", write_mode.lower())
+        if keyword_gate is not None:
+            cfg.set("optimizer.keyword_gate", keyword_gate)
+        if min_keyword_coverage is not None:
+            cfg.set("optimizer.min_keyword_coverage", min_keyword_coverage)
+        if rate_limit is not None:
+            cfg.set("rate_limits.enabled", rate_limit)
+        if hedging is not None:
+            cfg.set("hedging.enabled", hedging)
+        if prompt_caching is not None:
+            cfg.set("llm.prompt_caching", prompt_caching)
+        if extract_requirements:
+            cfg.set("requirements.enabled", True)
+            cfg.set("requirements.mode", extract_requirements.lower())
+        if deadline:
+            cfg.set("timeouts.run_deadline_seconds", deadline)
+
+        if record and replay:
+            raise click.ClickException("--record and --replay cannot be combined")
+        if record:
+            cfg.set("cassette.record", True)
+        if replay_latency:
+            cfg.set("cassette.replay_latency", replay_latency.lower())
+
+        if metrics_file:
+            cfg.set("metrics.textfile", metrics_file)
+        if metrics_port is not None:
+            cfg.set("metrics.port", metrics_port)
+
+        # Export metrics while the run is in progress and after it ends
+        metrics_path = cfg.get("metrics.textfile")
+        if cfg.get("metrics.port") is not None:
+            server = REGISTRY.serve(cfg.get("metrics.port"))
+            host, port = server.server_address[:2]
+            print(f"✅ Metrics endpoint: http://{host}:{port}/metrics\n")
+
+        # The deadline covers the whole run, including loading inputs
+        run_deadline = None
+        if cfg.get("timeouts.run_deadline_seconds"):
+            run_deadline = Deadline(cfg.get("timeouts.run_deadline_seconds"))
 
         # Display configuration
         print("\n" + "=" * 80)
@@ -115,17 +386,63 @@ def main(
         print(f"LLM Provider: {cfg.llm_provider}")
         print(f"LLM Model: {cfg.llm_model}")
         print(f"Max Iterations: {cfg.max_iterations}")
+        if run_deadline is not None:
+            print(f"Deadline: {run_deadline.seconds:g}s")
+        if cfg.optimizer_candidates > 1:
+            print(
+                f"Writer Candidates: {cfg.optimizer_candidates} ({cfg.get('optimizer.candidate_scoring', 'local')} scoring)"
+            )
         print(f"Output Directory: {cfg.output_directory}")
         if cfg.translation_target_language:
             print(f"Translation: {cfg.translation_target_language.upper()}")
             if cfg.translation_llm_provider:
-                print(f"Translation LLM: {cfg.translation_llm_provider}/{cfg.translation_llm_model or 'default'}")
+                print(
+                    f"Translation LLM: {cfg.translation_llm_provider}/{cfg.translation_llm_model or 'default'}"
+                )
+        for crew in ("reviewer", "writer"):
+            crew_provider = cfg.get(f"crews.{crew}.llm_provider")
+            crew_model = cfg.get(f"crews.{crew}.llm_model")
+            if crew_provider or crew_model:
+                print(
+                    f"{crew.capitalize()} LLM: {crew_provider or cfg.llm_provider}/{crew_model or 'default'}"
+                )
+        if cfg.routing_enabled:
+            print(
+                f"Fast LLM (routing): {cfg.routing_fast_llm_provider or cfg.llm_provider}/{cfg.routing_fast_llm_model or 'default'}"
+            )
         print("=" * 80 + "\n")
 
+        # Load Ollama models while the documents are parsed (dry runs and
+        # replays call no model)
+        ollama_models = _ollama_models(cfg)
+        ollama_preloads = {}
+        if cfg.ollama_warm_up and not replay and not dry_run:
+            for ollama_model in ollama_models:
+                status = ollama_model.status()
+                if not status["reachable"]:
+                    print(
+                        f"⚠️  Ollama server not reachable at {ollama_model.base_url}\n"
+                    )
+                    break
+                if status["loaded"]:
+                    print(f"✅ Ollama model {ollama_model.model} is loaded\n")
+                else:
+                    print(f"Ollama model {ollama_model.model} is cold, preloading...\n")
+                ollama_preloads[ollama_model] = ollama_model.preload_in_background()
+
+        run_id = new_run_id()
+        profiler = None
+        if profile:
+            profiler = PhaseProfiler(Path(cfg.output_directory) / "profiles", run_id)
+            profiler.start("parse")
+
         # Parse job description
         print("Loading job description...")
         try:
-            job_desc_text = DocumentParser.parse_source(job_description)
+            job_desc_text = DocumentParser.parse_source(
+                job_description,
+                timeout=cfg.get("timeouts.scraper_seconds", 30.0),
+            )
             print(f"✅ Job description loaded ({len(job_desc_text)} characters)\n")
         except Exception as e:
             raise click.ClickException(
@@ -154,13 +471,82 @@ def main(
                     f"Failed to load additional documents: {str(e)}"
                 ) from e
 
+        # Load the run to continue from
+        previous_run = None
+        if from_run:
+            try:
+                previous_run = RunStore(cfg.runs_database).get_run(from_run)
+            except Exception as e:
+                raise click.ClickException(
+                    f"Failed to load previous run: {str(e)}"
+                ) from e
+            if previous_run is None:
+                raise click.ClickException(
+                    f"No single run matches '{from_run}' in {cfg.runs_database}"
+                )
+            print(f"✅ Continuing from run {previous_run.run_id}\n")
+            if previous_run.job_hash != content_hash(job_desc_text):
+                print("⚠️  The previous run optimized the CV for a different job.\n")
+
+        if dry_run:
+            _print_estimate(cfg, job_desc_text, cv_text, supporting_docs, previous_run)
+            return
+
+        # Reuse the results of an identical completed run
+        memo_key = _memo_key(
+            cfg,
+            job_desc_text,
+            cv_text,
+            supporting_docs,
+            parent_run_id=previous_run.run_id if previous_run else "",
+        )
+        if cfg.runs_enabled and cfg.runs_memoize and not force and not replay:
+            memoized = _find_memoized_run(cfg, memo_key)
+            CACHE_LOOKUPS.inc(
+                cache="run_memo", result="miss" if memoized is None else "hit"
+            )
+            if memoized is not None:
+                print(
+                    f"✅ Identical run found: {memoized.run_id} "
+                    f"({memoized.created_at.strftime('%Y-%m-%d %H:%M:%S')})"
+                )
+                print("   Reusing its results (use --force to run again)\n")
+                if profiler is not None:
+                    profiler.close()
+                _save_outputs(
+                    cfg,
+                    run_id,
+                    final_cv=memoized.final_cv,
+                    feedback_history=memoized.feedback_history,
+                    translated_cv=memoized.translations.get(
+                        cfg.translation_target_language or ""
+                    ),
+                )
+                print("\n" + "=" * 80)
+                print("OPTIMIZATION SUMMARY")
+                print("=" * 80)
+                print(f"Status: {memoized.status} (reused)")
+                print(f"Iterations Completed: {memoized.iterations}")
+                print(f"Final Decision: {memoized.final_decision or 'N/A'}")
+                print(f"Output Directory: {cfg.output_directory}")
+                print(f"Reused Run ID: {memoized.run_id}")
+                print("=" * 80 + "\n")
+                return
+
+        if profiler is not None:
+            profiler.stop()
+            profiler.start("setup")
+
         # Create LLM instance
+        LLMFactory.configure_pool(max_connections=cfg.get("llm.max_connections", 20))
         print("Initializing LLM...")
         try:
             llm = LLMFactory.create_llm(
                 provider=cfg.llm_provider,
                 model=cfg.llm_model,
                 temperature=cfg.llm_temperature,
+                prompt_caching=cfg.llm_prompt_caching,
+                **_llm_options(cfg, cfg.llm_provider),
             )
             print("✅ LLM initialized\n")
         except Exception as e:
@@ -175,6 +561,8 @@ def main(
                     provider=cfg.translation_llm_provider,
                     model=cfg.translation_llm_model or cfg.llm_model,
                     temperature=cfg.llm_temperature,
+                    prompt_caching=cfg.llm_prompt_caching,
+                    **_llm_options(cfg, cfg.translation_llm_provider),
                 )
                 print("✅ Translation LLM initialized\n")
             except Exception as e:
@@ -182,8 +570,151 @@ def main(
                 print("   Using main LLM for translation instead\n")
                 translation_llm = None
 
+        # Create per-crew LLMs if configured
+        reviewer_llm = _create_optional_llm(
+            cfg, cfg.reviewer_llm_provider, cfg.reviewer_llm_model, "reviewer"
+        )
+        writer_llm = _create_optional_llm(
+            cfg, cfg.writer_llm_provider, cfg.writer_llm_model, "writer"
+        )
+
+        # Create best-of-N writer candidate LLMs if enabled
+        candidate_llms = None
+        if cfg.optimizer_candidates > 1:
+            try:
+                candidate_llms = _create_candidate_llms(cfg)
+            except Exception as e:
+                raise click.ClickException(
+                    f"Failed to initialize candidate LLMs: {str(e)}"
+                ) from e
+
+        # Create routing policy with fast LLM if enabled
+        router = None
+        if cfg.routing_enabled:
+            fast_llm = _create_optional_llm(
+                cfg, cfg.routing_fast_llm_provider, cfg.routing_fast_llm_model, "fast"
+            )
+            if fast_llm is not None:
+                router = LLMRouter.from_config(cfg, fast_llm)
+
+        # Create requirement extractor (and its LLM) if enabled
+        requirement_extractor = None
+        requirements_llm = None
+        if cfg.requirements_enabled:
+            requirement_extractor = RequirementExtractor(cfg.requirements_cache_dir)
+            if cfg.requirements_mode == "llm":
+                requirements_llm = (
+                    _create_optional_llm(
+                        cfg,
+                        cfg.get("requirements.llm_provider"),
+                        cfg.get("requirements.llm_model"),
+                        "requirements",
+                    )
+                    or llm
+                )
+
+        # Create shared rate limiter if enabled
+        rate_limiter = None
+        if cfg.rate_limits_enabled:
+            rate_limiter = RateLimiter.from_config(cfg)
+            print("✅ Rate limiting enabled\n")
+
+        # Queue calls locally instead of on the Ollama server's slots
+        if ollama_models:
+            slots = cfg.ollama_num_parallel or 1
+            if rate_limiter is None:
+                rate_limiter = slot_limiter(slots)
+            else:
+                apply_slot_limits(
+                    rate_limiter, [model.model for model in ollama_models], slots
+                )
+            print(f"✅ Ollama calls limited to {slots} parallel slot(s)\n")
+
+        # Create hedging policy and fallback LLM if enabled
+        hedging_policy = None
+        fallback_llm = None
+        if cfg.hedging_enabled:
+            hedging_policy = HedgingPolicy.from_config(cfg)
+            if cfg.hedging_fallback_provider:
+                try:
+                    fallback_llm = LLMFactory.create_llm(
+                        provider=cfg.hedging_fallback_provider,
+                        model=cfg.hedging_fallback_model
+                        or LLMFactory.get_default_model(cfg.hedging_fallback_provider),
+                        temperature=cfg.llm_temperature,
+                        prompt_caching=cfg.llm_prompt_caching,
+                        **_llm_options(cfg, cfg.hedging_fallback_provider),
+                    )
+                except Exception as e:
+                    print(f"⚠️  Failed to initialize fallback LLM: {str(e)}")
+                    print("   Hedging with the main LLM instead\n")
+            print("✅ Hedging enabled\n")
+
+        # Open per-run event log
+        if cfg.run_log_enabled:
+            run_log = RunLog(
+                Path(cfg.run_log_directory) / f"{run_id}.events.ndjson",
+                run_id=run_id,
+                include_text=cfg.get("run_log.include_text", False),
+            )
+            print(f"✅ Event log: {run_log.path}\n")
+
+        # Record LLM calls to, or answer them from, a cassette
+        cassette = None
+        if replay:
+            try:
+                cassette = Cassette(
+                    replay,
+                    mode="replay",
+                    latency_scale=(
+                        0.0 if cfg.get("cassette.replay_latency") == "none" else 1.0
+                    ),
+                )
+            except Exception as e:
+                raise click.ClickException(f"Failed to load cassette: {str(e)}") from e
+            print(
+                f"✅ Replaying {len(cassette.interactions)} LLM call(s) from {replay}\n"
+            )
+        elif cfg.get("cassette.record", False):
+            cassette = Cassette(
+                Path(cfg.cassette_directory) / f"{run_id}.cassette.ndjson"
+            )
+            print(f"✅ Recording LLM calls: {cassette.path}\n")
+
         # Run optimization flow
-        flow = CVOptimizationFlow(llm, translation_llm=translation_llm)
+        flow = CVOptimizationFlow(
+            llm,
+            translation_llm=translation_llm,
+            rate_limiter=rate_limiter,
+            hedging=hedging_policy,
+            fallback_llm=fallback_llm,
+            reviewer_llm=reviewer_llm,
+            writer_llm=writer_llm,
+            router=router,
+            speculative_translation=cfg.translation_speculative,
+            candidate_llms=candidate_llms,
+            candidate_scoring=cfg.get("optimizer.candidate_scoring", "local"),
+            run_log=run_log,
+            profiler=profiler,
+            prompt_budget=(
+                PromptBudget.from_config(cfg) if cfg.prompt_budget_enabled else None
+            ),
+            requirement_extractor=requirement_extractor,
+            requirements_llm=requirements_llm,
+            keyword_gate=cfg.get("optimizer.keyword_gate", False),
+            min_keyword_coverage=cfg.get("optimizer.min_keyword_coverage", 0.0) or 0.0,
+            translation_memory=(
+                TranslationMemory(cfg.translation_memory_database)
+                if cfg.translation_target_language and cfg.translation_memory_enabled
+                else None
+            ),
+            review_mode=cfg.get("optimizer.review_mode", "full"),
+            write_mode=cfg.get("optimizer.write_mode", "full"),
+            section_concurrency=cfg.get("optimizer.section_concurrency", 4),
+            call_timeout=cfg.get("timeouts.llm_call_seconds"),
+            deadline=run_deadline,
+            cassette=cassette,
+        )
 
         # Initialize state with inputs
         flow.state.job_description = job_desc_text
@@ -191,47 +722,82 @@ def main(
         flow.state.supporting_docs = supporting_docs
         flow.state.max_iterations = cfg.max_iterations
         flow.state.translate_to = cfg.translation_target_language
+        if previous_run is not None:
+            flow.state.previous_cv = previous_run.final_cv
+            flow.state.previous_cv_draft = previous_run.cv_draft
+
+        if profiler is not None:
+            profiler.stop()
+
+        for ollama_model, preload in ollama_preloads.items():
+            try:
+                seconds = preload.result()
+                print(f"✅ Ollama model {ollama_model.model} ready ({seconds:.1f}s)\n")
+            except Exception as e:
+                print(f"⚠️  Failed to preload {ollama_model.model}: {str(e)}\n")
 
         # Run the flow
+        started_at = datetime.now()
+        started = time.monotonic()
         flow.kickoff()
+        flow.state.timings["total"] = time.monotonic() - started
+
+        if cassette is not None:
+            cassette.close()
+            if replay and cassette.matches["fallback"]:
+                print(
+                    f"⚠️  {cassette.matches['fallback']} call(s) had other inputs than recorded\n"
+                )
+            if replay and cassette.remaining:
+                print(f"⚠️  {cassette.remaining} recorded call(s) were not replayed\n")
 
         # Save outputs
         print("\n" + "=" * 80)
         print("SAVING OUTPUTS")
         print("=" * 80 + "\n")
+        if profiler is not None:
+            profiler.start("save")
 
-        # Save final CV
-        cv_path = FileHandler.save_cv(
-            cv_content=flow.state.current_cv,
-            output_dir=cfg.output_directory,
-            filename_pattern=cfg.cv_filename_pattern,
+        output_files = _save_outputs(
+            cfg,
+            run_id,
+            final_cv=flow.state.current_cv,
+            feedback_history=flow.state.feedback_history,
+            translated_cv=flow.state.translated_cv,
         )
-        print(f"✅ Final CV saved: {cv_path}")
-
-        # Save translated CV if available
-        if flow.state.translated_cv:
-            # Use the same base filename as the English CV (without extension)
-            base_filename = cv_path.stem  # e.g., "cv_optimized_20251113_123456"
-            translated_cv_path = FileHandler.save_translated_cv(
-                cv_content=flow.state.translated_cv,
-                output_dir=cfg.output_directory,
-                language_code=cfg.translation_target_language,
-                base_filename=base_filename,
-            )
-            print(
-                f"✅ Translated CV ({cfg.translation_target_language.upper()}) saved: {translated_cv_path}"
-            )
 
-        # Save feedback history
-        feedback_content = FileHandler.format_feedback_history(
-            flow.state.feedback_history
-        )
-        feedback_path = FileHandler.save_feedback_history(
-            feedback_content=feedback_content,
-            output_dir=cfg.output_directory,
-            filename_pattern=cfg.feedback_filename_pattern,
-        )
-        print(f"✅ Feedback history saved: {feedback_path}")
+        # Record run in the run store (replays only reproduce a stored run)
+        if cfg.runs_enabled and not replay:
+            try:
+                RunStore(cfg.runs_database).save_run(
+                    _build_run_record(
+                        cfg,
+                        flow,
+                        run_id=run_id,
+                        started_at=started_at,
+                        candidate=Path(cv).stem,
+                        job=_job_label(job_description),
+                        output_files=output_files,
+                        memo_key=memo_key,
+                        parent_run_id=previous_run.run_id if previous_run else "",
+                    )
+                )
+                print(f"✅ Run recorded: {run_id} ({cfg.runs_database})")
+            except Exception as e:
+                print(f"⚠️  Failed to record run: {str(e)}")
+
+        if run_log is not None:
+            run_log.write("saved", output_files=output_files)
+
+        if profiler is not None:
+            profiler.close()
+            summary_path = profiler.write_summary()
+            print("\n" + "=" * 80)
+            print("PROFILE SUMMARY")
+            print("=" * 80)
+            print(profiler.summary().split("\n\n")[0])
+            print(f"\n✅ Profile summary saved: {summary_path}")
+            print(f"   Per-phase profiles: {profiler.output_dir}/{run_id}.*.prof")
 
         # Display summary
         print("\n" + "=" * 80)
@@ -241,6 +807,7 @@ def main(
         print(f"Iterations Completed: {flow.state.iteration_count}")
         print(f"Final Decision: {flow.state.final_decision or 'N/A'}")
         print(f"Output Directory: {cfg.output_directory}")
+        print(f"Run ID: {run_id}")
         print("=" * 80 + "\n")
 
         if flow.state.status == "APPROVED":
@@ -249,16 +816,816 @@ def main(
             print(
                 "⚠️ Maximum iterations reached. Consider running again with more iterations."
             )
+        elif flow.state.status == "DEADLINE_REACHED":
+            print(
+                "⚠️ Run deadline reached. The best CV so far was saved; use --from-run to continue."
+            )
 
         print("\nThank you for using CV Optimizer!\n")
 
     except click.ClickException:
+        ERRORS.inc(component="run")
         raise
     except KeyboardInterrupt:
         print("\n\n⚠️ Optimization interrupted by user.")
         sys.exit(1)
     except Exception as e:
+        ERRORS.inc(component="run")
         raise click.ClickException(f"❌ An error occurred: {str(e)}") from e
+    finally:
+        if run_log is not None:
+            run_log.close()
+        if metrics_path:
+            try:
+                print(f"✅ Metrics written: {REGISTRY.write_textfile(metrics_path)}")
+            except Exception as e:
+                print(f"⚠️  Failed to write metrics: {str(e)}")
+
+
+def _save_outputs(
+    cfg: Config,
+    run_id: str,
+    final_cv: str,
+    feedback_history: list,
+    translated_cv: str | None = None,
+) -> list[str]:
+    """
+    Save the final CV, its translation and the feedback history.
+
+    Args:
+        cfg: Configuration
+        run_id: Run id used in the output file names
+        final_cv: Final CV content
+        feedback_history: List of ReviewFeedback objects
+        translated_cv: Translated CV content, if any
+
+    Returns:
+        Paths of the written files
+    """
+    # Save final CV
+    cv_path = FileHandler.save_cv(
+        cv_content=final_cv,
+        output_dir=cfg.output_directory,
+        filename_pattern=cfg.cv_filename_pattern,
+        run_id=run_id,
+    )
+    output_files = [str(cv_path)]
+    print(f"✅ Final CV saved: {cv_path}")
+
+    # Save translated CV if available
+    if translated_cv:
+        # Use the same base filename as the English CV (without extension)
+        base_filename = cv_path.stem  # e.g., "cv_optimized_20251113_123456"
+        translated_cv_path = FileHandler.save_translated_cv(
+            cv_content=translated_cv,
+            output_dir=cfg.output_directory,
+            language_code=cfg.translation_target_language,
+            base_filename=base_filename,
+        )
+        output_files.append(str(translated_cv_path))
+        print(
+            f"✅ Translated CV ({cfg.translation_target_language.upper()}) saved: {translated_cv_path}"
+        )
+
+    # Save feedback history
+    feedback_content = FileHandler.format_feedback_history(feedback_history)
+    feedback_path = FileHandler.save_feedback_history(
+        feedback_content=feedback_content,
+        output_dir=cfg.output_directory,
+        filename_pattern=cfg.feedback_filename_pattern,
+        run_id=run_id,
+    )
+    output_files.append(str(feedback_path))
+    print(f"✅ Feedback history saved: {feedback_path}")
+    return output_files
+
+
+def _memo_key(
+    cfg: Config,
+    job_description: str,
+    cv_text: str,
+    supporting_docs: list[str],
+    parent_run_id: str = "",
+) -> str:
+    """
+    Fingerprint everything that determines the result of a run.
+
+    Covers the parsed inputs, all config sections except output and
+    bookkeeping settings, and the crew prompt templates.
+
+    Args:
+        cfg: Configuration
+        job_description: Job description text
+        cv_text: CV text
+        supporting_docs: Supporting document texts
+        parent_run_id: Run the optimization continues from, if any
+
+    Returns:
+        Memo key
+    """
+    relevant_config = {
+        section: value
+        for section, value in cfg.config.items()
+        if section not in _MEMO_IGNORED_SECTIONS
+    }
+    parts = [
+        content_hash(cv_text),
+        content_hash(job_description),
+        content_hash(*supporting_docs),
+        config_hash(relevant_config),
+        files_hash(_CREWS_DIR.glob("*/config/*.yaml"), root=_CREWS_DIR),
+    ]
+    if parent_run_id:
+        parts.append(parent_run_id)
+    return content_hash(*parts)
+
+
+def _find_memoized_run(cfg: Config, memo_key: str) -> RunRecord | None:
+    """
+    Look up a completed run with the same memo key.
+
+    Args:
+        cfg: Configuration
+        memo_key: Memo key of the current inputs
+
+    Returns:
+        Stored run, or None if there is none or the store cannot be read
+    """
+    try:
+        return RunStore(cfg.runs_database).find_memoized(memo_key)
+    except Exception as e:
+        print(f"⚠️  Failed to look up previous runs: {str(e)}\n")
+        return None
+
+
+def _create_optional_llm(
+    cfg: Config, provider: str | None, model: str | None, label: str
+) -> Any | None:
+    """
+    Create an additional LLM if a provider or model override is configured.
+
+    A missing provider falls back to the main provider; a missing model falls
+    back to the main model (same provider) or the provider's default model.
+
+    Args:
+        cfg: Configuration
+        provider: Provider override (None means main provider)
+        model: Model override (None means main/default model)
+        label: Name used in progress messages (e.g. "reviewer")
+
+    Returns:
+        LLM instance, or None if no override is configured or creation failed
+    """
+    if not provider and not model:
+        return None
+
+    provider, model = _resolve_llm(cfg, provider, model)
+
+    print(f"Initializing {label} LLM...")
+    try:
+        llm = LLMFactory.create_llm(
+            provider=provider,
+            model=model,
+            temperature=cfg.llm_temperature,
+            prompt_caching=cfg.llm_prompt_caching,
+            **_llm_options(cfg, provider),
+        )
+        print(f"✅ {label.capitalize()} LLM initialized ({provider}/{model})\n")
+        return llm
+    except Exception as e:
+        print(f"⚠️  Failed to initialize {label} LLM: {str(e)}")
+        print("   Using main LLM instead\n")
+        return None
+
+
+def _resolve_llm(
+    cfg: Config, provider: str | None, model: str | None
+) -> tuple[str, str]:
+    """
+    Resolve a provider/model override against the main LLM settings.
+
+    Args:
+        cfg: Configuration
+        provider: Provider override (None means main provider)
+        model: Model override (None means main/default model)
+
+    Returns:
+        Tuple of (provider, model)
+    """
+    provider = provider or cfg.llm_provider
+    if not model:
+        if provider.lower() == cfg.llm_provider.lower():
+            model = cfg.llm_model
+        else:
+            model = LLMFactory.get_default_model(provider)
+    return provider, model
+
+
+def _print_estimate(
+    cfg: Config,
+    job_desc_text: str,
+    cv_text: str,
+    supporting_docs: list[str],
+    previous_run: RunRecord | None,
+) -> None:
+    """
+    Print the projected tokens, cost and wall time of a run.
+
+    Args:
+        cfg: Configuration
+        job_desc_text: Job description text
+        cv_text: CV draft text
+        supporting_docs: Supporting document texts
+        previous_run: Run the optimization continues from, if any
+    """
+    translator = (cfg.llm_provider, cfg.llm_model)
+    if cfg.translation_llm_provider:
+        translator = (
+            cfg.translation_llm_provider,
+            cfg.translation_llm_model or cfg.llm_model,
+        )
+    llms = {
+        "reviewer": _resolve_llm(
+            cfg, cfg.reviewer_llm_provider, cfg.reviewer_llm_model
+        ),
+        "writer": _resolve_llm(cfg, cfg.writer_llm_provider, cfg.writer_llm_model),
+        "translator": translator,
+    }
+    worst = max(1, cfg.max_iterations)
+    iterations = {
+        "best": 1,
+        "typical": min(worst, cfg.get("dry_run.typical_iterations", 2)),
+        "worst": worst,
+    }
+
+    estimate = CostEstimator.from_config(cfg).estimate_run(
+        job_description=job_desc_text,
+        current_cv=previous_run.final_cv if previous_run else cv_text,
+        cv_draft=cv_text,
+        supporting_docs=supporting_docs,
+        llms=llms,
+        iterations=list(iterations.values()),
+        max_iterations=cfg.max_iterations,
+        candidates=cfg.optimizer_candidates,
+        translate_to=cfg.translation_target_language,
+    )
+
+    def cost(value: float | None) -> str:
+        return "unknown" if value is None else f"${value:.4f}"
+
+    print("\n" + "=" * 80)
+    print("DRY RUN - Estimate (no LLM calls)")
+    print("=" * 80)
+    print(
+        f"{'CALL':<16} {'LLM':<32} {'IN TOK':>8} {'OUT TOK':>8} {'COST':>10} {'TIME':>7}"
+    )
+    for call in estimate["calls"].values():
+        print(
+            f"{call['crew']:<16} {call['llm']:<32} {call['input_tokens']:>8,} "
+            f"{call['output_tokens']:>8,} {cost(call['cost']):>10} "
+            f"{call['seconds']:>6.1f}s"
+        )
+    print()
+    print(
+        f"{'SCENARIO':<9} {'IT':>2} {'CALLS':>5} {'IN TOK':>9} {'OUT TOK':>9} {'COST':>10} {'WALL':>7}"
+    )
+    for name, scenario in zip(iterations, estimate["scenarios"], strict=True):
+        print(
+            f"{name:<9} {scenario['iterations']:>2} {scenario['calls']:>5} "
+            f"{scenario['input_tokens']:>9,} {scenario['output_tokens']:>9,} "
+            f"{cost(scenario['cost']):>10} {scenario['seconds']:>6.0f}s"
+        )
+    typical = estimate["scenarios"][1]
+    if typical["cost"] is not None:
+        print(f"\nPer 100 runs (typical): ${typical['cost'] * 100:.2f}")
+    else:
+        unpriced = [
+            llm for llm, entry in typical["llms"].items() if entry["cost"] is None
+        ]
+        print(f"\n⚠️  No price for {', '.join(unpriced)} (set dry_run.prices)")
+    if (
+        cfg.get("optimizer.review_mode", "full") == "sections"
+        or cfg.get("optimizer.write_mode", "full") == "sections"
+    ):
+        print("⚠️  Section modes are estimated as whole-CV calls")
+    print("=" * 80 + "\n")
+
+
+def _llm_options(cfg: Config, provider: str) -> dict[str, Any]:
+    """
+    Get the configured client options for an LLM of the given provider.
+
+    Args:
+        cfg: Configuration
+        provider: Provider of the LLM
+
+    Returns:
+        Keyword arguments for LLMFactory.create_llm: client pooling, the
+        endpoint override for the main provider and the keep-alive for Ollama
+    """
+    options: dict[str, Any] = {"pooled": cfg.llm_client_pool}
+    if provider.lower() == cfg.llm_provider.lower():
+        options["base_url"] = cfg.llm_base_url
+    if provider.lower() == "ollama":
+        options["keep_alive"] = cfg.ollama_keep_alive
+    return options
+
+
+def _ollama_models(cfg: Config) -> list[OllamaModel]:
+    """
+    Get the Ollama models a run will call.
+
+    Args:
+        cfg: Configuration
+
+    Returns:
+        One OllamaModel per distinct Ollama model of the main, per-crew,
+        translation, routing and fallback LLMs
+    """
+    pairs = [(cfg.llm_provider, cfg.llm_model)]
+    for crew in ("reviewer", "writer"):
+        provider = cfg.get(f"crews.{crew}.llm_provider")
+        model = cfg.get(f"crews.{crew}.llm_model")
+        if provider or model:
+            pairs.append(_resolve_llm(cfg, provider, model))
+    if cfg.translation_target_language and cfg.translation_llm_provider:
+        pairs.append(
+            (cfg.translation_llm_provider, cfg.translation_llm_model or cfg.llm_model)
+        )
+    if cfg.routing_enabled:
+        pairs.append(
+            _resolve_llm(cfg, cfg.routing_fast_llm_provider, cfg.routing_fast_llm_model)
+        )
+    if cfg.hedging_enabled and cfg.hedging_fallback_provider:
+        pairs.append(
+            (
+                cfg.hedging_fallback_provider,
+                cfg.hedging_fallback_model
+                or LLMFactory.get_default_model(cfg.hedging_fallback_provider),
+            )
+        )
+
+    models = dict.fromkeys(
+        model for provider, model in pairs if provider.lower() == "ollama"
+    )
+    return [
+        OllamaModel(
+            model,
+            base_url=_llm_options(cfg, "ollama").get("base_url"),
+            keep_alive=cfg.ollama_keep_alive,
+            timeout=cfg.get("ollama.probe_timeout_seconds", 5.0),
+        )
+        for model in models
+    ]
+
+
+def _create_candidate_llms(cfg: Config) -> list[Any]:
+    """
+    Create writer LLMs with varied temperature for best-of-N writing.
+
+    Providers accepting a sampling seed (OpenAI, Ollama) also get a distinct
+    seed per candidate.
+
+    Args:
+        cfg: Configuration
+
+    Returns:
+        List of LLM instances (one per candidate)
+    """
+    count = cfg.optimizer_candidates
+    provider, model = _resolve_llm(cfg, cfg.writer_llm_provider, cfg.writer_llm_model)
+
+    temperatures = cfg.get("optimizer.candidate_temperatures") or [
+        min(1.0, max(0.0, cfg.llm_temperature + (i - (count - 1) / 2) * 0.2))
+        for i in range(count)
+    ]
+
+    llms = []
+    for i in range(count):
+        kwargs = {}
+        # Only some providers accept a sampling seed
+        if provider.lower() in ("openai", "ollama"):
+            kwargs["seed"] = i
+        llms.append(
+            LLMFactory.create_llm(
+                provider=provider,
+                model=model,
+                temperature=temperatures[i % len(temperatures)],
+                prompt_caching=cfg.llm_prompt_caching,
+                **_llm_options(cfg, provider),
+                **kwargs,
+            )
+        )
+    return llms
+
+
+def _job_label(job_description: str) -> str:
+    """
+    Derive a short label for a job description source.
+
+    Args:
+        job_description: Job description file path or URL
+
+    Returns:
+        URL as given, or the file name without extension
+    """
+    if job_description.startswith(("http://", "https://")):
+        return job_description
+    return Path(job_description).stem
+
+
+def _build_run_record(
+    cfg: Config,
+    flow: CVOptimizationFlow,
+    run_id: str,
+    started_at: datetime,
+    candidate: str,
+    job: str,
+    output_files: list[str],
+    memo_key: str = "",
+    parent_run_id: str = "",
+) -> RunRecord:
+    """
+    Build the run store record for a finished flow.
+
+    Args:
+        cfg: Configuration
+        flow: Finished optimization flow
+        run_id: Run id
+        started_at: Start time of the flow
+        candidate: Candidate label
+        job: Job label
+        output_files: Paths of written output files
+        memo_key: Memo key of the run inputs
+        parent_run_id: Run the optimization continued from, if any
+
+    Returns:
+        RunRecord instance
+    """
+    state = flow.state
+    cv_hash = content_hash(state.cv_draft)
+    job_hash = content_hash(state.job_description)
+    translations = {}
+    if state.translated_cv and state.translate_to:
+        translations[state.translate_to] = state.translated_cv
+
+    return RunRecord(
+        run_id=run_id,
+        created_at=started_at,
+        candidate=candidate,
+        job=job,
+        cv_hash=cv_hash,
+        job_hash=job_hash,
+        inputs_hash=content_hash(
+            cv_hash, job_hash, *state.supporting_docs, config_hash(cfg.config)
+        ),
+        memo_key=memo_key,
+        parent_run_id=parent_run_id,
+        status=state.status,
+        final_decision=state.final_decision,
+        iterations=state.iteration_count,
+        config=cfg.config,
+        timings=state.timings,
+        cv_draft=state.cv_draft,
+        job_description=state.job_description,
+        final_cv=state.current_cv,
+        translations=translations,
+        feedback_history=state.feedback_history,
+        output_files=output_files,
+    )
+
+
+@click.command()
+@click.option("--candidate", help="Filter by candidate (CV file name or CV hash)")
+@click.option("--job", help="Filter by job (file name, URL or job hash)")
+@click.option(
+    "--since",
+    type=click.DateTime(formats=["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S"]),
+    help="Only runs started on or after this date",
+)
+@click.option("--limit", type=int, default=20, help="Maximum number of runs to list")
+@click.option("--show", "show_run", help="Print the final CV of a run id")
+@click.option(
+    "--config",
+    type=click.Path(exists=True),
+    help="Path to config file",
+)
+def runs(
+    candidate: str | None,
+    job: str | None,
+    since: datetime | None,
+    limit: int,
+    show_run: str | None,
+    config: str | None,
+):
+    """List recorded optimization runs."""
+    cfg = Config(config_file=config)
+    if not Path(cfg.runs_database).exists():
+        raise click.ClickException(f"No run store found at {cfg.runs_database}")
+    store = RunStore(cfg.runs_database)
+
+    if show_run:
+        record = store.get_run(show_run)
+        if record is None:
+            raise click.ClickException(f"Run not found: {show_run}")
+        print(record.final_cv)
+        return
+
+    found = store.find_runs(candidate=candidate, job=job, since=since, limit=limit)
+    if not found:
+        print("No runs found.")
+        return
+
+    print(f"{'RUN ID':<25} {'STARTED':<19} {'STATUS':<22} {'IT':>2}  CANDIDATE / JOB")
+    for run in found:
+        started = run["created_at"][:19].replace("T", " ")
+        print(
+            f"{run['run_id']:<25} {started:<19} {run['status']:<22} "
+            f"{run['iterations']:>2}  {run['candidate']} / {run['job']}"
+        )
+
+
+@click.command()
+@click.option(
+    "--job-description",
+    "-j",
+    required=True,
+    help="Job description source (file path or URL)",
+)
+@click.option("--cv", "-c", required=True, help="CV file path")
+@click.option("--runs", "run_count", type=int, default=20, help="Number of runs")
+@click.option(
+    "--concurrency", type=int, default=4, help="Number of runs at the same time"
+)
+@click.option("--max-iterations", type=int, default=2, help="Review iterations per run")
+@click.option(
+    "--latency",
+    type=float,
+    default=0.5,
+    help="Stub server seconds before the first token",
+)
+@click.option(
+    "--tokens-per-second",
+    type=float,
+    default=200.0,
+    help="Stub server generation speed",
+)
+@click.option(
+    "--throttle-rate",
+    type=float,
+    default=0.0,
+    help="Fraction of stub requests rejected with HTTP 429 (0-1)",
+)
+@click.option(
+    "--approve-rate",
+    type=float,
+    default=0.5,
+    help="Probability that a stub review approves the CV (0-1)",
+)
+@click.option(
+    "--rate-limit/--no-rate-limit",
+    default=None,
+    help="Share a client-side rate limiter (see rate_limits config)",
+)
+@click.option(
+    "--client-pool/--no-client-pool",
+    default=None,
+    help="Share LLM clients and HTTP connections across runs (see llm config)",
+)
+@click.option("--seed", type=int, help="Random seed of the stub server")
+@click.option(
+    "--config",
+    type=click.Path(exists=True),
+    help="Path to config file",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Show the flows' output")
+def loadtest(
+    job_description: str,
+    cv: str,
+    run_count: int,
+    concurrency: int,
+    max_iterations: int,
+    latency: float,
+    tokens_per_second: float,
+    throttle_rate: float,
+    approve_rate: float,
+    rate_limit: bool | None,
+    client_pool: bool | None,
+    seed: int | None,
+    config: str | None,
+    verbose: bool,
+):
+    """Load-test the optimization flow against a local stub LLM server."""
+    from cv_writer.loadtest import StubLLMServer, run_load_test
+
+    cfg = Config(config_file=config)
+    if rate_limit is not None:
+        cfg.set("rate_limits.enabled", rate_limit)
+    if client_pool is not None:
+        cfg.set("llm.client_pool", client_pool)
+    LLMFactory.configure_pool(max_connections=cfg.get("llm.max_connections", 20))
+
+    try:
+        job_desc_text = DocumentParser.parse_source(
+            job_description,
+            timeout=cfg.get("timeouts.scraper_seconds", 30.0),
+        )
+        cv_text = DocumentParser.parse_file(cv)
+    except Exception as e:
+        raise click.ClickException(f"Failed to load inputs: {str(e)}") from e
+
+    server = StubLLMServer(
+        latency=latency,
+        tokens_per_second=tokens_per_second,
+        throttle_rate=throttle_rate,
+        approve_rate=approve_rate,
+        seed=seed,
+    )
+    with server:
+        # The stub accepts any key, but the OpenAI client requires one
+        os.environ.setdefault("OPENAI_API_KEY", "stub")
+        llm = LLMFactory.create_llm(
+            provider="openai",
+            model=cfg.llm_model,
+            temperature=cfg.llm_temperature,
+            base_url=server.url,
+            pooled=cfg.llm_client_pool,
+        )
+        rate_limiter = RateLimiter.from_config(cfg) if cfg.rate_limits_enabled else None
+        hedging_policy = HedgingPolicy.from_config(cfg) if cfg.hedging_enabled else None
+
+        def make_flow() -> CVOptimizationFlow:
+            return CVOptimizationFlow(
+                llm,
+                rate_limiter=rate_limiter,
+                hedging=hedging_policy,
+                call_timeout=cfg.get("timeouts.llm_call_seconds"),
+            )
+
+        print(
+            f"Load test: {run_count} runs, {concurrency} concurrent, "
+            f"stub server at {server.url}"
+        )
+        calls_before = LLM_CALLS.snapshot()
+        report = run_load_test(
+            make_flow,
+            job_desc_text,
+            cv_text,
+            runs=run_count,
+            concurrency=concurrency,
+            max_iterations=max_iterations,
+            quiet=not verbose,
+        )
+        for key, values in LLM_CALLS.snapshot().items():
+            delta = values[0] - calls_before.get(key, [0.0])[0]
+            if delta:
+                outcome = key[LLM_CALLS.labelnames.index("outcome")]
+                report.llm_calls[outcome] = report.llm_calls.get(outcome, 0) + delta
+        report.server_stats = server.stats()
+
+    print("\n" + "=" * 80)
+    print("LOAD TEST SUMMARY")
+    print("=" * 80)
+    print(report.summary())
+    print("=" * 80 + "\n")
+
+
+@click.command()
+@click.pass_context
+@click.option("--cv", "-c", required=True, help="CV file path")
+@click.option(
+    "--job-description",
+    "-j",
+    "job_descriptions",
+    multiple=True,
+    help="Job description source (file path or URL); repeat for several jobs",
+)
+@click.option(
+    "--jobs-file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Text file with one job description source per line",
+)
+@click.option(
+    "--method",
+    type=click.Choice(RANKING_METHODS, case_sensitive=False),
+    help="Job fit measure (see ranking config)",
+)
+@click.option(
+    "--top-k", "-k", type=click.IntRange(min=1), help="Length of the shortlist"
+)
+@click.option(
+    "--optimize",
+    is_flag=True,
+    help="Run the CV optimization for every job on the shortlist",
+)
+@click.option("--max-iterations", type=int, help="Maximum optimization iterations")
+@click.option(
+    "--config",
+    type=click.Path(exists=True),
+    help="Path to config file",
+)
+def rank(
+    ctx: click.Context,
+    cv: str,
+    job_descriptions: tuple,
+    jobs_file: str | None,
+    method: str | None,
+    top_k: int | None,
+    optimize: bool,
+    max_iterations: int | None,
+    config: str | None,
+):
+    """Rank many job descriptions by fit with a CV, without calling any LLM."""
+    cfg = Config(config_file=config)
+    top_k = top_k or cfg.get("ranking.top_k", 10)
+
+    sources = list(job_descriptions)
+    if jobs_file:
+        with open(jobs_file, encoding="utf-8") as f:
+            sources += [
+                line.strip()
+                for line in f
+                if line.strip() and not line.lstrip().startswith("#")
+            ]
+    sources = list(dict.fromkeys(sources))
+    if not sources:
+        raise click.ClickException("No job descriptions given (use -j or --jobs-file)")
+
+    try:
+        ranker = JobRanker.from_config(cfg, method=method)
+        cv_text = DocumentParser.parse_file(cv)
+    except Exception as e:
+        raise click.ClickException(str(e)) from e
+
+    print(f"Loading {len(sources)} job description(s)...")
+    started = time.monotonic()
+    jobs = _parse_jobs(cfg, sources)
+    print(f"✅ {len(jobs)} loaded in {time.monotonic() - started:.1f}s\n")
+    if not jobs:
+        raise click.ClickException("No job description could be loaded")
+
+    started = time.monotonic()
+    shortlist = ranker.rank(cv_text, list(jobs.values()), top_k=top_k)
+    seconds = time.monotonic() - started
+
+    labels = list(jobs)
+    print("=" * 80)
+    print(f"JOB FIT RANKING ({ranker.method}, {len(jobs)} jobs in {seconds:.2f}s)")
+    print("=" * 80)
+    print(f"{'#':>3} {'SCORE':>7}  JOB / MATCHING KEYWORDS")
+    for position, match in enumerate(shortlist, 1):
+        print(
+            f"{position:>3} {match['score']:>7.3f}  {_job_label(labels[match['index']])}"
+        )
+        if match["keywords"]:
+            print(f"{'':>13}{', '.join(match['keywords'])}")
+    print("=" * 80 + "\n")
+
+    if not optimize:
+        return
+    for position, match in enumerate(shortlist, 1):
+        source = labels[match["index"]]
+        print(f"Optimizing for job {position}/{len(shortlist)}: {_job_label(source)}")
+        try:
+            ctx.invoke(
+                main,
+                job_description=source,
+                cv=cv,
+                config=config,
+                max_iterations=max_iterations,
+            )
+        except click.ClickException as e:
+            print(f"⚠️  Optimization failed: {e.format_message()}\n")
+
+
+def _parse_jobs(cfg: Config, sources: list[str]) -> dict[str, str]:
+    """
+    Parse job descriptions concurrently, skipping those that fail.
+
+    Args:
+        cfg: Configuration
+        sources: Job description file paths or URLs
+
+    Returns:
+        Job description texts by source, in the order of the sources
+    """
+    timeout = cfg.get("timeouts.scraper_seconds", 30.0)
+
+    def parse(source: str) -> str | None:
+        try:
+            return DocumentParser.parse_source(source, timeout=timeout)
+        except Exception as e:
+            print(f"⚠️  Failed to load {source}: {str(e)}")
+            return None
+
+    workers = max(1, cfg.get("ranking.fetch_concurrency", 8))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        texts = list(executor.map(parse, sources))
+    return {
+        source: text
+        for source, text in zip(sources, texts, strict=True)
+        if text is not None
+    }
 
 
 def plot():
@@ -1,5 +1,10 @@
 """State models for CV Optimizer."""
 
-from cv_writer.models.state_models import CVOptimizerState, ReviewFeedback
+from cv_writer.models.state_models import (
+    CVOptimizerState,
+    RequirementProfile,
+    ReviewFeedback,
+    RunRecord,
+)
 
-__all__ = ["CVOptimizerState", "ReviewFeedback"]
+__all__ = ["CVOptimizerState", "RequirementProfile", "ReviewFeedback", "RunRecord"]
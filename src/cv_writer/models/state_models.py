@@ -11,11 +11,65 @@ class ReviewFeedback(BaseModel):
     iteration: int = Field(..., description="Iteration number")
     decision: str = Field(..., description="APPROVED or REVISE")
     comments: str = Field(..., description="Detailed feedback comments")
+    keyword_coverage: float | None = Field(
+        None, description="Local job keyword coverage of the reviewed CV (0-1)"
+    )
     timestamp: datetime = Field(
         default_factory=datetime.now, description="Timestamp of feedback"
     )
 
 
+class RequirementProfile(BaseModel):
+    """Model for the requirements extracted from a job description."""
+
+    title: str = Field("", description="Job title")
+    seniority: str = Field("", description="Seniority level (e.g. senior)")
+    min_years_experience: int | None = Field(
+        None, description="Minimum years of experience"
+    )
+    must_have: list[str] = Field(
+        default_factory=list, description="Required skills and qualifications"
+    )
+    nice_to_have: list[str] = Field(
+        default_factory=list, description="Preferred skills and qualifications"
+    )
+    responsibilities: list[str] = Field(
+        default_factory=list, description="Main responsibilities"
+    )
+    keywords: list[str] = Field(
+        default_factory=list, description="Keywords a matching CV should mention"
+    )
+
+    def to_markdown(self) -> str:
+        """
+        Format the profile as compact markdown for crew prompts.
+
+        Returns:
+            Markdown text
+        """
+        lines = [f"# {self.title or 'Job Requirements'}"]
+        details = []
+        if self.seniority:
+            details.append(f"Seniority: {self.seniority}")
+        if self.min_years_experience is not None:
+            details.append(f"Experience: {self.min_years_experience}+ years")
+        if details:
+            lines.append(" | ".join(details))
+
+        for heading, items in (
+            ("Must have", self.must_have),
+            ("Nice to have", self.nice_to_have),
+            ("Responsibilities", self.responsibilities),
+        ):
+            if items:
+                lines.append(f"\n## {heading}")
+                lines.extend(f"- {item}" for item in items)
+        if self.keywords:
+            lines.append("\n## Keywords")
+            lines.append(", ".join(self.keywords))
+        return "\n".join(lines)
+
+
 class CVOptimizerState(BaseModel):
     """State model for CV optimization flow."""
 
@@ -26,6 +80,17 @@ class CVOptimizerState(BaseModel):
         default_factory=list, description="Additional supporting documents"
     )
 
+    # Previous run (incremental re-optimization)
+    previous_cv: str = Field(
+        "", description="Optimized CV of the run this run continues from"
+    )
+    previous_cv_draft: str = Field(
+        "", description="Original CV draft of the run this run continues from"
+    )
+    draft_changes: str = Field(
+        "", description="Edits to the original CV since the previous run"
+    )
+
     # Processing
     current_cv: str = Field("", description="Current version of CV being processed")
     iteration_count: int = Field(0, description="Current iteration number")
@@ -37,7 +102,13 @@ class CVOptimizerState(BaseModel):
     )
 
     # Status
-    status: str = Field("INITIALIZED", description="Current flow status")
+    status: str = Field(
+        "INITIALIZED",
+        description=(
+            "Current flow status (final: APPROVED, MAX_ITERATIONS_REACHED or "
+            "DEADLINE_REACHED)"
+        ),
+    )
     final_decision: str | None = Field(None, description="Final decision from reviewer")
 
     # Translation
@@ -46,4 +117,57 @@ class CVOptimizerState(BaseModel):
     )
     translated_cv: str | None = Field(None, description="Translated CV content")
 
+    # Job requirements
+    requirements: RequirementProfile | None = Field(
+        None, description="Requirement profile extracted from the job description"
+    )
+
+    # Profiling
+    timings: dict[str, float] = Field(
+        default_factory=dict, description="Seconds spent per flow phase"
+    )
+    prompt_reductions: list[dict] = Field(
+        default_factory=list,
+        description="Inputs trimmed or compressed to fit model context windows",
+    )
+
     model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class RunRecord(BaseModel):
+    """Model for a stored optimization run."""
+
+    run_id: str = Field(..., description="Unique run identifier")
+    created_at: datetime = Field(
+        default_factory=datetime.now, description="Start time of the run"
+    )
+    candidate: str = Field("", description="Candidate label (e.g. CV file name)")
+    job: str = Field("", description="Job label (e.g. job description source)")
+    cv_hash: str = Field("", description="Fingerprint of the original CV")
+    job_hash: str = Field("", description="Fingerprint of the job description")
+    inputs_hash: str = Field("", description="Fingerprint of all inputs and config")
+    memo_key: str = Field(
+        "", description="Fingerprint of inputs, result-relevant config and prompts"
+    )
+    parent_run_id: str = Field(
+        "", description="Run whose optimized CV this run started from"
+    )
+    status: str = Field("", description="Final flow status")
+    final_decision: str | None = Field(None, description="Final reviewer decision")
+    iterations: int = Field(0, description="Number of completed iterations")
+    config: dict = Field(default_factory=dict, description="Effective configuration")
+    timings: dict[str, float] = Field(
+        default_factory=dict, description="Seconds spent per phase"
+    )
+    cv_draft: str = Field("", description="Original CV draft")
+    job_description: str = Field("", description="Job description text")
+    final_cv: str = Field("", description="Final optimized CV")
+    translations: dict[str, str] = Field(
+        default_factory=dict, description="Translated CVs by language code"
+    )
+    feedback_history: list[ReviewFeedback] = Field(
+        default_factory=list, description="Reviewer feedback of all iterations"
+    )
+    output_files: list[str] = Field(
+        default_factory=list, description="Paths of files written for the run"
+    )
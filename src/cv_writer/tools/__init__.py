@@ -1,13 +1,19 @@
 """Tools for document processing."""
 
 from cv_writer.tools.document_parser import DocumentParser
+from cv_writer.tools.job_ranker import JobRanker
+from cv_writer.tools.keyword_scorer import KeywordCoverageScorer
 from cv_writer.tools.pdf_reader import PDFReaderTool, read_pdf
+from cv_writer.tools.requirement_extractor import RequirementExtractor
 from cv_writer.tools.web_scraper import WebScraperTool, scrape_web_page
 
 __all__ = [
     "DocumentParser",
+    "JobRanker",
+    "KeywordCoverageScorer",
     "PDFReaderTool",
     "read_pdf",
+    "RequirementExtractor",
     "WebScraperTool",
     "scrape_web_page",
 ]
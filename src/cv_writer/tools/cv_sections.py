@@ -0,0 +1,184 @@
+"""Split markdown CVs into segments for translation and comparison."""
+
+import difflib
+import re
+from collections import Counter
+
+_HEADING = re.compile(r"^#{1,6}\s")
+_SECTION_HEADING = re.compile(r"^(#{1,6})\s+(.+?)[ \t#]*$")
+_LIST_ITEM = re.compile(r"^ ?(?:[-*+]|\d+[.)])\s")
+_MARKER = re.compile(r"^[ \t]*<!--\s*seg:(\d+)\s*-->[ \t]*$", re.MULTILINE)
+
+
+def split_segments(text: str) -> list[tuple[str, str]]:
+    """
+    Split a markdown document into segments.
+
+    A segment is a heading, a top-level list item (with its nested lines) or
+    a paragraph. Each segment is returned with the whitespace that follows
+    it, so joining all pairs restores the document exactly.
+
+    Args:
+        text: Markdown text
+
+    Returns:
+        List of (segment text, trailing whitespace) pairs
+    """
+    segments: list[tuple[str, str]] = []
+    lines: list[str] = []
+    gap = ""
+    after_heading = False
+
+    def flush() -> None:
+        nonlocal lines, gap
+        if lines or gap:
+            content = "".join(lines)
+            body = content.rstrip("\r\n")
+            segments.append((body, content[len(body) :] + gap))
+        lines, gap = [], ""
+
+    for line in text.splitlines(keepends=True):
+        if not line.strip():
+            gap += line
+            continue
+        is_heading = bool(_HEADING.match(line))
+        if gap or is_heading or after_heading or _LIST_ITEM.match(line):
+            flush()
+        lines.append(line)
+        after_heading = is_heading
+    flush()
+    return segments
+
+
+def split_sections(text: str) -> list[tuple[str, str]]:
+    """
+    Split a markdown CV into its top-level sections.
+
+    The section level is the highest heading level that occurs more than
+    once (a single top heading is usually the candidate's name and starts
+    the header section). Text before the first heading forms a section
+    with an empty title. Joining all section texts restores the document.
+
+    Args:
+        text: Markdown text
+
+    Returns:
+        List of (section title, section text including its heading) pairs
+    """
+    lines = text.splitlines(keepends=True)
+    headings = [_SECTION_HEADING.match(line) for line in lines]
+    levels = Counter(len(match.group(1)) for match in headings if match)
+    if not levels:
+        return [("", text)] if text else []
+    level = min(
+        (lvl for lvl, count in levels.items() if count > 1), default=min(levels)
+    )
+
+    sections: list[tuple[str, str]] = []
+    title = ""
+    current: list[str] = []
+    for line, match in zip(lines, headings, strict=True):
+        if match and len(match.group(1)) <= level:
+            if current:
+                sections.append((title, "".join(current)))
+            title, current = match.group(2).strip(), []
+        current.append(line)
+    if current:
+        sections.append((title, "".join(current)))
+    return sections
+
+
+def section_keys(sections: list[tuple[str, str]]) -> list[tuple[str, int]]:
+    """
+    Key sections by title so they can be matched across CV versions.
+
+    Repeated titles are told apart by their occurrence.
+
+    Args:
+        sections: List of (section title, section text) pairs
+
+    Returns:
+        (lowercased title, occurrence) pair of each section
+    """
+    seen: Counter[str] = Counter()
+    keys = []
+    for title, _ in sections:
+        keys.append((title.lower(), seen[title.lower()]))
+        seen[title.lower()] += 1
+    return keys
+
+
+def join_segments(segments: list[tuple[str, str]]) -> str:
+    """
+    Join segments produced by split_segments.
+
+    Args:
+        segments: List of (segment text, trailing whitespace) pairs
+
+    Returns:
+        Markdown text
+    """
+    return "".join(body + separator for body, separator in segments)
+
+
+def diff_segments(old: str, new: str) -> tuple[list[str], list[str]]:
+    """
+    Compare two versions of a document segment by segment.
+
+    Args:
+        old: Previous version
+        new: New version
+
+    Returns:
+        Tuple of (segments added or changed in the new version, segments of
+        the old version that were removed or replaced), in document order
+    """
+    old_segments = [body for body, _ in split_segments(old) if body.strip()]
+    new_segments = [body for body, _ in split_segments(new) if body.strip()]
+    matcher = difflib.SequenceMatcher(a=old_segments, b=new_segments, autojunk=False)
+    added: list[str] = []
+    removed: list[str] = []
+    for tag, old_start, old_end, new_start, new_end in matcher.get_opcodes():
+        if tag != "equal":
+            removed += old_segments[old_start:old_end]
+            added += new_segments[new_start:new_end]
+    return added, removed
+
+
+def mark_segments(segments: dict[int, str]) -> str:
+    """
+    Build a document with a ``<!-- seg:N -->`` marker before every segment.
+
+    Args:
+        segments: Segment texts by segment index
+
+    Returns:
+        Marked document
+    """
+    return "\n\n".join(f"<!-- seg:{i} -->\n{text}" for i, text in segments.items())
+
+
+def parse_marked(text: str) -> dict[int, str]:
+    """
+    Split a marked document (e.g. its translation) back into segments.
+
+    Text before the first marker is ignored.
+
+    Args:
+        text: Document containing ``<!-- seg:N -->`` markers
+
+    Returns:
+        Segment texts by segment index
+
+    Raises:
+        ValueError: If the document contains no markers or a marker twice
+    """
+    parts = _MARKER.split(text)
+    if len(parts) < 3:
+        raise ValueError("No segment markers found")
+    segments: dict[int, str] = {}
+    for index, body in zip(parts[1::2], parts[2::2], strict=True):
+        if int(index) in segments:
+            raise ValueError(f"Segment marker {index} found twice")
+        segments[int(index)] = body.strip("\r\n").rstrip()
+    return segments
@@ -4,6 +4,10 @@ from pathlib import Path
 
 from cv_writer.tools.pdf_reader import read_pdf
 from cv_writer.tools.web_scraper import scrape_web_page
+from cv_writer.utils.metrics import DOCUMENT_PARSE_SECONDS, ERRORS
+
+# Supported file suffixes; also the source labels of the parse metrics
+_SUFFIXES = (".txt", ".md", ".markdown", ".pdf")
 
 
 class DocumentParser:
@@ -26,6 +30,17 @@ class DocumentParser:
             FileNotFoundError: If file doesn't exist
             ValueError: If file format is unsupported or parsing fails
         """
+        suffix = Path(file_path).suffix.lower()
+        source = suffix.lstrip(".") if suffix in _SUFFIXES else "other"
+        with (
+            DOCUMENT_PARSE_SECONDS.time(source=source),
+            ERRORS.count_exceptions(component="document_parser"),
+        ):
+            return DocumentParser._read_file(file_path)
+
+    @staticmethod
+    def _read_file(file_path: str) -> str:
+        """Read the text of a supported file (see parse_file)."""
         path = Path(file_path)
 
         if not path.exists():
@@ -55,12 +70,13 @@ class DocumentParser:
             )
 
     @staticmethod
-    def parse_source(source: str) -> str:
+    def parse_source(source: str, timeout: float = 30) -> str:
         """
         Parse a source that can be either a file path or URL.
 
         Args:
             source: File path or URL
+            timeout: Request timeout in seconds for URLs
 
         Returns:
             Extracted text content
@@ -70,7 +86,11 @@ class DocumentParser:
         """
         # Check if it's a URL
         if source.startswith(("http://", "https://")):
-            return scrape_web_page(source)
+            with (
+                DOCUMENT_PARSE_SECONDS.time(source="url"),
+                ERRORS.count_exceptions(component="scraper"),
+            ):
+                return scrape_web_page(source, timeout=timeout)
 
         # Otherwise treat as file path
         return DocumentParser.parse_file(source)
@@ -0,0 +1,214 @@
+"""Local ranking of many job descriptions by how well a CV fits them."""
+
+from collections import Counter
+from typing import Any
+
+import numpy as np
+
+from cv_writer.tools.keyword_scorer import _terms
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+METHODS = ("tfidf", "bm25", "embedding")
+
+
+class JobRanker:
+    """
+    Rank job descriptions by their similarity to a CV without any LLM call.
+
+    Texts are reduced to stemmed words and phrases as in keyword coverage
+    scoring. All postings form one corpus, stored as a sparse term matrix
+    in coordinate form (row, column and count arrays), so document
+    frequencies, weights and scores of all postings are a few vectorized
+    NumPy operations:
+
+    - "tfidf": cosine similarity of sublinear TF-IDF vectors (0 - 1)
+    - "bm25": Okapi BM25 of the postings for the CV's distinct terms
+    - "embedding": cosine similarity of sentence embeddings from a local
+      sentence-transformers model (optional dependency)
+    """
+
+    def __init__(
+        self,
+        method: str = "tfidf",
+        k1: float = 1.2,
+        b: float = 0.75,
+        embedding_model: str = "all-MiniLM-L6-v2",
+        max_keywords: int = 5,
+    ):
+        """
+        Initialize ranker.
+
+        Args:
+            method: Similarity measure ("tfidf", "bm25" or "embedding")
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization (0 - 1)
+            embedding_model: sentence-transformers model name or path
+            max_keywords: Matching keywords reported per job
+
+        Raises:
+            ValueError: If the method is unknown or the embedding method is
+                chosen without sentence-transformers installed
+        """
+        method = method.lower()
+        if method not in METHODS:
+            raise ValueError(
+                f"Unknown ranking method '{method}' (use one of {METHODS})"
+            )
+        if method == "embedding" and SentenceTransformer is None:
+            raise ValueError(
+                "sentence-transformers is not installed. Install it with: "
+                "pip install sentence-transformers"
+            )
+        self.method = method
+        self.k1 = k1
+        self.b = b
+        self.embedding_model = embedding_model
+        self.max_keywords = max_keywords
+        self._encoder: Any = None
+
+    @classmethod
+    def from_config(cls, config: Any, method: str | None = None) -> "JobRanker":
+        """
+        Create a ranker from the ``ranking`` config section.
+
+        Args:
+            config: Config instance
+            method: Method overriding the configured one
+
+        Returns:
+            JobRanker instance
+        """
+        return cls(
+            method=method or config.get("ranking.method", "tfidf"),
+            embedding_model=config.get("ranking.embedding_model", "all-MiniLM-L6-v2"),
+        )
+
+    def rank(
+        self, cv_text: str, job_texts: list[str], top_k: int | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Rank job descriptions by fit, best first.
+
+        Args:
+            cv_text: CV content
+            job_texts: Job description texts
+            top_k: Length of the shortlist (all jobs if None)
+
+        Returns:
+            List of dictionaries with the job ``index`` in job_texts, its
+            ``score`` and the CV ``keywords`` contributing most to it
+        """
+        if not job_texts:
+            return []
+        index = _TermIndex(cv_text, job_texts)
+        if self.method == "embedding":
+            index.tfidf()  # Only for the keywords
+            scores = self._embedding_scores(cv_text, job_texts)
+        elif self.method == "bm25":
+            scores = index.bm25(self.k1, self.b)
+        else:
+            scores = index.tfidf()
+
+        # Stable sort keeps input order among equal scores
+        order = np.argsort(-scores, kind="stable")[:top_k]
+        return [
+            {
+                "index": int(row),
+                "score": float(scores[row]),
+                "keywords": index.keywords(int(row), self.max_keywords),
+            }
+            for row in order
+        ]
+
+    def _embedding_scores(self, cv_text: str, job_texts: list[str]) -> np.ndarray:
+        """Compute cosine similarities of sentence embeddings."""
+        if self._encoder is None:
+            self._encoder = SentenceTransformer(self.embedding_model)
+        vectors = self._encoder.encode(
+            [cv_text, *job_texts], normalize_embeddings=True, convert_to_numpy=True
+        )
+        return vectors[1:] @ vectors[0]
+
+
+class _TermIndex:
+    """Sparse term matrix of job postings plus the CV's term vector."""
+
+    def __init__(self, cv_text: str, job_texts: list[str]):
+        cv_terms = _terms(cv_text)
+        cv_counts = Counter(term for term, _ in cv_terms)
+        surfaces: dict[str, Counter[str]] = {}
+        for term, surface in cv_terms:
+            surfaces.setdefault(term, Counter())[surface] += 1
+        self._surfaces = {
+            term: counts.most_common(1)[0][0] for term, counts in surfaces.items()
+        }
+
+        vocabulary: dict[str, int] = {term: i for i, term in enumerate(cv_counts)}
+        rows: list[int] = []
+        columns: list[int] = []
+        counts: list[int] = []
+        for row, text in enumerate(job_texts):
+            for term, count in Counter(term for term, _ in _terms(text)).items():
+                rows.append(row)
+                columns.append(vocabulary.setdefault(term, len(vocabulary)))
+                counts.append(count)
+
+        self.terms = list(vocabulary)
+        self.n_jobs = len(job_texts)
+        self.rows = np.array(rows, dtype=np.int64)
+        self.columns = np.array(columns, dtype=np.int64)
+        self.counts = np.array(counts, dtype=float)
+        # Each (row, column) pair occurs once, so counting columns gives the
+        # document frequency of every term
+        self.df = np.bincount(self.columns, minlength=len(vocabulary))
+        self.query = np.zeros(len(vocabulary))
+        self.query[: len(cv_counts)] = list(cv_counts.values())
+        self._contributions = np.zeros(len(self.rows))
+
+    def _sum_rows(self, values: np.ndarray) -> np.ndarray:
+        """Sum per-entry values into one value per job."""
+        return np.bincount(self.rows, weights=values, minlength=self.n_jobs)
+
+    def tfidf(self) -> np.ndarray:
+        """Cosine similarities of sublinear TF-IDF vectors."""
+        idf = np.log((1 + self.n_jobs) / (1 + self.df)) + 1
+        weights = (1 + np.log(self.counts)) * idf[self.columns]
+        query = np.zeros_like(self.query)
+        present = self.query > 0
+        query[present] = (1 + np.log(self.query[present])) * idf[present]
+
+        self._contributions = weights * query[self.columns]
+        norms = np.sqrt(self._sum_rows(weights**2)) * np.linalg.norm(query)
+        return np.divide(
+            self._sum_rows(self._contributions),
+            norms,
+            out=np.zeros(self.n_jobs),
+            where=norms > 0,
+        )
+
+    def bm25(self, k1: float, b: float) -> np.ndarray:
+        """BM25 scores of the jobs for the CV's distinct terms."""
+        idf = np.log(1 + (self.n_jobs - self.df + 0.5) / (self.df + 0.5))
+        lengths = self._sum_rows(self.counts)
+        average = lengths.mean() or 1.0
+        saturation = (
+            self.counts
+            * (k1 + 1)
+            / (self.counts + k1 * (1 - b + b * lengths[self.rows] / average))
+        )
+        self._contributions = (
+            idf[self.columns] * saturation * (self.query[self.columns] > 0)
+        )
+        return self._sum_rows(self._contributions)
+
+    def keywords(self, row: int, limit: int) -> list[str]:
+        """List the CV keywords contributing most to a job's lexical score."""
+        # Entries are stored row by row
+        start, end = np.searchsorted(self.rows, [row, row + 1])
+        entries = np.arange(start, end)[self._contributions[start:end] > 0]
+        entries = entries[np.argsort(-self._contributions[entries], kind="stable")]
+        return [self._surfaces[self.terms[self.columns[i]]] for i in entries[:limit]]
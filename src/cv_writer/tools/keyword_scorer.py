@@ -0,0 +1,330 @@
+"""Local keyword coverage scoring of CVs against a job description."""
+
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable
+
+import numpy as np
+
+# Common English words that carry no meaning as job keywords
+_STOPWORD_TEXT = """
+a about above after again all also am an and any are as at be because been
+before being below between both but by can could did do does doing down
+during each etc few for from further had has have having he her here hers
+him his how i if in into is it its itself just least let like made make
+many may me might more most must my no nor not now of off on once only or
+other our ours out over own per please same shall she should so some such
+than that the their theirs them then there these they this those through
+to too under until up upon us very via was we well were what when where
+which while who whom why will with within without would you your yours
+able ability across based including join looking strong team work working
+years year role position candidate candidates company experience re ll ve
+apply applying applicant closely cv description desired equivalent etc
+familiarity field inc key knowledge leading llc location ltd gmbh offer
+opportunity opportunities plus preferred proficiency related required
+requirement requirements responsibilities responsibility resume seeking
+skill skills solid talented type understanding use using
+"""
+STOPWORDS = frozenset(_STOPWORD_TEXT.split())
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[.\-][a-z0-9+#]+)*")
+_CASED_TOKEN_PATTERN = re.compile(_TOKEN_PATTERN.pattern, re.IGNORECASE)
+
+# "Label: value" lines such as headings ("Requirements:") or posting metadata
+# ("Location: Remote")
+_LABEL = re.compile(r"^\s*#*\s*([A-Za-z][\w '’/&()-]{0,40}?)\s*:\s*(.*)$")
+_BULLET = re.compile(r"^\s*(?:[-*•·▪–]|\d+[.)])\s+")
+# Labels whose value names the employer, which is no CV keyword
+_EMPLOYER_LABELS = frozenset(["company", "employer", "organization", "organisation"])
+
+# Weight factor of named terms (technologies, products, certifications)
+_NAMED_TERM_BOOST = 2.0
+
+# Suffixes removed by the stemmer, longest first, with their replacement
+_SUFFIXES = [
+    ("izations", ""),
+    ("ization", ""),
+    ("ations", ""),
+    ("ation", ""),
+    ("ments", ""),
+    ("ment", ""),
+    ("ings", ""),
+    ("ing", ""),
+    ("ies", "y"),
+    ("ied", "y"),
+    ("ed", ""),
+    ("es", ""),
+    ("s", ""),
+]
+_MIN_STEM = 3
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase keyword tokens.
+
+    Keeps technology names such as "c++", "c#", "node.js" or "ci-cd" intact
+    and drops stopwords and single characters.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens in document order
+    """
+    return [
+        token
+        for token in _TOKEN_PATTERN.findall(text.lower())
+        if len(token) > 1 and token not in STOPWORDS and not token.isdigit()
+    ]
+
+
+def stem(token: str) -> str:
+    """
+    Reduce a token to a crude stem so inflections match.
+
+    "managed", "manages" and "management" all become "manag". Technology
+    names containing digits or symbols (e.g. "node.js", "python3") are kept
+    as they are.
+
+    Args:
+        token: Lowercase token
+
+    Returns:
+        Stemmed token
+    """
+    if not token.isalpha():
+        return token
+    for suffix, replacement in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= _MIN_STEM:
+            if suffix == "s" and token.endswith(("ss", "us")):
+                continue
+            token = token[: -len(suffix)] + replacement
+            break
+    if token.endswith("e") and len(token) > _MIN_STEM:
+        token = token[:-1]
+    return token
+
+
+def _terms(text: str) -> list[tuple[str, str]]:
+    """
+    Extract stemmed unigram and bigram terms with their surface forms.
+
+    Bigrams are only formed from adjacent keyword tokens, so a stopword or
+    punctuation between two words breaks the phrase.
+
+    Args:
+        text: Text to analyze
+
+    Returns:
+        List of (term, surface form) pairs in document order
+    """
+    terms = []
+    previous: tuple[str, str] | None = None
+    position = 0
+    lowered = text.lower()
+    for match in _TOKEN_PATTERN.finditer(lowered):
+        token = match.group()
+        gap = lowered[position : match.start()]
+        position = match.end()
+        if len(token) <= 1 or token in STOPWORDS or token.isdigit():
+            previous = None
+            continue
+        term = stem(token)
+        if previous is not None and gap.strip() == "":
+            terms.append((f"{previous[0]} {term}", f"{previous[1]} {token}"))
+        terms.append((term, token))
+        previous = (term, token)
+    return terms
+
+
+def _named_terms(text: str) -> set[str]:
+    """
+    Find stemmed terms written like names somewhere in a text.
+
+    Technologies and products are usually capitalized ("Python", "AWS") or
+    contain symbols ("c++", "node.js"). Capitals at the start of a line,
+    list item or sentence say nothing, so such tokens are not counted.
+
+    Args:
+        text: Text to analyze
+
+    Returns:
+        Set of stemmed terms
+    """
+    named = set()
+    for line in text.splitlines():
+        for match in _CASED_TOKEN_PATTERN.finditer(line):
+            token = match.group()
+            lowered = token.lower()
+            if (
+                len(lowered) <= 1
+                or lowered in STOPWORDS
+                or not any(c.isalpha() for c in lowered)
+            ):
+                continue
+            prefix = _BULLET.sub("", line[: match.start()]).strip("#> \t")
+            sentence_start = not prefix or prefix.endswith((".", "!", "?", ":"))
+            if (lowered != token and not sentence_start) or any(
+                symbol in lowered for symbol in "+#."
+            ):
+                named.add(stem(lowered))
+    return named
+
+
+def _keyword_lines(job_description: str) -> tuple[list[str], set[str]]:
+    """
+    Split a job description into the lines that can hold keywords.
+
+    Headings ("Key Responsibilities:") are skipped, as is the employer's
+    name ("Company: TechCorp"), whose terms are returned separately so that
+    they can be excluded everywhere.
+
+    Args:
+        job_description: Job description text
+
+    Returns:
+        Tuple of (lines, stemmed terms of the employer's name)
+    """
+    lines = []
+    employer: set[str] = set()
+    for line in job_description.splitlines():
+        match = None if _BULLET.match(line) else _LABEL.match(line)
+        if match and len(match.group(1).split()) <= 4:
+            label, value = match.group(1).strip().lower(), match.group(2)
+            if label in _EMPLOYER_LABELS:
+                employer.update(term for term, _ in _terms(value))
+                continue
+            if not value.strip():
+                continue
+        if line.strip():
+            lines.append(line)
+    return lines, employer
+
+
+class KeywordCoverageScorer:
+    """
+    Score how well a CV covers the keywords of a job description.
+
+    Job keywords are stemmed words plus phrases (adjacent word pairs) that
+    occur at least twice. Headings, posting metadata, the employer's name and
+    job-ad boilerplate ("responsibilities", "seeking") are ignored. Each
+    keyword is weighted by TF-IDF, treating the lines of the job description
+    as documents: sublinear term frequency rewards repetition, and the
+    inverse line frequency discounts words that appear everywhere in the
+    posting. Named terms (e.g. "Python", "AWS") get twice the weight, as
+    most words of a posting occur once and would otherwise tie. Coverage is
+    the weight share of job keywords present in a CV, computed for many CVs
+    at once with one matrix product.
+    """
+
+    def __init__(self, job_description: str, max_keywords: int = 50):
+        """
+        Initialize scorer with the highest weighted job description keywords.
+
+        Args:
+            job_description: Job description text
+            max_keywords: Maximum number of keywords to consider
+        """
+        lines, employer = _keyword_lines(job_description)
+        named = _named_terms("\n".join(lines))
+        term_lines = [
+            [(term, surface) for term, surface in _terms(line) if term not in employer]
+            for line in lines
+        ]
+
+        counts: Counter[str] = Counter()
+        line_counts: Counter[str] = Counter()
+        surfaces: dict[str, Counter[str]] = {}
+        for line_terms in term_lines:
+            counts.update(term for term, _ in line_terms)
+            line_counts.update({term for term, _ in line_terms})
+            for term, surface in line_terms:
+                surfaces.setdefault(term, Counter())[surface] += 1
+
+        # Phrases occurring once are usually accidental word pairs
+        candidates = [term for term in counts if " " not in term or counts[term] > 1]
+        n_lines = len(lines)
+        weights = {
+            term: (1 + math.log(counts[term]))
+            * (math.log((1 + n_lines) / (1 + line_counts[term])) + 1)
+            * (_NAMED_TERM_BOOST if set(term.split()) <= named else 1.0)
+            for term in candidates
+        }
+        # Stable sort keeps document order among equal weights
+        self.terms = sorted(candidates, key=lambda term: -weights[term])[:max_keywords]
+        self.keywords = [surfaces[term].most_common(1)[0][0] for term in self.terms]
+        self.weights = np.array([weights[term] for term in self.terms], dtype=float)
+        # Sorted term array for vectorized lookups in presence()
+        self._order = np.argsort(np.array(self.terms, dtype=str))
+        self._sorted_terms = np.array(self.terms, dtype=str)[self._order]
+
+    def presence(self, cv_texts: Iterable[str]) -> np.ndarray:
+        """
+        Build the keyword presence matrix of CV texts.
+
+        Args:
+            cv_texts: CV contents
+
+        Returns:
+            Boolean matrix with one row per CV and one column per keyword
+        """
+        term_lists = [[term for term, _ in _terms(text)] for text in cv_texts]
+        matrix = np.zeros((len(term_lists), len(self.terms)), dtype=bool)
+        found = np.array([term for terms in term_lists for term in terms], dtype=str)
+        if not len(found) or not self.terms:
+            return matrix
+
+        # Look all CV terms up at once in the sorted keyword array
+        rows = np.repeat(np.arange(len(term_lists)), [len(t) for t in term_lists])
+        positions = np.searchsorted(self._sorted_terms, found)
+        positions = np.minimum(positions, len(self._sorted_terms) - 1)
+        known = self._sorted_terms[positions] == found
+        matrix[rows[known], self._order[positions[known]]] = True
+        return matrix
+
+    def score_many(self, cv_texts: Iterable[str]) -> np.ndarray:
+        """
+        Compute the keyword coverage of many CV versions in one batch.
+
+        Args:
+            cv_texts: CV contents
+
+        Returns:
+            Array of weighted coverage values (0.0 - 1.0), one per CV
+        """
+        matrix = self.presence(cv_texts)
+        total = self.weights.sum()
+        if total == 0:
+            return np.zeros(len(matrix))
+        return matrix @ self.weights / total
+
+    def score(self, cv_text: str) -> float:
+        """
+        Compute keyword coverage of a CV.
+
+        Args:
+            cv_text: CV content
+
+        Returns:
+            Weighted fraction of job keywords present in the CV (0.0 - 1.0)
+        """
+        return float(self.score_many([cv_text])[0])
+
+    def missing_keywords(self, cv_text: str) -> list[str]:
+        """
+        List job keywords that do not appear in a CV.
+
+        Args:
+            cv_text: CV content
+
+        Returns:
+            Missing keywords, highest weighted first
+        """
+        present = self.presence([cv_text])[0]
+        return [
+            keyword
+            for keyword, found in zip(self.keywords, present, strict=True)
+            if not found
+        ]
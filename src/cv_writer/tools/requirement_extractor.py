@@ -0,0 +1,285 @@
+"""Requirement profile extraction from job descriptions."""
+
+import json
+import re
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from cv_writer.models import RequirementProfile
+from cv_writer.tools.keyword_scorer import KeywordCoverageScorer
+from cv_writer.utils.file_handler import FileHandler
+from cv_writer.utils.fingerprint import content_hash
+
+# Bump when extraction logic changes to invalidate cached profiles
+EXTRACTOR_VERSION = "2"
+
+# Section headings by kind; checked in order, so specific kinds come first
+_SECTION_PATTERNS = [
+    (
+        "ignore",
+        re.compile(
+            r"about (?:us|the company)|who we are|benefits|we offer|perks|"
+            r"compensation|salary|equal opportunit|how to apply|why join|our company"
+        ),
+    ),
+    (
+        "nice_to_have",
+        re.compile(r"nice[- ]to[- ]have|bonus|preferred|plus|desirable|advantage"),
+    ),
+    (
+        "responsibilities",
+        re.compile(
+            r"responsibilit|what you(?:'|’)?ll do|what you will do|your role|"
+            r"the role|your tasks|duties|day to day"
+        ),
+    ),
+    (
+        "must_have",
+        re.compile(
+            r"requirement|required|qualification|must[- ]have|what you (?:bring|need|have)|"
+            r"you (?:have|bring)|skills|your profile|about you|who you are|experience"
+        ),
+    ),
+]
+
+_BULLET = re.compile(r"^\s*(?:[-*•·▪–]|\d+[.)])\s+")
+_NICE_MARKERS = re.compile(
+    r"\b(?:nice to have|bonus|preferred|a plus|is a plus|ideally)\b"
+)
+
+# Words frequent in requirement lists that make poor CV keywords
+_GENERIC_WORD_TEXT = """
+plus bonus knowledge understanding skills skill good great excellent solid
+proven new own build building ideally familiarity hands-on degree
+"""
+_GENERIC_WORDS = frozenset(_GENERIC_WORD_TEXT.split())
+
+_YEARS = re.compile(r"(\d{1,2})\s*\+?\s*(?:-\s*\d{1,2}\s*)?(?:years?|yrs)")
+_SENIORITY = [
+    ("principal", re.compile(r"\bprincipal\b")),
+    ("lead", re.compile(r"\b(?:lead|staff|head of)\b")),
+    ("senior", re.compile(r"\b(?:senior|sr\.?)\b")),
+    ("mid", re.compile(r"\b(?:mid[- ]level|intermediate)\b")),
+    ("junior", re.compile(r"\b(?:junior|jr\.?|entry[- ]level|graduate)\b")),
+    ("intern", re.compile(r"\b(?:intern|internship|working student)\b")),
+]
+
+
+def _heading_kind(line: str) -> str | None:
+    """Classify a line as a section heading, or return None."""
+    text = line.strip().lstrip("#").strip().rstrip(":").strip("*_ ").lower()
+    if not text or len(text) > 60 or _BULLET.match(line):
+        return None
+    if not (
+        line.lstrip().startswith("#") or line.rstrip().endswith(":") or len(text) < 40
+    ):
+        return None
+    for kind, pattern in _SECTION_PATTERNS:
+        if pattern.search(text):
+            return kind
+    return None
+
+
+def _clean_item(line: str) -> str:
+    """Strip bullets and markdown emphasis from a list item."""
+    return _BULLET.sub("", line).strip().strip("*_").strip()
+
+
+def extract_local(job_description: str, max_keywords: int = 30) -> RequirementProfile:
+    """
+    Extract a requirement profile with heuristics (no LLM call).
+
+    Lines are assigned to must-have, nice-to-have and responsibility sections
+    by their headings; company, benefits and legal sections are dropped.
+    Seniority and years of experience are detected with patterns.
+
+    Args:
+        job_description: Job description text
+        max_keywords: Maximum number of keywords to keep
+
+    Returns:
+        Requirement profile
+    """
+    lines = [line for line in job_description.splitlines() if line.strip()]
+    title = lines[0].strip().lstrip("#").strip() if lines else ""
+    if len(title) > 100 or _heading_kind(lines[0] if lines else "") is not None:
+        title = ""
+
+    sections: dict[str, list[str]] = {
+        "must_have": [],
+        "nice_to_have": [],
+        "responsibilities": [],
+    }
+    relevant: list[str] = []
+    current: str | None = None
+    for line in lines[1:] if title else lines:
+        kind = _heading_kind(line)
+        if kind is not None:
+            current = kind
+            continue
+        if current == "ignore":
+            continue
+        relevant.append(line)
+        item = _clean_item(line)
+        if current is None or not item or len(item) > 250:
+            continue
+        if current == "must_have" and _NICE_MARKERS.search(item.lower()):
+            sections["nice_to_have"].append(item)
+        else:
+            sections[current].append(item)
+
+    # Without recognizable sections, treat every bullet point as a requirement
+    if not any(sections.values()):
+        sections["must_have"] = [
+            _clean_item(line) for line in relevant if _BULLET.match(line)
+        ]
+
+    text = "\n".join([title, *relevant]).lower()
+    seniority = next(
+        (level for level, pattern in _SENIORITY if pattern.search(title.lower())),
+        next((level for level, pattern in _SENIORITY if pattern.search(text)), ""),
+    )
+    years = [int(match) for match in _YEARS.findall(text)]
+    keywords = [
+        keyword
+        for keyword in KeywordCoverageScorer(
+            "\n".join(relevant), 2 * max_keywords
+        ).keywords
+        if keyword not in _GENERIC_WORDS and any(c.isalpha() for c in keyword)
+    ]
+
+    return RequirementProfile(
+        title=title,
+        seniority=seniority,
+        min_years_experience=min(years) if years else None,
+        must_have=sections["must_have"],
+        nice_to_have=sections["nice_to_have"],
+        responsibilities=sections["responsibilities"],
+        keywords=keywords[:max_keywords],
+    )
+
+
+def parse_profile(raw: str) -> RequirementProfile:
+    """
+    Parse a requirement profile from an LLM answer containing JSON.
+
+    Args:
+        raw: LLM output (may contain text or code fences around the JSON)
+
+    Returns:
+        Requirement profile
+
+    Raises:
+        ValueError: If the answer contains no valid profile
+    """
+    start, end = raw.find("{"), raw.rfind("}")
+    if start < 0 or end < start:
+        raise ValueError("No JSON object found in requirements output")
+    try:
+        data = json.loads(raw[start : end + 1])
+        return RequirementProfile(**{k: v for k, v in data.items() if v is not None})
+    except (json.JSONDecodeError, ValidationError, AttributeError) as e:
+        raise ValueError(f"Invalid requirements output: {str(e)}") from e
+
+
+class RequirementExtractor:
+    """
+    Cached requirement profile extraction.
+
+    Profiles are cached by a hash of the job description content, the
+    extraction mode and (in LLM mode) the extraction model, in memory and (optionally) as JSON files, so a posting
+    shared by many CVs or runs is only analyzed once.
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None):
+        """
+        Initialize requirement extractor.
+
+        Args:
+            cache_dir: Directory for cached profiles (memory only if None)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._memory: dict[str, RequirementProfile] = {}
+        self._lock = threading.Lock()
+
+    def cache_key(self, job_description: str, mode: str, model: str = "") -> str:
+        """
+        Compute the cache key of a job description.
+
+        Args:
+            job_description: Job description text
+            mode: Extraction mode ("local" or "llm")
+            model: Extraction model ("provider/model") in "llm" mode
+
+        Returns:
+            Cache key
+        """
+        if mode != "llm":
+            model = ""
+        return content_hash(EXTRACTOR_VERSION, mode, model, job_description.strip())
+
+    def extract(
+        self,
+        job_description: str,
+        llm_extract: Callable[[str], str] | None = None,
+        model: str = "",
+    ) -> tuple[RequirementProfile, bool]:
+        """
+        Extract (or load) the requirement profile of a job description.
+
+        Args:
+            job_description: Job description text
+            llm_extract: Optional function sending the job description to an
+                LLM and returning its raw answer; local extraction if None
+            model: Model used by llm_extract ("provider/model"), so profiles
+                of different models are cached separately
+
+        Returns:
+            Tuple of (profile, whether it came from the cache)
+
+        Raises:
+            ValueError: If the LLM answer cannot be parsed
+        """
+        key = self.cache_key(job_description, "llm" if llm_extract else "local", model)
+        cached = self._load(key)
+        if cached is not None:
+            return cached, True
+
+        if llm_extract is None:
+            profile = extract_local(job_description)
+        else:
+            profile = parse_profile(llm_extract(job_description))
+
+        self._store(key, profile)
+        return profile, False
+
+    def _load(self, key: str) -> RequirementProfile | None:
+        """Load a profile from the memory or file cache."""
+        with self._lock:
+            if key in self._memory:
+                return self._memory[key]
+        if self.cache_dir is None:
+            return None
+        path = self.cache_dir / f"{key}.json"
+        try:
+            profile = RequirementProfile.model_validate_json(
+                path.read_text(encoding="utf-8")
+            )
+        except (OSError, ValidationError):
+            return None
+        with self._lock:
+            self._memory[key] = profile
+        return profile
+
+    def _store(self, key: str, profile: RequirementProfile) -> None:
+        """Store a profile in the memory and file cache."""
+        with self._lock:
+            self._memory[key] = profile
+        if self.cache_dir is not None:
+            FileHandler.ensure_directory(str(self.cache_dir))
+            FileHandler.write_atomic(
+                self.cache_dir / f"{key}.json", profile.model_dump_json(indent=2)
+            )
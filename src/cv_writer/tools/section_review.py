@@ -0,0 +1,181 @@
+"""Combine per-section CV reviews and map feedback to CV sections."""
+
+import re
+
+# Priorities of action items, most urgent first
+PRIORITIES = ("HIGH", "MEDIUM", "LOW")
+
+_DECISION = re.compile(r"DECISION:\s*(APPROVED|REVISE)", re.IGNORECASE)
+_ACTION_ITEM = re.compile(r"^\s*[-*]\s*\[(HIGH|MEDIUM|LOW)\]\s*(.+)$", re.IGNORECASE)
+# Action item of a combined review: "- [HIGH] **Skills**: Add Kubernetes"
+_LABELED_ITEM = re.compile(r"^- \[(HIGH|MEDIUM|LOW)\] \*\*(.+?)\*\*: ")
+# Item of free-form feedback: "- Add Docker", "2. Quantify results"
+_LIST_ITEM = re.compile(r"^(?:[-*+]|\d+[.)])\s")
+
+
+def is_approved(review: str) -> bool:
+    """
+    Check whether a review approves the reviewed text.
+
+    Args:
+        review: Review output
+
+    Returns:
+        True if the review contains "DECISION: APPROVED"
+    """
+    review_upper = review.upper()
+    return "DECISION: APPROVED" in review_upper or "DECISION:APPROVED" in review_upper
+
+
+def parse_action_items(review: str) -> list[tuple[str, str]]:
+    """
+    Extract prioritized action items from a section review.
+
+    Args:
+        review: Section review output
+
+    Returns:
+        List of (priority, action item) pairs in review order
+    """
+    items = []
+    for line in review.splitlines():
+        match = _ACTION_ITEM.match(line)
+        if match:
+            items.append((match.group(1).upper(), match.group(2).strip()))
+    return items
+
+
+def reduce_section_reviews(reviews: list[tuple[str, str]]) -> str:
+    """
+    Reduce section reviews into one review.
+
+    The CV is approved only if every section is approved. Action items of
+    all sections are merged into one list ordered by priority, each labeled
+    with its section.
+
+    Args:
+        reviews: List of (section title, section review) pairs in CV order
+
+    Returns:
+        Combined review starting with a "DECISION:" line
+    """
+    approved = [is_approved(review) for _, review in reviews]
+    items = []
+    for title, review in reviews:
+        for priority, text in parse_action_items(review):
+            items.append((PRIORITIES.index(priority), priority, title, text))
+    # Stable sort keeps CV order within each priority
+    items.sort(key=lambda item: item[0])
+
+    lines = [
+        f"DECISION: {'APPROVED' if all(approved) else 'REVISE'}",
+        "",
+        f"Section review: {sum(approved)} of {len(reviews)} sections approved.",
+    ]
+    if items:
+        lines += ["", "## Prioritized action items"]
+        lines += [
+            f"- [{priority}] **{title or 'Header'}**: {text}"
+            for _, priority, title, text in items
+        ]
+
+    # Remaining comments of sections needing changes (items are listed above)
+    notes = []
+    for (title, review), ok in zip(reviews, approved, strict=True):
+        comments = "\n".join(
+            line
+            for line in _DECISION.sub("", review, count=1).splitlines()
+            if not _ACTION_ITEM.match(line)
+        ).strip()
+        if not ok and comments:
+            notes += ["", f"### {title or 'Header'}", comments]
+    if notes:
+        lines += ["", "## Section comments", *notes]
+    return "\n".join(lines)
+
+
+def _map_feedback(
+    feedback: str, titles: list[str]
+) -> tuple[dict[str, list[str]], list[str]]:
+    """
+    Map reviewer feedback to CV sections.
+
+    Args:
+        feedback: Reviewer feedback
+        titles: Section titles of the CV
+
+    Returns:
+        Feedback lines by section title in CV order, and the action items
+        that concern no section
+    """
+    patterns = {
+        title: re.compile(rf"(?<!\w){re.escape(title)}(?!\w)", re.IGNORECASE)
+        for title in titles
+        if title
+    }
+    lowered = {title.lower(): title for title in patterns}
+    if "" in titles:
+        # reduce_section_reviews labels the untitled section "Header"
+        lowered.setdefault("header", "")
+    lines = [line.strip() for line in feedback.splitlines() if line.strip()]
+    labeled: dict[str, list[str]] = {}
+    mentioned: dict[str, list[str]] = {}
+    unlabeled: list[str] = []
+    unmentioned: list[str] = []
+    for line in lines:
+        label = _LABELED_ITEM.match(line)
+        if label:
+            title = lowered.get(label.group(2).lower())
+            if title is None:
+                unlabeled.append(line)
+            else:
+                labeled.setdefault(title, []).append(line)
+            continue
+        if line.startswith("#"):
+            continue
+        hits = [title for title, pattern in patterns.items() if pattern.search(line)]
+        for title in hits:
+            mentioned.setdefault(title, []).append(line)
+        if not hits and (_ACTION_ITEM.match(line) or _LIST_ITEM.match(line)):
+            unmentioned.append(line)
+
+    mapped, unmapped = (labeled, unlabeled) if labeled else (mentioned, unmentioned)
+    return {title: mapped[title] for title in titles if title in mapped}, unmapped
+
+
+def map_feedback_to_sections(feedback: str, titles: list[str]) -> dict[str, list[str]]:
+    """
+    Map reviewer feedback to the CV sections it concerns.
+
+    If the feedback is a combined section review, its action items are
+    mapped by their section label ("Header" is the untitled section).
+    Otherwise every feedback line is mapped to each section whose title it
+    mentions.
+
+    Args:
+        feedback: Reviewer feedback
+        titles: Section titles of the CV
+
+    Returns:
+        Feedback lines by section title, in CV order; sections without
+        feedback are left out
+    """
+    return _map_feedback(feedback, titles)[0]
+
+
+def unmapped_action_items(feedback: str, titles: list[str]) -> list[str]:
+    """
+    Find action items of reviewer feedback that concern no CV section.
+
+    These are labeled items whose label is no section title, or list items
+    of free-form feedback that mention no section title, such as "Mention
+    Kubernetes throughout".
+
+    Args:
+        feedback: Reviewer feedback
+        titles: Section titles of the CV
+
+    Returns:
+        Unmapped action item lines in feedback order
+    """
+    return _map_feedback(feedback, titles)[1]
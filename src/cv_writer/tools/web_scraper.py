@@ -11,7 +11,7 @@ except ImportError:
 class WebScraperTool:
     """Tool for scraping text content from web pages."""
 
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: float = 30):
         """
         Initialize web scraper.
 
@@ -77,7 +77,7 @@ class WebScraperTool:
             raise ValueError(f"Failed to parse content from URL {url}: {str(e)}") from e
 
 
-def scrape_web_page(url: str, timeout: int = 30) -> str:
+def scrape_web_page(url: str, timeout: float = 30) -> str:
     """
     Convenience function to scrape text from a web page.
 
@@ -1,6 +1,33 @@
 """Utility modules for CV Optimizer."""
 
+from cv_writer.utils.cassette import Cassette
+from cv_writer.utils.cost_estimator import CostEstimator
+from cv_writer.utils.deadline import Deadline
 from cv_writer.utils.file_handler import FileHandler
+from cv_writer.utils.hedging import HedgingPolicy
 from cv_writer.utils.llm_factory import LLMFactory
+from cv_writer.utils.llm_router import LLMRouter
+from cv_writer.utils.metrics import MetricsRegistry
+from cv_writer.utils.profiler import PhaseProfiler
+from cv_writer.utils.prompt_budget import PromptBudget
+from cv_writer.utils.rate_limiter import RateLimiter
+from cv_writer.utils.run_log import RunLog
+from cv_writer.utils.run_store import RunStore
+from cv_writer.utils.translation_memory import TranslationMemory
 
-__all__ = ["FileHandler", "LLMFactory"]
+__all__ = [
+    "Cassette",
+    "CostEstimator",
+    "Deadline",
+    "FileHandler",
+    "HedgingPolicy",
+    "LLMFactory",
+    "LLMRouter",
+    "MetricsRegistry",
+    "PhaseProfiler",
+    "PromptBudget",
+    "RateLimiter",
+    "RunLog",
+    "RunStore",
+    "TranslationMemory",
+]
@@ -0,0 +1,268 @@
+"""Record and replay of the LLM interactions of a run (cassettes)."""
+
+import builtins
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from cv_writer.utils.fingerprint import content_hash
+
+MODES = ("record", "replay")
+
+
+def inputs_hash(inputs: dict[str, Any]) -> str:
+    """
+    Hash the inputs of a crew call independent of their order.
+
+    Args:
+        inputs: Inputs for the crew's task templates
+
+    Returns:
+        Hex digest of the inputs
+    """
+    return content_hash(json.dumps(inputs, sort_keys=True, default=str))
+
+
+def _replayed_error(error: dict[str, Any]) -> Exception:
+    """Recreate a recorded error, keeping builtin types and HTTP status."""
+    error_type = getattr(builtins, error.get("type", ""), None)
+    if not (isinstance(error_type, type) and issubclass(error_type, Exception)):
+        error_type = RuntimeError
+    try:
+        exception = error_type(error.get("message", ""))
+    except Exception:
+        exception = RuntimeError(error.get("message", ""))
+    if error.get("status_code") is not None:
+        exception.status_code = error["status_code"]
+    return exception
+
+
+class Cassette:
+    """
+    LLM interactions of a run, recorded to or replayed from an NDJSON file.
+
+    In record mode every crew call is executed and appended to the file
+    with its inputs, output or error, token usage and timing. In replay
+    mode calls are answered from the file without contacting any model:
+    a call gets the next unused interaction with the same crew, LLM and
+    inputs or, if the inputs differ (e.g. after a prompt change), the next
+    unused interaction of the same crew in recorded order.
+    """
+
+    def __init__(
+        self, path: str | Path, mode: str = "record", latency_scale: float = 1.0
+    ):
+        """
+        Initialize cassette and open (record) or load (replay) its file.
+
+        Args:
+            path: Path to the NDJSON cassette file
+            mode: "record" or "replay"
+            latency_scale: Factor applied to recorded call durations in
+                replay mode (1.0 = original latency, 0 = no delay)
+
+        Raises:
+            ValueError: If the mode is unknown
+            FileNotFoundError: If the cassette to replay does not exist
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode '{mode}' (use one of {MODES})")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency_scale = max(0.0, latency_scale)
+        self.matches = {"exact": 0, "fallback": 0}
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._seq = 0
+        self._file = None
+
+        if mode == "record":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "w", encoding="utf-8")  # noqa: SIM115
+            self.interactions: list[dict[str, Any]] = []
+        else:
+            # Replay in the order the calls started
+            self.interactions = sorted(
+                self.read(self.path), key=lambda i: i.get("offset", 0.0)
+            )
+        self._used: set[int] = set()
+        self._by_key: dict[tuple[str, str, str], deque[int]] = {}
+        self._by_crew: dict[str, deque[int]] = {}
+        for index, interaction in enumerate(self.interactions):
+            key = (interaction["crew"], interaction["llm"], interaction["inputs_hash"])
+            self._by_key.setdefault(key, deque()).append(index)
+            self._by_crew.setdefault(interaction["crew"], deque()).append(index)
+
+    def wrap(
+        self, crew: str, llm: str, inputs: dict[str, Any], call: Callable[[], Any]
+    ) -> Callable[[], Any]:
+        """
+        Wrap a crew call so that it is recorded or replayed.
+
+        Args:
+            crew: Crew class name
+            llm: "provider/model" of the LLM
+            inputs: Inputs for the crew's task templates
+            call: Zero-argument callable running the crew
+
+        Returns:
+            Zero-argument callable returning the crew output
+        """
+        if self.mode == "record":
+            return lambda: self.record(crew, llm, inputs, call)
+        return lambda: self.replay(crew, llm, inputs)
+
+    def record(
+        self, crew: str, llm: str, inputs: dict[str, Any], call: Callable[[], Any]
+    ) -> Any:
+        """
+        Run a crew call and append it to the cassette.
+
+        Args:
+            crew: Crew class name
+            llm: "provider/model" of the LLM
+            inputs: Inputs for the crew's task templates
+            call: Zero-argument callable running the crew
+
+        Returns:
+            Result of the call (errors are recorded and re-raised)
+        """
+        offset = time.monotonic() - self._started
+        started = time.monotonic()
+        interaction = {
+            "crew": crew,
+            "llm": llm,
+            "inputs_hash": inputs_hash(inputs),
+            "inputs": inputs,
+            "offset": round(offset, 4),
+        }
+        try:
+            result = call()
+        except Exception as e:
+            interaction["seconds"] = round(time.monotonic() - started, 4)
+            interaction["error"] = {
+                "type": type(e).__name__,
+                "message": str(e),
+                "status_code": getattr(e, "status_code", None),
+            }
+            self._write(interaction)
+            raise
+        interaction["seconds"] = round(time.monotonic() - started, 4)
+        interaction["output"] = result.raw if hasattr(result, "raw") else str(result)
+        usage = getattr(result, "token_usage", None)
+        if hasattr(usage, "model_dump"):
+            usage = usage.model_dump()
+        interaction["token_usage"] = usage if isinstance(usage, dict) else None
+        self._write(interaction)
+        return result
+
+    def replay(self, crew: str, llm: str, inputs: dict[str, Any]) -> Any:
+        """
+        Answer a crew call from the cassette.
+
+        Waits for the recorded duration (scaled by ``latency_scale``), then
+        returns the recorded output or raises the recorded error.
+
+        Args:
+            crew: Crew class name
+            llm: "provider/model" of the LLM
+            inputs: Inputs for the crew's task templates
+
+        Returns:
+            Crew output with ``raw`` text and ``token_usage``
+
+        Raises:
+            LookupError: If no recorded interaction of the crew is left
+        """
+        with self._lock:
+            index = self._next((crew, llm, inputs_hash(inputs)), "exact")
+            if index is None:
+                index = self._next(crew, "fallback")
+            if index is None:
+                raise LookupError(
+                    f"No recorded {crew} call left in cassette {self.path}"
+                )
+        interaction = self.interactions[index]
+
+        delay = interaction.get("seconds", 0.0) * self.latency_scale
+        if delay > 0:
+            time.sleep(delay)
+        if interaction.get("error"):
+            raise _replayed_error(interaction["error"])
+        usage = interaction.get("token_usage")
+        return SimpleNamespace(
+            raw=interaction.get("output", ""),
+            token_usage=SimpleNamespace(**usage) if usage else None,
+        )
+
+    def _next(self, key: Any, match: str) -> int | None:
+        """Take the first unused interaction of a queue (caller holds the lock)."""
+        queue = (self._by_key if match == "exact" else self._by_crew).get(key)
+        while queue:
+            index = queue.popleft()
+            if index not in self._used:
+                self._used.add(index)
+                self.matches[match] += 1
+                return index
+        return None
+
+    def _write(self, interaction: dict[str, Any]) -> None:
+        """Append an interaction with its sequence number and timestamp."""
+        with self._lock:
+            if self._file is None or self._file.closed:
+                return
+            self._seq += 1
+            record = {
+                "seq": self._seq,
+                "ts": datetime.now().isoformat(),
+                **interaction,
+            }
+            self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            self._file.flush()
+            self.interactions.append(record)
+
+    @property
+    def remaining(self) -> int:
+        """Number of recorded interactions not replayed yet (replay mode)."""
+        with self._lock:
+            return len(self.interactions) - len(self._used)
+
+    def close(self) -> None:
+        """Close the cassette file (record mode)."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+
+    def __enter__(self) -> "Cassette":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @staticmethod
+    def read(path: str | Path) -> list[dict[str, Any]]:
+        """
+        Read all complete interactions of a cassette file.
+
+        A partially written last line (e.g. from a crashed run) is skipped.
+
+        Args:
+            path: Path to the NDJSON cassette file
+
+        Returns:
+            List of interactions in the order their calls finished
+        """
+        interactions = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    interactions.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return interactions
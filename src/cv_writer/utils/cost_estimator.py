@@ -0,0 +1,320 @@
+"""Token, cost and latency estimates of a run without calling any LLM."""
+
+import sys
+from pathlib import Path
+from typing import Any
+
+import yaml
+from crewai.utilities.i18n import I18N
+from crewai.utilities.string_utils import interpolate_only
+
+from cv_writer.crews import ReviewerCrew, WriterCrew
+from cv_writer.crews.translator_crew import TranslatorCrew
+from cv_writer.utils.prompt_budget import count_tokens
+
+# List prices in USD per million tokens by "provider/model" prefix; the
+# longest match wins. Prices change, so override them in dry_run.prices.
+DEFAULT_PRICES = {
+    "openai/gpt-4o": {"input": 2.50, "output": 10.00},
+    "openai/gpt-4o-mini": {"input": 0.15, "output": 0.60},
+    "openai/gpt-4.1": {"input": 2.00, "output": 8.00},
+    "openai/gpt-4.1-mini": {"input": 0.40, "output": 1.60},
+    "openai/gpt-4.1-nano": {"input": 0.10, "output": 0.40},
+    "openai/gpt-4-turbo": {"input": 10.00, "output": 30.00},
+    "openai/gpt-4": {"input": 30.00, "output": 60.00},
+    "openai/gpt-3.5-turbo": {"input": 0.50, "output": 1.50},
+    "openai/gpt-5": {"input": 1.25, "output": 10.00},
+    "openai/gpt-5-mini": {"input": 0.25, "output": 2.00},
+    "openai/gpt-5-nano": {"input": 0.05, "output": 0.40},
+    "openai/o1": {"input": 15.00, "output": 60.00},
+    "openai/o3": {"input": 2.00, "output": 8.00},
+    "openai/o4-mini": {"input": 1.10, "output": 4.40},
+    "anthropic/claude-sonnet-4": {"input": 3.00, "output": 15.00},
+    "anthropic/claude-3-7-sonnet": {"input": 3.00, "output": 15.00},
+    "anthropic/claude-3-5-sonnet": {"input": 3.00, "output": 15.00},
+    "anthropic/claude-opus-4": {"input": 15.00, "output": 75.00},
+    "anthropic/claude-3-opus": {"input": 15.00, "output": 75.00},
+    "anthropic/claude-haiku-4": {"input": 1.00, "output": 5.00},
+    "anthropic/claude-3-5-haiku": {"input": 0.80, "output": 4.00},
+    "ollama": {"input": 0.0, "output": 0.0},
+}
+
+# Typical latency by "provider/model" prefix: time to first token, prompt
+# processing and generation speed (tokens per second)
+DEFAULT_LATENCIES = {
+    "openai": {"first_token": 0.8, "prompt_tps": 5_000, "output_tps": 70},
+    "openai/gpt-4o-mini": {"first_token": 0.5, "prompt_tps": 8_000, "output_tps": 100},
+    "openai/gpt-5": {"first_token": 3.0, "prompt_tps": 5_000, "output_tps": 60},
+    "openai/o1": {"first_token": 8.0, "prompt_tps": 5_000, "output_tps": 60},
+    "openai/o3": {"first_token": 5.0, "prompt_tps": 5_000, "output_tps": 70},
+    "anthropic": {"first_token": 1.2, "prompt_tps": 4_000, "output_tps": 55},
+    "anthropic/claude-opus": {
+        "first_token": 2.0,
+        "prompt_tps": 3_000,
+        "output_tps": 35,
+    },
+    "anthropic/claude-haiku": {
+        "first_token": 0.7,
+        "prompt_tps": 6_000,
+        "output_tps": 110,
+    },
+    "ollama": {"first_token": 0.3, "prompt_tps": 400, "output_tps": 20},
+}
+
+FALLBACK_LATENCY = {"first_token": 1.0, "prompt_tps": 3_000, "output_tps": 50}
+
+# Translations of European languages run longer than the English source
+TRANSLATION_EXPANSION = 1.2
+
+
+def _lookup(table: dict[str, Any], provider: str, model: str) -> Any | None:
+    """Look up a "provider/model" key by its longest matching prefix."""
+    key = f"{provider}/{model}".lower()
+    matches = [prefix for prefix in table if key.startswith(prefix)]
+    if not matches:
+        return None
+    return table[max(matches, key=len)]
+
+
+def render_prompt(crew_class: type, inputs: dict[str, Any]) -> str:
+    """
+    Render the prompt a crew sends for its task.
+
+    Fills the crew's YAML templates with the inputs and frames them with
+    crewai's system and task prompts, as the agent does without tools.
+
+    Args:
+        crew_class: Crew class whose templates are rendered
+        inputs: Inputs for the crew's task templates
+
+    Returns:
+        System and user prompt text
+    """
+    config_dir = Path(sys.modules[crew_class.__module__].__file__).parent / "config"
+    agents = yaml.safe_load((config_dir / "agents.yaml").read_text(encoding="utf-8"))
+    tasks = yaml.safe_load((config_dir / "tasks.yaml").read_text(encoding="utf-8"))
+    i18n = I18N()
+
+    parts = []
+    for task in tasks.values():
+        agent = agents[task["agent"]]
+        system = i18n.slice("role_playing").format(
+            role=agent["role"].strip(),
+            goal=agent["goal"].strip(),
+            backstory=agent["backstory"].strip(),
+        )
+        task_text = interpolate_only(task["description"], inputs)
+        task_text += i18n.slice("expected_output").format(
+            expected_output=interpolate_only(task["expected_output"], inputs)
+        )
+        parts += [
+            system + i18n.slice("no_tools"),
+            i18n.slice("task").format(input=task_text),
+        ]
+    return "\n".join(parts)
+
+
+class CostEstimator:
+    """
+    Projects tokens, cost and wall time of a run from its rendered prompts.
+
+    Prompts are rendered from the crew templates with the actual inputs and
+    counted with the model's tokenizer. Answers are estimated: a revision is
+    as long as the CV, a translation somewhat longer, and a review has a
+    fixed size. Every revision is assumed to be reviewed and the CV length
+    to stay constant.
+    """
+
+    def __init__(
+        self,
+        prices: dict[str, dict[str, float]] | None = None,
+        latencies: dict[str, dict[str, float]] | None = None,
+        review_output_tokens: int = 700,
+    ):
+        """
+        Initialize estimator.
+
+        Args:
+            prices: Price overrides in USD per million input/output tokens
+                by "provider/model" prefix
+            latencies: Latency overrides (first_token seconds, prompt_tps,
+                output_tps) by "provider/model" prefix
+            review_output_tokens: Expected length of a review
+        """
+        self.prices = {**DEFAULT_PRICES, **(prices or {})}
+        self.latencies = {**DEFAULT_LATENCIES, **(latencies or {})}
+        self.review_output_tokens = review_output_tokens
+
+    @classmethod
+    def from_config(cls, config: Any) -> "CostEstimator":
+        """
+        Create an estimator from the ``dry_run`` config section.
+
+        Args:
+            config: Config instance
+
+        Returns:
+            CostEstimator instance
+        """
+        return cls(
+            prices=config.get("dry_run.prices", None),
+            latencies=config.get("dry_run.latencies", None),
+            review_output_tokens=config.get("dry_run.review_output_tokens", 700),
+        )
+
+    def estimate_call(
+        self,
+        crew_class: type,
+        llm: tuple[str, str],
+        inputs: dict[str, Any],
+        output_tokens: int,
+        extra_input_tokens: int = 0,
+    ) -> dict[str, Any]:
+        """
+        Estimate one crew call.
+
+        Args:
+            crew_class: Crew class to call
+            llm: (provider, model) of the LLM
+            inputs: Inputs for the crew's task templates
+            output_tokens: Expected answer length
+            extra_input_tokens: Tokens of inputs left empty when rendering
+
+        Returns:
+            Dictionary with crew, llm, input and output tokens, cost in USD
+            (None if the model has no price) and latency in seconds
+        """
+        provider, model = llm
+        input_tokens = (
+            count_tokens(render_prompt(crew_class, inputs), model) + extra_input_tokens
+        )
+        price = _lookup(self.prices, provider, model)
+        latency = _lookup(self.latencies, provider, model) or FALLBACK_LATENCY
+        return {
+            "crew": crew_class.__name__,
+            "llm": f"{provider}/{model}",
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cost": (
+                None
+                if price is None
+                else (input_tokens * price["input"] + output_tokens * price["output"])
+                / 1_000_000
+            ),
+            "seconds": latency["first_token"]
+            + input_tokens / latency["prompt_tps"]
+            + output_tokens / latency["output_tps"],
+        }
+
+    def estimate_run(
+        self,
+        job_description: str,
+        current_cv: str,
+        cv_draft: str,
+        supporting_docs: list[str],
+        llms: dict[str, tuple[str, str]],
+        iterations: list[int],
+        max_iterations: int,
+        candidates: int = 1,
+        translate_to: str | None = None,
+        draft_changes: str = "None (first optimization of this CV).",
+    ) -> dict[str, Any]:
+        """
+        Estimate a run for several iteration counts.
+
+        A run with n iterations makes n reviews and n - 1 revisions (each
+        with ``candidates`` concurrent writer calls), plus one translation.
+
+        Args:
+            job_description: Job description text
+            current_cv: CV the run starts from
+            cv_draft: Original CV draft
+            supporting_docs: Supporting document texts
+            llms: (provider, model) by role ("reviewer", "writer",
+                "translator")
+            iterations: Iteration counts to estimate (e.g. best, typical
+                and worst case)
+            max_iterations: Configured maximum iterations
+            candidates: Writer candidates per revision
+            translate_to: Target language, if the CV is translated
+            draft_changes: Changes of the CV draft since a previous run
+
+        Returns:
+            Dictionary with the estimated ``calls`` (one per crew) and one
+            ``scenarios`` entry per iteration count with calls, tokens and
+            cost by LLM, total cost and wall time
+        """
+        if supporting_docs:
+            docs_text = "\n\n".join(
+                f"Document {i + 1}:\n{doc}" for i, doc in enumerate(supporting_docs)
+            )
+        else:
+            docs_text = "No additional documents provided."
+        inputs = {
+            "job_description": job_description,
+            "current_cv": current_cv,
+            "cv_draft": cv_draft,
+            "supporting_docs": docs_text,
+            "draft_changes": draft_changes,
+            "iteration_count": 1,
+            "max_iterations": max_iterations,
+            "latest_feedback": "",
+        }
+        cv_tokens = count_tokens(current_cv, llms["writer"][1])
+
+        calls = {
+            "review": self.estimate_call(
+                ReviewerCrew, llms["reviewer"], inputs, self.review_output_tokens
+            ),
+            "write": self.estimate_call(
+                WriterCrew,
+                llms["writer"],
+                inputs,
+                cv_tokens,
+                extra_input_tokens=self.review_output_tokens,
+            ),
+        }
+        if translate_to:
+            calls["translate"] = self.estimate_call(
+                TranslatorCrew,
+                llms["translator"],
+                {"cv_content": current_cv, "target_language": translate_to},
+                int(cv_tokens * TRANSLATION_EXPANSION),
+            )
+
+        scenarios = []
+        for count in iterations:
+            counts = {
+                "review": count,
+                "write": (count - 1) * max(1, candidates),
+                "translate": 1 if translate_to else 0,
+            }
+            by_llm: dict[str, dict[str, Any]] = {}
+            for phase, call in calls.items():
+                entry = by_llm.setdefault(
+                    call["llm"],
+                    {"calls": 0, "input_tokens": 0, "output_tokens": 0, "cost": 0.0},
+                )
+                entry["calls"] += counts[phase]
+                entry["input_tokens"] += counts[phase] * call["input_tokens"]
+                entry["output_tokens"] += counts[phase] * call["output_tokens"]
+                if entry["cost"] is not None and call["cost"] is not None:
+                    entry["cost"] += counts[phase] * call["cost"]
+                elif counts[phase]:
+                    entry["cost"] = None
+            costs = [entry["cost"] for entry in by_llm.values()]
+            scenarios.append(
+                {
+                    "iterations": count,
+                    "llms": by_llm,
+                    "calls": sum(entry["calls"] for entry in by_llm.values()),
+                    "input_tokens": sum(e["input_tokens"] for e in by_llm.values()),
+                    "output_tokens": sum(e["output_tokens"] for e in by_llm.values()),
+                    "cost": None if None in costs else sum(costs),
+                    # Writer candidates run concurrently
+                    "seconds": count * calls["review"]["seconds"]
+                    + (count - 1) * calls["write"]["seconds"]
+                    + (calls["translate"]["seconds"] if translate_to else 0.0),
+                }
+            )
+        return {"calls": calls, "scenarios": scenarios}
@@ -0,0 +1,134 @@
+"""Per-call timeouts and wall-clock run deadlines."""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def call_with_timeout(
+    fn: Callable[[], T], timeout: float | None, name: str = "Call"
+) -> T:
+    """
+    Run a call and stop waiting for it after a timeout.
+
+    The call runs in a daemon thread, so an abandoned call (e.g. a hung
+    provider connection) never blocks the caller or interpreter exit.
+
+    Args:
+        fn: Zero-argument callable
+        timeout: Seconds to wait; no limit if None
+        name: Call name used in the error message
+
+    Returns:
+        Result of fn()
+
+    Raises:
+        TimeoutError: If the call did not finish in time
+    """
+    if timeout is None:
+        return fn()
+
+    outcome: dict[str, object] = {}
+    done = threading.Event()
+
+    def run() -> None:
+        try:
+            outcome["result"] = fn()
+        except BaseException as e:
+            outcome["error"] = e
+        finally:
+            done.set()
+
+    threading.Thread(target=run, name=f"timeout-{name}", daemon=True).start()
+    if not done.wait(max(0.0, timeout)):
+        raise TimeoutError(f"{name} did not finish within {timeout:.0f}s")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+class Deadline:
+    """
+    Wall-clock budget of a run.
+
+    Tracks the time left and the observed duration of each flow phase, so
+    the flow can tell whether another phase still fits before the deadline.
+    Estimates are the longest observed duration, which keeps SLOs safe
+    against latency spikes.
+    """
+
+    def __init__(self, seconds: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize deadline starting now.
+
+        Args:
+            seconds: Budget in seconds
+            clock: Time source (injectable for testing)
+        """
+        self.seconds = seconds
+        self.clock = clock
+        self.expires_at = clock() + seconds
+        self._durations: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def remaining(self) -> float:
+        """Seconds left until the deadline (0 if expired)."""
+        return max(0.0, self.expires_at - self.clock())
+
+    def expired(self) -> bool:
+        """Check whether the deadline has passed."""
+        return self.remaining() <= 0
+
+    def timeout(self, call_timeout: float | None = None) -> float:
+        """
+        Get the timeout for a call that must finish before the deadline.
+
+        Args:
+            call_timeout: Per-call timeout, if any
+
+        Returns:
+            Seconds the call may take
+
+        Raises:
+            TimeoutError: If the deadline has already passed
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise TimeoutError(f"Run deadline of {self.seconds:.0f}s reached")
+        return remaining if call_timeout is None else min(call_timeout, remaining)
+
+    def record(self, phase: str, seconds: float) -> None:
+        """Record the duration of a completed phase."""
+        with self._lock:
+            self._durations[phase] = max(self._durations.get(phase, 0.0), seconds)
+
+    def estimate(self, phase: str) -> float:
+        """
+        Estimate the duration of a phase.
+
+        Args:
+            phase: Phase name (e.g. "review")
+
+        Returns:
+            Longest observed duration of the phase, or of any phase if it
+            has not been observed yet (0 if nothing was observed)
+        """
+        with self._lock:
+            if phase in self._durations:
+                return self._durations[phase]
+            return max(self._durations.values(), default=0.0)
+
+    def fits(self, *phases: str) -> bool:
+        """
+        Check whether the given phases are expected to finish in time.
+
+        Args:
+            *phases: Phase names run one after another
+
+        Returns:
+            True if their estimated total fits into the remaining time
+        """
+        return sum(self.estimate(phase) for phase in phases) < self.remaining()
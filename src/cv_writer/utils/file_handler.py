@@ -1,5 +1,8 @@
 """File handling utilities for CV Optimizer."""
 
+import contextlib
+import os
+import uuid
 from datetime import datetime
 from pathlib import Path
 
@@ -23,40 +26,112 @@ class FileHandler:
         return path
 
     @staticmethod
-    def save_cv(
-        cv_content: str,
-        output_dir: str,
-        filename_pattern: str = "cv_optimized_{timestamp}.md",
-    ) -> Path:
+    def write_atomic(file_path: Path, content: str) -> None:
         """
-        Save CV content to file.
+        Write text to a file atomically.
+
+        The content is written to a temporary file in the same directory and
+        renamed over the target, so readers never see a partially written file.
+        The file keeps the permissions of the file it replaces, or gets the
+        usual permissions of new files (0666 minus the umask).
 
         Args:
-            cv_content: CV markdown content
-            output_dir: Output directory
-            filename_pattern: Filename pattern with {timestamp} placeholder
+            file_path: Target file path
+            content: Text content
+        """
+        tmp_name = file_path.parent / f".{file_path.name}.{uuid.uuid4().hex[:8]}.tmp"
+        # Created like any new file, so the kernel applies the umask (reading
+        # the umask would mean setting it, which races with other threads)
+        fd = os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            # A replaced file keeps its permissions
+            with contextlib.suppress(FileNotFoundError):
+                os.chmod(tmp_name, file_path.stat().st_mode & 0o7777)
+            os.replace(tmp_name, file_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def reserve_path(dir_path: Path, filename: str) -> Path:
+        """
+        Reserve a file name that no other run is using.
+
+        The file is created exclusively; if the name is taken, a numeric
+        suffix is appended (e.g. "cv_2.md").
+
+        Args:
+            dir_path: Directory for the file
+            filename: Preferred file name
 
         Returns:
-            Path to saved file
+            Path of the reserved (empty) file
         """
+        stem, suffix = Path(filename).stem, Path(filename).suffix
+        candidate = dir_path / filename
+        counter = 1
+        while True:
+            try:
+                os.close(os.open(candidate, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return candidate
+            except FileExistsError:
+                counter += 1
+                candidate = dir_path / f"{stem}_{counter}{suffix}"
+
+    @staticmethod
+    def _save_unique(
+        content: str, output_dir: str, filename_pattern: str, run_id: str | None
+    ) -> Path:
+        """Save content under a unique name generated from a filename pattern."""
         # Ensure output directory exists
         dir_path = FileHandler.ensure_directory(output_dir)
 
-        # Generate filename with timestamp
+        # Generate filename with timestamp and run id
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = filename_pattern.format(timestamp=timestamp)
-        file_path = dir_path / filename
+        filename = filename_pattern.format(
+            timestamp=timestamp, run_id=run_id or timestamp
+        )
+        file_path = FileHandler.reserve_path(dir_path, filename)
 
         # Save content
-        file_path.write_text(cv_content, encoding="utf-8")
+        FileHandler.write_atomic(file_path, content)
 
         return file_path
 
+    @staticmethod
+    def save_cv(
+        cv_content: str,
+        output_dir: str,
+        filename_pattern: str = "cv_optimized_{run_id}.md",
+        run_id: str | None = None,
+    ) -> Path:
+        """
+        Save CV content to file.
+
+        Args:
+            cv_content: CV markdown content
+            output_dir: Output directory
+            filename_pattern: Filename pattern with {timestamp} and/or {run_id}
+                placeholders
+            run_id: Run id for the {run_id} placeholder (defaults to timestamp)
+
+        Returns:
+            Path to saved file
+        """
+        return FileHandler._save_unique(
+            cv_content, output_dir, filename_pattern, run_id
+        )
+
     @staticmethod
     def save_feedback_history(
         feedback_content: str,
         output_dir: str,
-        filename_pattern: str = "cv_review_history_{timestamp}.md",
+        filename_pattern: str = "cv_review_history_{run_id}.md",
+        run_id: str | None = None,
     ) -> Path:
         """
         Save feedback history to file.
@@ -64,23 +139,16 @@ class FileHandler:
         Args:
             feedback_content: Feedback markdown content
             output_dir: Output directory
-            filename_pattern: Filename pattern with {timestamp} placeholder
+            filename_pattern: Filename pattern with {timestamp} and/or {run_id}
+                placeholders
+            run_id: Run id for the {run_id} placeholder (defaults to timestamp)
 
         Returns:
             Path to saved file
         """
-        # Ensure output directory exists
-        dir_path = FileHandler.ensure_directory(output_dir)
-
-        # Generate filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = filename_pattern.format(timestamp=timestamp)
-        file_path = dir_path / filename
-
-        # Save content
-        file_path.write_text(feedback_content, encoding="utf-8")
-
-        return file_path
+        return FileHandler._save_unique(
+            feedback_content, output_dir, filename_pattern, run_id
+        )
 
     @staticmethod
     def format_feedback_history(feedback_history: list) -> str:
@@ -101,6 +169,8 @@ class FileHandler:
                 f"**Timestamp:** {feedback.timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
             )
             lines.append(f"**Decision:** {feedback.decision}\n")
+            if feedback.keyword_coverage is not None:
+                lines.append(f"**Keyword Coverage:** {feedback.keyword_coverage:.0%}\n")
 
             lines.append("### Comments")
             lines.append(feedback.comments + "\n")
@@ -136,7 +206,7 @@ class FileHandler:
         file_path = dir_path / filename
 
         # Save content
-        file_path.write_text(cv_content, encoding="utf-8")
+        FileHandler.write_atomic(file_path, cv_content)
 
         return file_path
 
@@ -0,0 +1,65 @@
+"""Content fingerprints for caching and run lookup."""
+
+import hashlib
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+
+def content_hash(*parts: str, length: int = 16) -> str:
+    """
+    Hash text content into a short stable fingerprint.
+
+    Parts are length-prefixed before hashing, so ("ab", "c") and ("a", "bc")
+    produce different fingerprints.
+
+    Args:
+        *parts: Text parts to hash
+        length: Number of hex characters to return (max 64)
+
+    Returns:
+        Hex digest prefix
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8")
+        digest.update(f"{len(data)}:".encode())
+        digest.update(data)
+    return digest.hexdigest()[:length]
+
+
+def config_hash(config: dict[str, Any], length: int = 16) -> str:
+    """
+    Hash a configuration dictionary independent of key order.
+
+    Args:
+        config: JSON-serializable configuration
+        length: Number of hex characters to return (max 64)
+
+    Returns:
+        Hex digest prefix
+    """
+    return content_hash(json.dumps(config, sort_keys=True, default=str), length=length)
+
+
+def files_hash(
+    paths: Iterable[str | Path], root: str | Path | None = None, length: int = 16
+) -> str:
+    """
+    Hash the names and contents of files independent of their order.
+
+    Args:
+        paths: Files to hash
+        root: Directory the file names are taken relative to (so the hash
+            does not depend on the install location); bare names if None
+        length: Number of hex characters to return (max 64)
+
+    Returns:
+        Hex digest prefix
+    """
+    parts = []
+    for path in sorted(Path(p) for p in paths):
+        name = path.relative_to(root).as_posix() if root else path.name
+        parts += [name, path.read_text(encoding="utf-8")]
+    return content_hash(*parts, length=length)
@@ -0,0 +1,298 @@
+"""Hedged LLM requests with circuit-breaker failover."""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Rolling window of call latencies with percentile lookup."""
+
+    def __init__(self, window: int = 100):
+        """
+        Initialize latency tracker.
+
+        Args:
+            window: Number of most recent samples to keep
+        """
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        """Record a latency sample in seconds."""
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, percentile: float) -> float | None:
+        """
+        Get a latency percentile.
+
+        Args:
+            percentile: Percentile between 0 and 100
+
+        Returns:
+            Latency in seconds, or None if no samples exist
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = round(percentile / 100 * (len(samples) - 1))
+        return samples[min(len(samples) - 1, max(0, index))]
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one LLM target.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests are refused until ``reset_timeout`` has passed; then a single
+    trial request is let through (half-open) to probe for recovery. Other
+    callers are refused until the trial succeeds or fails, or until it has
+    been outstanding for another ``reset_timeout`` (e.g. an abandoned hedge).
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds before an open circuit allows a trial call
+            clock: Time source (injectable for testing)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_started: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Circuit state: closed, open or half_open."""
+        if self._opened_at is None:
+            return "closed"
+        if self.clock() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent, admitting one half-open trial."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = self.clock()
+            if now - self._opened_at < self.reset_timeout:
+                return False
+            if (
+                self._trial_started is not None
+                and now - self._trial_started < self.reset_timeout
+            ):
+                return False
+            self._trial_started = now
+            return True
+
+    def record_success(self) -> None:
+        """Record a successful call and close the circuit."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_started = None
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            self._trial_started = None
+            if self._failures >= self.failure_threshold:
+                self._opened_at = self.clock()
+
+
+class HedgingPolicy:
+    """
+    Hedged execution of LLM calls.
+
+    A call that has not finished after a percentile-based delay is duplicated
+    to the secondary target (or the same target if there is none); the first
+    successful answer wins and the other request is abandoned. Failed calls
+    fail over to the remaining target immediately, and targets that fail
+    repeatedly are skipped by their circuit breaker.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 90.0,
+        min_delay: float = 10.0,
+        max_delay: float = 180.0,
+        min_samples: int = 5,
+        failure_threshold: int = 3,
+        reset_timeout: float = 60.0,
+    ):
+        """
+        Initialize hedging policy.
+
+        Args:
+            percentile: Latency percentile after which a hedge is sent
+            initial_delay: Hedge delay until min_samples latencies are known
+            min_delay: Lower bound for the hedge delay in seconds
+            max_delay: Upper bound for the hedge delay in seconds
+            min_samples: Samples required before using the percentile
+            failure_threshold: Consecutive failures that open a circuit
+            reset_timeout: Seconds before an open circuit is probed again
+        """
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._trackers: dict[str, LatencyTracker] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Any) -> "HedgingPolicy":
+        """
+        Create a hedging policy from the ``hedging`` config section.
+
+        Args:
+            config: Config instance
+
+        Returns:
+            HedgingPolicy instance
+        """
+        return cls(
+            percentile=config.get("hedging.percentile", 95.0),
+            initial_delay=config.get("hedging.initial_delay_seconds", 90.0),
+            min_delay=config.get("hedging.min_delay_seconds", 10.0),
+            max_delay=config.get("hedging.max_delay_seconds", 180.0),
+            min_samples=config.get("hedging.min_samples", 5),
+            failure_threshold=config.get("hedging.failure_threshold", 3),
+            reset_timeout=config.get("hedging.reset_timeout_seconds", 60.0),
+        )
+
+    def tracker(self, key: str) -> LatencyTracker:
+        """Get the latency tracker for a call type."""
+        with self._lock:
+            return self._trackers.setdefault(key, LatencyTracker())
+
+    def breaker(self, key: str) -> CircuitBreaker:
+        """Get the circuit breaker for a target."""
+        with self._lock:
+            if key not in self._breakers:
+                self._breakers[key] = CircuitBreaker(
+                    self.failure_threshold, self.reset_timeout
+                )
+            return self._breakers[key]
+
+    def hedge_delay(self, latency_key: str) -> float:
+        """
+        Get the delay after which a hedge request is sent.
+
+        Args:
+            latency_key: Call type the latency history is kept for
+
+        Returns:
+            Delay in seconds
+        """
+        tracker = self.tracker(latency_key)
+        delay = None
+        if len(tracker) >= self.min_samples:
+            delay = tracker.percentile(self.percentile)
+        if delay is None:
+            delay = self.initial_delay
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def run(
+        self,
+        primary: tuple[str, Callable[[], T]],
+        secondary: tuple[str, Callable[[], T]] | None = None,
+        latency_key: str = "default",
+    ) -> T:
+        """
+        Run a call with hedging and failover.
+
+        Args:
+            primary: (target key, callable) for the primary target
+            secondary: Optional (target key, callable) for the secondary target
+            latency_key: Call type used for latency tracking (e.g. crew name)
+
+        Returns:
+            Result of the first successful call
+
+        Raises:
+            Exception: The last error if every attempt failed
+        """
+        targets = [primary] + ([secondary] if secondary else [])
+        candidates = [t for t in targets if self.breaker(t[0]).allow_request()]
+        if not candidates:
+            candidates = targets
+        # Without a secondary target, the hedge duplicates the primary call
+        if len(candidates) == 1:
+            candidates = candidates * 2
+
+        executor = ThreadPoolExecutor(max_workers=len(candidates))
+        pending: dict[Future, str] = {}
+        started: dict[Future, float] = {}
+        next_index = 0
+        last_error: BaseException | None = None
+
+        def launch() -> None:
+            nonlocal next_index
+            key, fn = candidates[next_index]
+            next_index += 1
+            future = executor.submit(fn)
+            pending[future] = key
+            started[future] = time.monotonic()
+
+        try:
+            launch()
+            while pending:
+                timeout = None
+                if next_index < len(candidates):
+                    timeout = self.hedge_delay(latency_key)
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+                if not done:
+                    # Slow call: fire the hedge request
+                    launch()
+                    continue
+
+                for future in done:
+                    key = pending.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        self.breaker(key).record_success()
+                        self.tracker(latency_key).record(
+                            time.monotonic() - started[future]
+                        )
+                        return future.result()
+                    self.breaker(key).record_failure()
+                    last_error = error
+
+                # Fail over immediately when nothing is running anymore
+                if not pending and next_index < len(candidates):
+                    launch()
+
+            raise last_error
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -1,19 +1,73 @@
 """LLM factory for creating language model instances."""
 
+import json
 import os
+import threading
 from typing import Any
 
+import httpx
+from crewai import LLM
+from crewai.llms.providers.anthropic.completion import AnthropicCompletion
 from langchain_anthropic import ChatAnthropic
 from langchain_ollama import ChatOllama
 from langchain_openai import ChatOpenAI
 
+from cv_writer.utils.ollama import DEFAULT_BASE_URL as DEFAULT_OLLAMA_URL
+
+# Routing key that keeps requests with the same prompt prefix on warm caches
+PROMPT_CACHE_KEY = "cv-writer"
+
+# Attributes of a LangChain model passed on to the crewai LLM of crew calls
+_CREW_LLM_ATTRIBUTES = (
+    "temperature",
+    "seed",
+    "max_tokens",
+    "logprobs",
+    "timeout",
+    "api_key",
+    "base_url",
+    "api_base",
+)
+
+
+class _AnthropicCompletion(AnthropicCompletion):
+    """crewai Anthropic client that sends its additional request parameters.
+
+    crewai keeps unknown keyword arguments (e.g. ``cache_control``) of its
+    Anthropic client in ``additional_params`` but, unlike its OpenAI client,
+    never adds them to the request.
+    """
+
+    def _prepare_completion_params(
+        self,
+        messages: Any,
+        system_message: str | None = None,
+        tools: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        params = super()._prepare_completion_params(messages, system_message, tools)
+        return {**self.additional_params, **params}
+
 
 class LLMFactory:
     """Factory for creating LLM instances based on provider."""
 
+    # Process-wide client pool (see create_llm(pooled=True))
+    max_connections = 20
+    max_keepalive_connections = 10
+    _pool: dict[str, Any] = {}
+    _http_clients: dict[tuple[str, str | None], httpx.Client] = {}
+    _pooled_http_clients: dict[int, httpx.Client] = {}
+    _pool_lock = threading.Lock()
+
     @staticmethod
     def create_llm(
-        provider: str, model: str, temperature: float = 0.7, **kwargs: Any
+        provider: str,
+        model: str,
+        temperature: float = 0.7,
+        prompt_caching: bool = False,
+        base_url: str | None = None,
+        pooled: bool = False,
+        **kwargs: Any,
     ) -> Any:
         """
         Create an LLM instance based on provider.
@@ -22,6 +76,12 @@ class LLMFactory:
             provider: LLM provider (openai, anthropic, ollama)
             model: Model name
             temperature: Temperature setting
+            prompt_caching: Request provider-side caching of the prompt prefix
+            base_url: Endpoint overriding the provider's default API URL
+                (e.g. a proxy or a local OpenAI-compatible server)
+            pooled: Return the process-wide shared instance for these
+                arguments, whose HTTP connection pool is shared with all
+                other pooled instances of the same provider endpoint
             **kwargs: Additional provider-specific arguments
 
         Returns:
@@ -31,6 +91,12 @@ class LLMFactory:
             ValueError: If provider is unsupported or credentials are missing
         """
         provider = provider.lower()
+        if prompt_caching:
+            kwargs = LLMFactory._with_prompt_caching(provider, kwargs)
+        if base_url:
+            kwargs["base_url"] = base_url
+        if pooled:
+            return LLMFactory._pooled_llm(provider, model, temperature, kwargs)
 
         if provider == "openai":
             return LLMFactory._create_openai(model, temperature, **kwargs)
@@ -44,6 +110,193 @@ class LLMFactory:
                 "Supported providers: openai, anthropic, ollama"
             )
 
+    @staticmethod
+    def _pooled_llm(
+        provider: str, model: str, temperature: float, kwargs: dict[str, Any]
+    ) -> Any:
+        """
+        Get (or create) the pooled LLM instance for a set of arguments.
+
+        Instances are created under a lock and never awaited on, so the pool
+        can be used from threads and coroutines alike. Only synchronous HTTP
+        clients are shared: an async client is bound to one event loop, so
+        every instance keeps its own.
+
+        Args:
+            provider: Lowercase provider name
+            model: Model name
+            temperature: Temperature setting
+            kwargs: Provider-specific arguments (caching already applied)
+
+        Returns:
+            Shared LLM instance
+        """
+        key = json.dumps(
+            [provider, model, temperature, kwargs], sort_keys=True, default=repr
+        )
+        with LLMFactory._pool_lock:
+            if key not in LLMFactory._pool:
+                http_client = None
+                if provider in ("openai", "anthropic"):
+                    endpoint = (provider, kwargs.get("base_url"))
+                    if endpoint not in LLMFactory._http_clients:
+                        LLMFactory._http_clients[endpoint] = httpx.Client(
+                            limits=httpx.Limits(
+                                max_connections=LLMFactory.max_connections,
+                                max_keepalive_connections=(
+                                    LLMFactory.max_keepalive_connections
+                                ),
+                            ),
+                            follow_redirects=True,
+                        )
+                    http_client = LLMFactory._http_clients[endpoint]
+                # The LangChain Anthropic client does not accept an HTTP
+                # client; crew calls share it through crew_llm() instead
+                if provider == "openai":
+                    kwargs = {**kwargs, "http_client": http_client}
+
+                llm = LLMFactory.create_llm(provider, model, temperature, **kwargs)
+                if http_client is not None:
+                    LLMFactory._pooled_http_clients[id(llm)] = http_client
+                LLMFactory._pool[key] = llm
+            return LLMFactory._pool[key]
+
+    @staticmethod
+    def configure_pool(
+        max_connections: int = 20, max_keepalive_connections: int = 10
+    ) -> None:
+        """
+        Set the connection limits of pooled HTTP clients.
+
+        Applies to HTTP clients created afterwards, i.e. to provider
+        endpoints that have not been used by a pooled LLM yet.
+
+        Args:
+            max_connections: Maximum open connections per provider endpoint
+            max_keepalive_connections: Maximum idle connections kept open
+        """
+        LLMFactory.max_connections = max_connections
+        LLMFactory.max_keepalive_connections = min(
+            max_keepalive_connections, max_connections
+        )
+
+    @staticmethod
+    def close_pool() -> None:
+        """Close the pooled HTTP clients and forget all pooled instances."""
+        with LLMFactory._pool_lock:
+            for http_client in LLMFactory._http_clients.values():
+                http_client.close()
+            LLMFactory._http_clients.clear()
+            LLMFactory._pooled_http_clients.clear()
+            LLMFactory._pool.clear()
+
+    @staticmethod
+    def crew_llm(llm: Any) -> Any:
+        """
+        Get the LLM to hand to a crew for one call.
+
+        crewai replaces LangChain models with its own client, copying only
+        a few basic attributes. This builds that client here instead, so
+        crew calls also send the model's request parameters (``model_kwargs``,
+        e.g. prompt caching hints, the seed and Ollama's keep-alive) and
+        endpoint, and pooled instances share their HTTP client. A new
+        instance per call keeps crewai's token usage per call.
+
+        Args:
+            llm: LLM instance created by this factory
+
+        Returns:
+            crewai LLM for the call, or llm unchanged if it does not come
+            from this factory
+
+        Raises:
+            ValueError: If an Ollama model is used without LiteLLM installed
+        """
+        provider, model = LLMFactory.describe_llm(llm)
+        if provider not in ("openai", "anthropic", "ollama"):
+            return llm
+
+        params = {
+            name: value
+            for name in _CREW_LLM_ATTRIBUTES
+            if (value := getattr(llm, name, None)) is not None
+        }
+        params.update(getattr(llm, "model_kwargs", None) or {})
+        if provider == "ollama":
+            return LLMFactory._crew_ollama_llm(model, llm.keep_alive, params)
+        # LangChain keeps the endpoint under provider-specific names
+        base_url = getattr(llm, "openai_api_base", None) or getattr(
+            llm, "anthropic_api_url", None
+        )
+        if base_url:
+            params["base_url"] = base_url
+        http_client = LLMFactory._pooled_http_clients.get(id(llm))
+        if http_client is not None:
+            params["client_params"] = {"http_client": http_client}
+
+        if provider == "anthropic":
+            return _AnthropicCompletion(model=model, provider=provider, **params)
+        return LLM(model=model, provider=provider, **params)
+
+    @staticmethod
+    def _crew_ollama_llm(
+        model: str, keep_alive: str | int | None, params: dict[str, Any]
+    ) -> Any:
+        """
+        Build the crewai LLM for an Ollama model.
+
+        crewai calls Ollama through LiteLLM, which sends the keep-alive with
+        every request, so crew calls keep the model loaded as long as the
+        warm-up requested.
+
+        Args:
+            model: Ollama model name
+            keep_alive: Keep-alive of the model (None = server default)
+            params: Temperature, seed and endpoint of the model
+
+        Returns:
+            crewai LLM
+
+        Raises:
+            ValueError: If LiteLLM is not installed
+        """
+        if keep_alive is not None:
+            params = {**params, "keep_alive": keep_alive}
+        try:
+            return LLM(model=f"ollama/{model}", **params)
+        except ImportError as e:
+            raise ValueError(
+                "Ollama models need LiteLLM. Install it with: "
+                "pip install 'crewai[litellm]'"
+            ) from e
+
+    @staticmethod
+    def _with_prompt_caching(provider: str, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """
+        Add provider-specific prompt caching request parameters.
+
+        Anthropic caches only when asked via ``cache_control``; OpenAI caches
+        prompt prefixes automatically and uses ``prompt_cache_key`` to route
+        similar requests to the same cache. Ollama reuses its KV cache for a
+        repeated prefix without any request parameter. The parameters are
+        kept in ``model_kwargs``, which crew_llm() passes on to crew calls.
+
+        Args:
+            provider: Lowercase provider name
+            kwargs: Provider-specific arguments passed by the caller
+
+        Returns:
+            Arguments including the caching parameters
+        """
+        model_kwargs = dict(kwargs.get("model_kwargs") or {})
+        if provider == "anthropic":
+            model_kwargs.setdefault("cache_control", {"type": "ephemeral"})
+        elif provider == "openai":
+            model_kwargs.setdefault("prompt_cache_key", PROMPT_CACHE_KEY)
+        else:
+            return kwargs
+        return {**kwargs, "model_kwargs": model_kwargs}
+
     @staticmethod
     def _create_openai(model: str, temperature: float, **kwargs: Any) -> ChatOpenAI:
         """Create OpenAI LLM instance."""
@@ -77,12 +330,37 @@ class LLMFactory:
     @staticmethod
     def _create_ollama(model: str, temperature: float, **kwargs: Any) -> ChatOllama:
         """Create Ollama LLM instance."""
-        base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+        base_url = kwargs.pop("base_url", None) or os.getenv(
+            "OLLAMA_BASE_URL", DEFAULT_OLLAMA_URL
+        )
 
         return ChatOllama(
             model=model, temperature=temperature, base_url=base_url, **kwargs
         )
 
+    @staticmethod
+    def describe_llm(llm: Any) -> tuple[str, str]:
+        """
+        Determine provider and model name of an LLM instance.
+
+        Args:
+            llm: LLM instance created by this factory
+
+        Returns:
+            Tuple of (provider, model)
+        """
+        if isinstance(llm, ChatOpenAI):
+            provider = "openai"
+        elif isinstance(llm, ChatAnthropic):
+            provider = "anthropic"
+        elif isinstance(llm, ChatOllama):
+            provider = "ollama"
+        else:
+            provider = "unknown"
+
+        model = getattr(llm, "model_name", None) or getattr(llm, "model", None)
+        return provider, str(model or "unknown")
+
     @staticmethod
     def validate_provider(provider: str) -> bool:
         """
@@ -0,0 +1,92 @@
+"""Routing policy for choosing between strong and fast LLMs."""
+
+from typing import Any
+
+
+class LLMRouter:
+    """
+    Routing policy that sends cheap crew calls to a fast model.
+
+    A call is routed to the fast LLM only if its crew is listed in
+    ``fast_crews``, its prompt is small enough, its iteration is early enough
+    and, when ``final_iteration_strong`` is set, it is not part of the final
+    review/revise cycle. Every other call uses the crew's own LLM.
+    """
+
+    def __init__(
+        self,
+        fast_llm: Any,
+        fast_crews: list[str] | tuple[str, ...] = ("reviewer",),
+        max_fast_prompt_chars: int | None = None,
+        fast_max_iteration: int | None = None,
+        final_iteration_strong: bool = True,
+    ):
+        """
+        Initialize LLM router.
+
+        Args:
+            fast_llm: Fast (cheaper) language model instance
+            fast_crews: Crew names that may be routed to the fast model
+            max_fast_prompt_chars: Larger prompts always use the crew's LLM
+            fast_max_iteration: Last iteration that may use the fast model
+            final_iteration_strong: Use the crew's LLM in the final iteration
+        """
+        self.fast_llm = fast_llm
+        self.fast_crews = {crew.lower() for crew in fast_crews}
+        self.max_fast_prompt_chars = max_fast_prompt_chars
+        self.fast_max_iteration = fast_max_iteration
+        self.final_iteration_strong = final_iteration_strong
+
+    @classmethod
+    def from_config(cls, config: Any, fast_llm: Any) -> "LLMRouter":
+        """
+        Create a router from the ``routing`` config section.
+
+        Args:
+            config: Config instance
+            fast_llm: Fast language model instance
+
+        Returns:
+            LLMRouter instance
+        """
+        return cls(
+            fast_llm=fast_llm,
+            fast_crews=config.get("routing.fast_crews", ["reviewer"]),
+            max_fast_prompt_chars=config.get("routing.max_fast_prompt_chars", None),
+            fast_max_iteration=config.get("routing.fast_max_iteration", None),
+            final_iteration_strong=config.get("routing.final_iteration_strong", True),
+        )
+
+    def select(
+        self,
+        crew: str,
+        default_llm: Any,
+        iteration: int,
+        prompt_chars: int,
+        final: bool = False,
+    ) -> Any:
+        """
+        Select the LLM for a crew call.
+
+        Args:
+            crew: Crew name (e.g. "reviewer", "writer")
+            default_llm: The crew's own (strong) LLM
+            iteration: Current iteration number
+            prompt_chars: Size of the rendered prompt inputs in characters
+            final: Whether the call belongs to the final iteration
+
+        Returns:
+            Language model instance to use
+        """
+        if crew.lower() not in self.fast_crews:
+            return default_llm
+        if final and self.final_iteration_strong:
+            return default_llm
+        if (
+            self.max_fast_prompt_chars is not None
+            and prompt_chars > self.max_fast_prompt_chars
+        ):
+            return default_llm
+        if self.fast_max_iteration is not None and iteration > self.fast_max_iteration:
+            return default_llm
+        return self.fast_llm
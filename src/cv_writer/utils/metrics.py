@@ -0,0 +1,502 @@
+"""Prometheus-style metrics for runs and LLM calls."""
+
+import re
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from cv_writer.utils.file_handler import FileHandler
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Latency buckets in seconds, from local parsing up to slow LLM calls
+DEFAULT_BUCKETS = (
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+    600.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_SAMPLE = re.compile(r"^([a-zA-Z_:][\w:]*)(?:\{(.*)\})?\s+(\S+)")
+_LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value in the text exposition format."""
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _unescape(value: str) -> str:
+    """Reverse label value escaping."""
+    return re.sub(r"\\(.)", lambda m: "\n" if m.group(1) == "n" else m.group(1), value)
+
+
+def _format_labels(pairs: list[tuple[str, str]]) -> str:
+    """Format label pairs as ``{name="value",...}``."""
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class _Metric:
+    """Labeled series of one metric; each series is a list of numbers."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._series: dict[tuple[str, ...], list[float]] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        """Build the series key from label values."""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name} expects labels {list(self.labelnames)}, "
+                f"got {sorted(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _width(self) -> int:
+        """Number of values per series."""
+        return 1
+
+    def snapshot(self) -> dict[tuple[str, ...], list[float]]:
+        """Copy the current values of all series."""
+        with self._lock:
+            return {key: list(values) for key, values in self._series.items()}
+
+    def render(self, series: dict[tuple[str, ...], list[float]]) -> list[str]:
+        """Render series values as exposition lines (without HELP/TYPE)."""
+        raise NotImplementedError
+
+    def parse(
+        self, samples: list[tuple[str, dict[str, str], float]]
+    ) -> dict[tuple[str, ...], list[float]]:
+        """Rebuild series values from parsed exposition samples."""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """
+        Increase the counter.
+
+        Args:
+            amount: Non-negative increment
+            **labels: Label values
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._series.setdefault(key, [0.0])[0] += amount
+
+    def value(self, **labels: str) -> float:
+        """Get the current value of a series."""
+        with self._lock:
+            return self._series.get(self._key(labels), [0.0])[0]
+
+    @contextmanager
+    def count_exceptions(self, **labels: str) -> Iterator[None]:
+        """Increase the counter if the block raises, then re-raise."""
+        try:
+            yield
+        except Exception:
+            self.inc(**labels)
+            raise
+
+    def render(self, series: dict[tuple[str, ...], list[float]]) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(list(zip(self.labelnames, key, strict=True)))} "
+            f"{_format_value(values[0])}"
+            for key, values in sorted(series.items())
+        ]
+
+    def parse(
+        self, samples: list[tuple[str, dict[str, str], float]]
+    ) -> dict[tuple[str, ...], list[float]]:
+        series = {}
+        for name, labels, value in samples:
+            if name == self.name and set(labels) == set(self.labelnames):
+                series[self._key(labels)] = [value]
+        return series
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def _width(self) -> int:
+        # Cumulative bucket counts (the +Inf bucket is the count), then the sum
+        return len(self.buckets) + 1
+
+    def observe(self, value: float, **labels: str) -> None:
+        """
+        Record an observation.
+
+        Args:
+            value: Observed value (e.g. seconds)
+            **labels: Label values
+        """
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.setdefault(key, [0.0] * self._width())
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-1] += value
+
+    def count(self, **labels: str) -> int:
+        """Get the number of observations of a series."""
+        with self._lock:
+            series = self._series.get(self._key(labels))
+        return int(series[-2]) if series else 0
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the duration of a block in seconds (also if it raises)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def render(self, series: dict[tuple[str, ...], list[float]]) -> list[str]:
+        lines = []
+        for key, values in sorted(series.items()):
+            pairs = list(zip(self.labelnames, key, strict=True))
+            for bound, count in zip(self.buckets, values, strict=False):
+                lines.append(
+                    f"{self.name}_bucket"
+                    f"{_format_labels([*pairs, ('le', _format_value(bound))])} "
+                    f"{_format_value(count)}"
+                )
+            lines.append(
+                f"{self.name}_sum{_format_labels(pairs)} {_format_value(values[-1])}"
+            )
+            lines.append(
+                f"{self.name}_count{_format_labels(pairs)} {_format_value(values[-2])}"
+            )
+        return lines
+
+    def parse(
+        self, samples: list[tuple[str, dict[str, str], float]]
+    ) -> dict[tuple[str, ...], list[float]]:
+        bounds = {_format_value(bound): i for i, bound in enumerate(self.buckets)}
+        series: dict[tuple[str, ...], list[float]] = {}
+        for name, labels, value in samples:
+            labels = dict(labels)
+            if name == f"{self.name}_bucket":
+                index = bounds.get(labels.pop("le", ""))
+            elif name == f"{self.name}_sum":
+                index = -1
+            else:
+                continue
+            if index is None or set(labels) != set(self.labelnames):
+                continue
+            key = self._key(labels)
+            series.setdefault(key, [0.0] * self._width())[index] = value
+        return series
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics rendered in the Prometheus text format.
+
+    Metrics can be scraped from a local ``/metrics`` endpoint while a run is
+    in progress, or written to a text file for the node exporter's textfile
+    collector. Text files accumulate: each write adds what this process
+    counted since its last write to the totals already in the file, so a
+    batch of short-lived runs produces one set of aggregated metrics.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._metrics: dict[str, _Metric] = {}
+        self._written: dict[str, dict[tuple[str, ...], list[float]]] = {}
+        self._servers: dict[
+            tuple[str, int], tuple[ThreadingHTTPServer, threading.Thread]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        """Register a metric or return the existing one of the same name."""
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is None:
+                self._metrics[metric.name] = metric
+                return metric
+        if (
+            type(existing) is not type(metric)
+            or existing.labelnames != metric.labelnames
+        ):
+            raise ValueError(f"Metric {metric.name} is already registered differently")
+        return existing
+
+    def counter(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> Counter:
+        """
+        Get or create a counter.
+
+        Args:
+            name: Metric name (e.g. "cv_writer_runs_total")
+            documentation: Help text
+            labelnames: Names of the labels every sample carries
+
+        Returns:
+            Counter
+        """
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """
+        Get or create a histogram.
+
+        Args:
+            name: Metric name (e.g. "cv_writer_llm_call_seconds")
+            documentation: Help text
+            labelnames: Names of the labels every sample carries
+            buckets: Upper bucket bounds (+Inf is added)
+
+        Returns:
+            Histogram
+        """
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(
+        self, values: dict[str, dict[tuple[str, ...], list[float]]] | None = None
+    ) -> str:
+        """
+        Render metrics in the Prometheus text exposition format.
+
+        Args:
+            values: Series values by metric name (current values if None)
+
+        Returns:
+            Exposition text
+        """
+        lines = []
+        for name, metric in self._metrics.items():
+            series = metric.snapshot() if values is None else values.get(name, {})
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.render(series))
+        return "\n".join(lines) + "\n"
+
+    def parse(self, text: str) -> dict[str, dict[tuple[str, ...], list[float]]]:
+        """
+        Parse exposition text into series values of the registered metrics.
+
+        Samples of unknown metrics or with unexpected labels are ignored.
+
+        Args:
+            text: Exposition text
+
+        Returns:
+            Series values by metric name
+        """
+        samples = []
+        for line in text.splitlines():
+            match = _SAMPLE.match(line)
+            if not match or line.startswith("#"):
+                continue
+            name, raw_labels, raw_value = match.groups()
+            try:
+                value = float(raw_value)
+            except ValueError:
+                continue
+            labels = {
+                key: _unescape(value) for key, value in _LABEL.findall(raw_labels or "")
+            }
+            samples.append((name, labels, value))
+        return {name: metric.parse(samples) for name, metric in self._metrics.items()}
+
+    def write_textfile(self, path: str | Path) -> Path:
+        """
+        Add this process's metrics to the totals in a text file.
+
+        The file is updated atomically under an exclusive lock, so concurrent
+        runs can share one file.
+
+        Args:
+            path: Path to the ``.prom`` file
+
+        Returns:
+            Path to the written file
+        """
+        path = Path(path)
+        FileHandler.ensure_directory(str(path.parent))
+        with open(path.with_name(path.name + ".lock"), "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                previous = self.parse(path.read_text(encoding="utf-8"))
+            except OSError:
+                previous = {}
+
+            with self._lock:
+                totals = {}
+                for name, metric in self._metrics.items():
+                    current = metric.snapshot()
+                    written = self._written.get(name, {})
+                    merged = {
+                        key: list(values)
+                        for key, values in previous.get(name, {}).items()
+                    }
+                    for key, values in current.items():
+                        base = written.get(key, [0.0] * len(values))
+                        total = merged.setdefault(key, [0.0] * len(values))
+                        for i, value in enumerate(values):
+                            total[i] += value - base[i]
+                    totals[name] = merged
+                    self._written[name] = current
+                FileHandler.write_atomic(path, self.render(totals))
+        return path
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """
+        Serve the metrics on ``http://host:port/metrics`` in a daemon thread.
+
+        While a server of this registry runs on the address, it is returned
+        instead of binding the port again (e.g. for several runs of one
+        command).
+
+        Args:
+            port: TCP port (0 picks a free port)
+            host: Interface to bind
+
+        Returns:
+            Running server (call ``shutdown()`` to stop it)
+        """
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                return
+
+        with self._lock:
+            running = self._servers.get((host, port))
+            if (
+                port
+                and running
+                and running[1].is_alive()
+                and running[0].socket.fileno() != -1
+            ):
+                return running[0]
+            server = ThreadingHTTPServer((host, port), Handler)
+            thread = threading.Thread(
+                target=server.serve_forever, name="metrics-server", daemon=True
+            )
+            thread.start()
+            self._servers[(host, server.server_address[1])] = (server, thread)
+        return server
+
+
+# Process-wide registry and the metrics the optimizer reports
+REGISTRY = MetricsRegistry()
+
+LLM_CALLS = REGISTRY.counter(
+    "cv_writer_llm_calls_total",
+    "LLM crew calls by outcome (success, error, timeout)",
+    ("crew", "provider", "model", "outcome"),
+)
+LLM_CALL_SECONDS = REGISTRY.histogram(
+    "cv_writer_llm_call_seconds",
+    "Duration of LLM crew calls in seconds",
+    ("crew", "provider", "model"),
+)
+LLM_TOKENS = REGISTRY.counter(
+    "cv_writer_llm_tokens_total",
+    "Tokens of LLM crew calls by kind (prompt, completion, cached_prompt)",
+    ("crew", "provider", "model", "kind"),
+)
+PHASE_SECONDS = REGISTRY.histogram(
+    "cv_writer_phase_seconds",
+    "Duration of flow phases in seconds",
+    ("phase",),
+)
+RUNS = REGISTRY.counter(
+    "cv_writer_runs_total",
+    "Finished optimization runs by final status",
+    ("status",),
+)
+RUN_ITERATIONS = REGISTRY.histogram(
+    "cv_writer_run_iterations",
+    "Review iterations per finished run",
+    buckets=(1, 2, 3, 4, 5, 6, 8, 10),
+)
+DOCUMENT_PARSE_SECONDS = REGISTRY.histogram(
+    "cv_writer_document_parse_seconds",
+    "Duration of document parsing and scraping in seconds by source type",
+    ("source",),
+)
+CACHE_LOOKUPS = REGISTRY.counter(
+    "cv_writer_cache_lookups_total",
+    "Cache lookups by cache and result (hit, miss)",
+    ("cache", "result"),
+)
+ERRORS = REGISTRY.counter(
+    "cv_writer_errors_total",
+    "Errors by component",
+    ("component",),
+)
@@ -0,0 +1,216 @@
+"""Ollama model residency: keep-alive, warm-up and cold-model probes."""
+
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any
+
+import requests
+
+from cv_writer.utils.rate_limiter import RateLimiter
+
+DEFAULT_BASE_URL = "http://localhost:11434"
+
+# Limits high enough to never delay a call
+_UNLIMITED_REQUESTS = 1_000_000
+_UNLIMITED_TOKENS = 1_000_000_000
+_UNLIMITED_CALLS = 1_000
+
+
+def slot_limits(
+    num_parallel: int, limits: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """
+    Build rate limiter overrides that match concurrency to the server slots.
+
+    Local models have no request quota, so unless configured only
+    concurrency is limited: at most one call per slot, backing off
+    adaptively when latency inflates.
+
+    Args:
+        num_parallel: Server's parallel slots
+        limits: Configured limits to keep, with concurrency capped at the
+            slots (optional)
+
+    Returns:
+        Limits for ``rate_limits.models``
+    """
+    num_parallel = max(1, num_parallel)
+    limits = limits or {}
+    concurrency = dict(limits.get("concurrency", {}))
+    maximum = min(concurrency.get("max", num_parallel), num_parallel)
+    return {
+        **limits,
+        "requests_per_minute": limits.get("requests_per_minute", _UNLIMITED_REQUESTS),
+        "tokens_per_minute": limits.get("tokens_per_minute", _UNLIMITED_TOKENS),
+        "concurrency": {
+            **concurrency,
+            "initial": min(concurrency.get("initial", maximum), maximum),
+            "min": min(concurrency.get("min", 1), maximum),
+            "max": maximum,
+        },
+    }
+
+
+def apply_slot_limits(
+    rate_limiter: RateLimiter, models: list[str], num_parallel: int
+) -> None:
+    """
+    Cap the concurrency of the Ollama models a run calls at the server slots.
+
+    Limits configured for a model (``ollama/<model>``) or for all Ollama
+    models are kept; only their concurrency is capped.
+
+    Args:
+        rate_limiter: Rate limiter shared by the run
+        models: Names of the Ollama models called
+        num_parallel: Server's parallel slots
+    """
+    configured = rate_limiter.models
+    for model in models:
+        key = f"ollama/{model}"
+        configured[key] = slot_limits(
+            num_parallel, configured.get(key) or configured.get("ollama")
+        )
+
+
+def slot_limiter(num_parallel: int) -> RateLimiter:
+    """
+    Create a rate limiter that only caps concurrent Ollama calls.
+
+    Used when rate limiting is disabled: calls to other providers pass
+    through without request, token or concurrency limits or retries.
+
+    Args:
+        num_parallel: Server's parallel slots
+
+    Returns:
+        RateLimiter instance
+    """
+    return RateLimiter(
+        requests_per_minute=_UNLIMITED_REQUESTS,
+        tokens_per_minute=_UNLIMITED_TOKENS,
+        models={"ollama": slot_limits(num_parallel)},
+        concurrency={"initial": _UNLIMITED_CALLS, "min": _UNLIMITED_CALLS},
+        max_retries=0,
+    )
+
+
+class OllamaModel:
+    """
+    One model on an Ollama server.
+
+    Loading a model into memory takes tens of seconds, and Ollama unloads
+    it after ``keep_alive`` without requests (five minutes by default).
+    Preloading with a longer keep-alive at the start of a run moves the
+    load off the first LLM call; crew calls send the same keep-alive.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        base_url: str | None = None,
+        keep_alive: str | int = "30m",
+        timeout: float = 5.0,
+    ):
+        """
+        Initialize model handle.
+
+        Args:
+            model: Model name (e.g. "llama3.1")
+            base_url: Ollama server URL (OLLAMA_BASE_URL or localhost if None)
+            keep_alive: How long the server keeps the model loaded after a
+                request (duration like "30m", seconds, or -1 for forever)
+            timeout: Timeout of status probes in seconds
+        """
+        self.model = model
+        self.base_url = (
+            base_url or os.getenv("OLLAMA_BASE_URL", DEFAULT_BASE_URL)
+        ).rstrip("/")
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+
+    def _matches(self, name: str) -> bool:
+        """Check whether a loaded model name refers to this model."""
+        if ":" in self.model:
+            return name == self.model
+        return name in (self.model, f"{self.model}:latest")
+
+    def status(self) -> dict[str, Any]:
+        """
+        Probe whether the model is loaded (warm) on the server.
+
+        Returns:
+            Dictionary with ``reachable`` and ``loaded`` flags, plus the
+            server's ``expires_at`` and ``size_vram`` of a loaded model
+        """
+        try:
+            response = requests.get(f"{self.base_url}/api/ps", timeout=self.timeout)
+            response.raise_for_status()
+            models = response.json().get("models") or []
+        except (requests.exceptions.RequestException, ValueError):
+            return {"reachable": False, "loaded": False}
+
+        for entry in models:
+            if self._matches(entry.get("name") or entry.get("model") or ""):
+                return {
+                    "reachable": True,
+                    "loaded": True,
+                    "expires_at": entry.get("expires_at"),
+                    "size_vram": entry.get("size_vram"),
+                }
+        return {"reachable": True, "loaded": False}
+
+    def is_warm(self) -> bool:
+        """Check whether the model is loaded and can answer without a load."""
+        return self.status()["loaded"]
+
+    def preload(self, timeout: float = 300.0) -> float:
+        """
+        Load the model (if needed) and set its keep-alive.
+
+        Sends a request without a prompt, which Ollama answers as soon as
+        the model is in memory.
+
+        Args:
+            timeout: Seconds to wait for the model to load
+
+        Returns:
+            Seconds the preload took
+
+        Raises:
+            requests.exceptions.RequestException: If the server is unreachable
+                or rejects the model (e.g. it is not pulled)
+        """
+        started = time.monotonic()
+        response = requests.post(
+            f"{self.base_url}/api/generate",
+            json={"model": self.model, "keep_alive": self.keep_alive},
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        return time.monotonic() - started
+
+    def preload_in_background(self, timeout: float = 300.0) -> "Future[float]":
+        """
+        Start preload() in a daemon thread.
+
+        Args:
+            timeout: Seconds to wait for the model to load
+
+        Returns:
+            Future with the preload duration or its error
+        """
+        future: Future[float] = Future()
+
+        def run() -> None:
+            try:
+                future.set_result(self.preload(timeout))
+            except Exception as e:
+                future.set_exception(e)
+
+        threading.Thread(
+            target=run, name=f"ollama-preload-{self.model}", daemon=True
+        ).start()
+        return future
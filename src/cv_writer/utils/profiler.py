@@ -0,0 +1,185 @@
+"""Per-phase CPU and memory profiling."""
+
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class PhaseStats:
+    """Aggregated measurements of one flow phase."""
+
+    def __init__(self, name: str):
+        """
+        Initialize empty phase measurements.
+
+        Args:
+            name: Phase name
+        """
+        self.name = name
+        self.calls = 0
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.peak_bytes = 0
+        self.profile_files: list[Path] = []
+        self.stats: pstats.Stats | None = None
+        self.allocations: list[str] = []
+
+
+class PhaseProfiler:
+    """
+    Profile flow phases with cProfile and tracemalloc.
+
+    Each phase occurrence is written to its own ``.prof`` file (readable with
+    ``pstats`` or snakeviz); occurrences of the same phase are aggregated for
+    the summary. The gap between wall time and CPU time is the time spent
+    waiting, mostly for LLM responses; CPU time is local overhead such as
+    orchestration, prompt rendering and parsing.
+
+    cProfile only sees the thread that starts a phase, so work done in worker
+    threads (e.g. parallel candidates) shows up as waiting time.
+    """
+
+    def __init__(self, output_dir: str | Path, run_id: str, top: int = 15):
+        """
+        Initialize profiler and start memory tracing.
+
+        Args:
+            output_dir: Directory for profile files and summary
+            run_id: Run id used as file name prefix
+            top: Number of functions and allocation sites listed per phase
+        """
+        self.output_dir = Path(output_dir)
+        self.run_id = run_id
+        self.top = top
+        self.phases: dict[str, PhaseStats] = {}
+        self._active: tuple[str, cProfile.Profile, float, float, object] | None = None
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def start(self, name: str) -> None:
+        """
+        Start profiling a phase.
+
+        Args:
+            name: Phase name (e.g. "review")
+
+        Raises:
+            RuntimeError: If another phase is still being profiled
+        """
+        if self._active is not None:
+            raise RuntimeError(
+                f"Cannot start phase '{name}' while '{self._active[0]}' is active"
+            )
+        tracemalloc.reset_peak()
+        snapshot = tracemalloc.take_snapshot()
+        profile = cProfile.Profile()
+        self._active = (
+            name,
+            profile,
+            time.perf_counter(),
+            time.process_time(),
+            snapshot,
+        )
+        profile.enable()
+
+    def stop(self) -> None:
+        """Stop profiling the active phase and record its measurements."""
+        if self._active is None:
+            return
+        name, profile, wall_start, cpu_start, snapshot = self._active
+        profile.disable()
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        _, peak = tracemalloc.get_traced_memory()
+        growth = tracemalloc.take_snapshot().compare_to(snapshot, "lineno")
+        self._active = None
+
+        phase = self.phases.setdefault(name, PhaseStats(name))
+        phase.calls += 1
+        phase.wall_seconds += wall
+        phase.cpu_seconds += cpu
+        phase.peak_bytes = max(phase.peak_bytes, peak)
+        if phase.calls == 1:
+            phase.allocations = [str(stat) for stat in growth[: self.top]]
+
+        path = self.output_dir / f"{self.run_id}.{name}-{phase.calls}.prof"
+        profile.dump_stats(path)
+        phase.profile_files.append(path)
+        if phase.stats is None:
+            phase.stats = pstats.Stats(profile)
+        else:
+            phase.stats.add(profile)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Profile a block of code as a phase.
+
+        Args:
+            name: Phase name
+        """
+        self.start(name)
+        try:
+            yield
+        finally:
+            self.stop()
+
+    def summary(self) -> str:
+        """
+        Build a text summary of all phases.
+
+        Returns:
+            Table of wall/CPU time and peak memory per phase, followed by the
+            top self-time functions and allocation sites of every phase
+        """
+        lines = [
+            f"{'PHASE':<12} {'CALLS':>5} {'WALL s':>9} {'CPU s':>9} "
+            f"{'WAIT s':>9} {'PEAK MB':>9}"
+        ]
+        for phase in self.phases.values():
+            lines.append(
+                f"{phase.name:<12} {phase.calls:>5} {phase.wall_seconds:>9.2f} "
+                f"{phase.cpu_seconds:>9.2f} "
+                f"{max(0.0, phase.wall_seconds - phase.cpu_seconds):>9.2f} "
+                f"{phase.peak_bytes / 1_000_000:>9.1f}"
+            )
+
+        for phase in self.phases.values():
+            lines.append("")
+            lines.append(f"== {phase.name}: top {self.top} functions by self time ==")
+            if phase.stats is not None:
+                stream = io.StringIO()
+                phase.stats.stream = stream
+                phase.stats.sort_stats("tottime").print_stats(self.top)
+                # Skip the pstats header up to the column titles
+                report = stream.getvalue()
+                start = report.find("ncalls")
+                lines.append(report[start:].rstrip() if start >= 0 else report)
+            if phase.allocations:
+                lines.append(f"-- {phase.name}: top allocation growth (first call) --")
+                lines.extend(phase.allocations)
+
+        return "\n".join(lines)
+
+    def write_summary(self) -> Path:
+        """
+        Write the summary next to the profile files.
+
+        Returns:
+            Path to the summary file
+        """
+        path = self.output_dir / f"{self.run_id}.profile.txt"
+        path.write_text(self.summary() + "\n", encoding="utf-8")
+        return path
+
+    def close(self) -> None:
+        """Stop an active phase and memory tracing."""
+        self.stop()
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
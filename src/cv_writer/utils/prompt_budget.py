@@ -0,0 +1,294 @@
+"""Token budget enforcement for crew prompts."""
+
+import re
+import threading
+from typing import Any
+
+from cv_writer.utils.rate_limiter import estimate_tokens
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Context windows (tokens) by model name prefix; the longest match wins.
+# Ollama serves models with a much smaller context (num_ctx) than the model
+# supports unless configured otherwise, so its entry is the server default.
+DEFAULT_CONTEXT_WINDOWS = {
+    "openai/gpt-4o": 128_000,
+    "openai/gpt-4.1": 1_047_576,
+    "openai/gpt-4-turbo": 128_000,
+    "openai/gpt-4": 8_192,
+    "openai/gpt-5": 400_000,
+    "openai/o1": 200_000,
+    "openai/o3": 200_000,
+    "openai/o4": 200_000,
+    "anthropic/claude": 200_000,
+    "ollama": 4_096,
+}
+
+FALLBACK_CONTEXT_WINDOW = 8_192
+
+_encodings: dict[str, Any] = {}
+_encodings_lock = threading.Lock()
+
+
+def _encoding(model: str) -> Any | None:
+    """
+    Get (and cache) the tiktoken encoding for a model.
+
+    Returns None if tiktoken is not installed or its encoding files cannot be
+    loaded (they are downloaded on first use, which fails offline).
+    """
+    if tiktoken is None:
+        return None
+    with _encodings_lock:
+        if model not in _encodings:
+            try:
+                try:
+                    _encodings[model] = tiktoken.encoding_for_model(model)
+                except KeyError:
+                    _encodings[model] = tiktoken.get_encoding("o200k_base")
+            except Exception:
+                _encodings[model] = None
+        return _encodings[model]
+
+
+def count_tokens(text: str, model: str = "gpt-4o") -> int:
+    """
+    Count the tokens of a text.
+
+    Uses tiktoken when installed (exact for OpenAI models, a close estimate
+    for others) and falls back to the characters-per-token heuristic.
+
+    Args:
+        text: Text to measure
+        model: Model name used to pick the tokenizer
+
+    Returns:
+        Number of tokens
+    """
+    if not text:
+        return 0
+    encoding = _encoding(model)
+    if encoding is None:
+        return estimate_tokens(text)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_tokens(text: str, max_tokens: int, model: str = "gpt-4o") -> str:
+    """
+    Truncate a text to at most ``max_tokens`` tokens at a line boundary.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Maximum number of tokens to keep
+        model: Model name used to pick the tokenizer
+
+    Returns:
+        Truncated text
+    """
+    if max_tokens <= 0:
+        return ""
+    if count_tokens(text, model) <= max_tokens:
+        return text
+
+    encoding = _encoding(model)
+    if encoding is None:
+        cut = text[: max_tokens * 4]
+    else:
+        cut = encoding.decode(encoding.encode(text, disallowed_special=())[:max_tokens])
+    # Prefer ending at a line boundary if that keeps most of the text
+    newline = cut.rfind("\n")
+    if newline > len(cut) // 2:
+        cut = cut[:newline]
+    return cut.rstrip()
+
+
+def compress_text(text: str) -> str:
+    """
+    Compress a text without dropping content words.
+
+    Collapses runs of whitespace and blank lines and removes repeated lines
+    (e.g. duplicated boilerplate in scraped job postings).
+
+    Args:
+        text: Text to compress
+
+    Returns:
+        Compressed text
+    """
+    seen: set[str] = set()
+    lines = []
+    for line in text.splitlines():
+        line = re.sub(r"[ \t]+", " ", line).strip()
+        key = line.lower()
+        if not line or key in seen:
+            continue
+        seen.add(key)
+        lines.append(line)
+    return "\n".join(lines)
+
+
+class PromptBudget:
+    """
+    Fit crew inputs into a model's context window.
+
+    Inputs are measured with a tokenizer and, if the rendered prompt would not
+    leave room for the answer, degraded field by field in policy order:
+    supporting documents are trimmed first, then the job description is
+    compressed and trimmed. The CV inputs and reviewer feedback are never
+    changed. Every reduction is reported so it can be recorded.
+    """
+
+    def __init__(
+        self,
+        context_windows: dict[str, int] | None = None,
+        output_reserve_tokens: int = 4_096,
+        overhead_tokens: int = 1_000,
+        policy: list[str] | tuple[str, ...] = ("supporting_docs", "job_description"),
+        min_job_description_tokens: int = 300,
+    ):
+        """
+        Initialize prompt budget.
+
+        Args:
+            context_windows: Context window overrides by "provider/model"
+                prefix (e.g. {"ollama/llama3.1": 32768})
+            output_reserve_tokens: Tokens kept free for the model's answer
+                (at most a quarter of the context window)
+            overhead_tokens: Tokens for framework prompts around the templates
+            policy: Input fields that may be degraded, in order
+            min_job_description_tokens: Never trim the job description below
+                this size
+        """
+        self.context_windows = {**DEFAULT_CONTEXT_WINDOWS, **(context_windows or {})}
+        self.output_reserve_tokens = output_reserve_tokens
+        self.overhead_tokens = overhead_tokens
+        self.policy = list(policy)
+        self.min_job_description_tokens = min_job_description_tokens
+
+    @classmethod
+    def from_config(cls, config: Any) -> "PromptBudget":
+        """
+        Create a prompt budget from the ``prompt_budget`` config section.
+
+        Args:
+            config: Config instance
+
+        Returns:
+            PromptBudget instance
+        """
+        return cls(
+            context_windows=config.get("prompt_budget.context_windows", None),
+            output_reserve_tokens=config.get(
+                "prompt_budget.output_reserve_tokens", 4_096
+            ),
+            overhead_tokens=config.get("prompt_budget.overhead_tokens", 1_000),
+            policy=config.get(
+                "prompt_budget.policy", ["supporting_docs", "job_description"]
+            ),
+            min_job_description_tokens=config.get(
+                "prompt_budget.min_job_description_tokens", 300
+            ),
+        )
+
+    def context_window(self, provider: str, model: str) -> int:
+        """
+        Look up the context window of a model.
+
+        Args:
+            provider: Provider name
+            model: Model name
+
+        Returns:
+            Context window in tokens
+        """
+        key = f"{provider}/{model}".lower()
+        matches = [prefix for prefix in self.context_windows if key.startswith(prefix)]
+        if not matches:
+            return FALLBACK_CONTEXT_WINDOW
+        return self.context_windows[max(matches, key=len)]
+
+    def fit(
+        self,
+        inputs: dict[str, Any],
+        provider: str,
+        model: str,
+        template_tokens: int = 0,
+    ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        """
+        Degrade inputs until the prompt fits the model's context window.
+
+        Args:
+            inputs: Inputs for the crew's task templates
+            provider: Provider name
+            model: Model name
+            template_tokens: Tokens of the crew's agent and task templates
+
+        Returns:
+            Tuple of (fitted inputs, list of reductions). Each reduction has
+            the field name, the action taken and the tokens before and after.
+
+        Raises:
+            ValueError: If the inputs do not fit even after all reductions
+        """
+        window = self.context_window(provider, model)
+        # Small windows (e.g. Ollama defaults) cannot spare the full reserve
+        reserve = min(self.output_reserve_tokens, window // 4)
+        budget = window - reserve - self.overhead_tokens - template_tokens
+        sizes = {
+            name: count_tokens(str(value), model) for name, value in inputs.items()
+        }
+        total = sum(sizes.values())
+        if total <= budget:
+            return inputs, []
+
+        fitted = dict(inputs)
+        reductions: list[dict[str, Any]] = []
+        for name in self.policy:
+            if total <= budget:
+                break
+            if name not in fitted or not sizes.get(name):
+                continue
+
+            text = str(fitted[name])
+            actions = []
+            floor = 0
+            if name == "job_description":
+                floor = self.min_job_description_tokens
+                compressed = compress_text(text)
+                if count_tokens(compressed, model) < sizes[name]:
+                    text = compressed
+                    actions.append("compressed")
+
+            marker = f"\n\n[... {name.replace('_', ' ')} shortened to fit ...]"
+            size = count_tokens(text, model)
+            excess = total - (sizes[name] - size) - budget
+            keep = max(floor, size - excess - count_tokens(marker, model))
+            if excess > 0 and size > keep:
+                text = truncate_tokens(text, keep, model) + marker
+                actions.append("trimmed")
+
+            new_size = count_tokens(text, model)
+            if new_size >= sizes[name]:
+                continue
+            reductions.append(
+                {
+                    "field": name,
+                    "action": "+".join(actions),
+                    "tokens_before": sizes[name],
+                    "tokens_after": new_size,
+                }
+            )
+            total -= sizes[name] - new_size
+            sizes[name] = new_size
+            fitted[name] = text
+
+        if total > budget:
+            raise ValueError(
+                f"Prompt needs {total} tokens but {provider}/{model} leaves "
+                f"{budget} tokens for inputs (context window {window}). "
+                "Use a model with a larger context window or shorter inputs."
+            )
+        return fitted, reductions
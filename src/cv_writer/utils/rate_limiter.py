@@ -0,0 +1,447 @@
+"""Provider-aware rate limiting for LLM calls."""
+
+import json
+import random
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+T = TypeVar("T")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a text.
+
+    Uses the common heuristic of roughly four characters per token, which is
+    good enough for budgeting requests against a tokens-per-minute limit.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Estimated token count (at least 1)
+    """
+    return max(1, len(text) // 4)
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """
+    Check whether an exception signals provider throttling (HTTP 429).
+
+    Args:
+        error: Exception raised by an LLM call
+
+    Returns:
+        True if the error is a rate limit / overload error
+    """
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    if status == 429:
+        return True
+
+    message = str(error).lower()
+    return any(
+        marker in message
+        for marker in ("429", "rate limit", "rate_limit", "too many requests")
+    )
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at a fixed rate.
+
+    Reservations always succeed and may drive the bucket into debt; the caller
+    is told how long to wait until the reservation is covered. When a state
+    file is given, the bucket level is stored there under an exclusive file
+    lock so that several processes share the same budget.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        state_file: Path | None = None,
+    ):
+        """
+        Initialize token bucket.
+
+        Args:
+            capacity: Maximum number of tokens the bucket can hold
+            refill_per_second: Tokens added per second
+            state_file: Optional file for sharing state across processes
+        """
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self.state_file = state_file
+        self._level = self.capacity
+        self._updated = time.time()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """
+        Reserve tokens from the bucket.
+
+        Args:
+            amount: Number of tokens to reserve
+
+        Returns:
+            Seconds to wait before the reservation may be used
+        """
+        with self._lock:
+            if self.state_file is not None and fcntl is not None:
+                return self._reserve_shared(amount)
+            self._level, self._updated = self._refill(self._level, self._updated)
+            self._level -= amount
+            return self._wait_time(self._level)
+
+    def _reserve_shared(self, amount: float) -> float:
+        """Reserve tokens using the lock-protected state file."""
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.state_file, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                raw = f.read()
+                state = json.loads(raw) if raw.strip() else {}
+                level, updated = self._refill(
+                    state.get("level", self.capacity), state.get("updated", time.time())
+                )
+                level -= amount
+                f.seek(0)
+                f.truncate()
+                json.dump({"level": level, "updated": updated}, f)
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        return self._wait_time(level)
+
+    def _refill(self, level: float, updated: float) -> tuple[float, float]:
+        """Return the bucket level after refilling up to now."""
+        now = time.time()
+        elapsed = max(0.0, now - updated)
+        return min(self.capacity, level + elapsed * self.refill_per_second), now
+
+    def _wait_time(self, level: float) -> float:
+        """Seconds until a (possibly negative) level is back at zero."""
+        if level >= 0 or self.refill_per_second <= 0:
+            return 0.0
+        return -level / self.refill_per_second
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD concurrency controller.
+
+    The concurrency limit grows additively (about one slot per window of
+    successful calls) and is cut multiplicatively whenever a call is throttled
+    or its latency inflates well beyond the observed baseline. Baselines are
+    kept per kind of call (e.g. per crew), so long writer calls are not
+    compared against the latency of short reviewer calls.
+    """
+
+    def __init__(
+        self,
+        initial: int = 2,
+        minimum: int = 1,
+        maximum: int = 8,
+        decrease_factor: float = 0.5,
+        latency_inflation: float = 2.0,
+    ):
+        """
+        Initialize concurrency controller.
+
+        Args:
+            initial: Initial concurrency limit
+            minimum: Lower bound for the limit
+            maximum: Upper bound for the limit
+            decrease_factor: Multiplier applied to the limit on congestion
+            latency_inflation: Latency / baseline ratio treated as congestion
+        """
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.decrease_factor = decrease_factor
+        self.latency_inflation = latency_inflation
+        self._limit = float(min(max(initial, self.minimum), self.maximum))
+        self._in_flight = 0
+        self._baselines: dict[str, float] = {}
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently holding a slot."""
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """Block until a concurrency slot is available and take it."""
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(
+        self,
+        latency: float | None = None,
+        throttled: bool = False,
+        kind: str = "default",
+    ) -> None:
+        """
+        Release a slot and feed the outcome back into the controller.
+
+        Args:
+            latency: Call latency in seconds (None if the call failed)
+            throttled: Whether the provider throttled the call
+            kind: Kind of call whose latency baseline applies (e.g. crew name)
+        """
+        with self._condition:
+            self._in_flight = max(0, self._in_flight - 1)
+
+            if throttled:
+                self._decrease()
+            elif latency is not None:
+                baseline = self._baselines.get(kind)
+                if baseline is None:
+                    self._baselines[kind] = latency
+                elif latency > baseline * self.latency_inflation:
+                    self._decrease()
+                else:
+                    self._baselines[kind] = 0.9 * baseline + 0.1 * latency
+                    self._limit = min(
+                        float(self.maximum), self._limit + 1.0 / self._limit
+                    )
+
+            self._condition.notify_all()
+
+    def _decrease(self) -> None:
+        """Multiplicatively decrease the limit."""
+        self._limit = max(float(self.minimum), self._limit * self.decrease_factor)
+
+
+class ProviderLimiter:
+    """Request, token and concurrency limits for one provider/model pair."""
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        concurrency: AdaptiveConcurrency,
+        state_dir: Path | None = None,
+        key: str = "default",
+    ):
+        """
+        Initialize provider limiter.
+
+        Args:
+            requests_per_minute: Allowed requests per minute
+            tokens_per_minute: Allowed (estimated) tokens per minute
+            concurrency: Concurrency controller for this provider/model
+            state_dir: Optional directory for cross-process bucket state
+            key: Provider/model key, used for state file names
+        """
+        safe_key = key.replace("/", "__").replace(":", "_")
+        self.requests = TokenBucket(
+            requests_per_minute,
+            requests_per_minute / 60.0,
+            state_dir / f"{safe_key}.requests.json" if state_dir else None,
+        )
+        self.tokens = TokenBucket(
+            tokens_per_minute,
+            tokens_per_minute / 60.0,
+            state_dir / f"{safe_key}.tokens.json" if state_dir else None,
+        )
+        self.concurrency = concurrency
+
+    def acquire(self, tokens: int, sleep: Callable[[float], None] = time.sleep) -> None:
+        """
+        Wait for request and token budget, then take a concurrency slot.
+
+        Args:
+            tokens: Estimated tokens for the call
+            sleep: Sleep function (injectable for testing)
+        """
+        wait = max(self.requests.reserve(1), self.tokens.reserve(tokens))
+        if wait > 0:
+            sleep(wait)
+        self.concurrency.acquire()
+
+    def release(
+        self,
+        latency: float | None = None,
+        throttled: bool = False,
+        kind: str = "default",
+    ) -> None:
+        """Release the concurrency slot taken by acquire()."""
+        self.concurrency.release(latency=latency, throttled=throttled, kind=kind)
+
+
+class RateLimiter:
+    """
+    Shared rate limiter keyed by provider and model.
+
+    One instance is meant to be shared by all flows in a process; buckets can
+    additionally be shared across processes through a state directory.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 60,
+        tokens_per_minute: float = 100_000,
+        models: dict[str, dict[str, Any]] | None = None,
+        concurrency: dict[str, Any] | None = None,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        state_dir: str | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Default requests per minute per provider/model
+            tokens_per_minute: Default tokens per minute per provider/model
+            models: Overrides keyed by "provider/model" or "provider"
+            concurrency: AIMD settings (initial, min, max, latency_inflation)
+            max_retries: Retries for throttled calls
+            backoff_base: Base delay in seconds for exponential backoff
+            backoff_max: Maximum backoff delay in seconds
+            state_dir: Directory for cross-process bucket state (optional)
+            sleep: Sleep function (injectable for testing)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.models = models or {}
+        self.concurrency = concurrency or {}
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.state_dir = Path(state_dir) if state_dir else None
+        self.sleep = sleep
+        self._limiters: dict[str, ProviderLimiter] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Any) -> "RateLimiter":
+        """
+        Create a rate limiter from the ``rate_limits`` config section.
+
+        Args:
+            config: Config instance
+
+        Returns:
+            RateLimiter instance
+        """
+        return cls(
+            requests_per_minute=config.get("rate_limits.requests_per_minute", 60),
+            tokens_per_minute=config.get("rate_limits.tokens_per_minute", 100_000),
+            models=config.get("rate_limits.models", {}),
+            concurrency=config.get("rate_limits.concurrency", {}),
+            max_retries=config.get("rate_limits.max_retries", 5),
+            backoff_base=config.get("rate_limits.backoff_base_seconds", 1.0),
+            backoff_max=config.get("rate_limits.backoff_max_seconds", 60.0),
+            state_dir=config.get("rate_limits.shared_state_dir", None),
+        )
+
+    def limiter_for(self, provider: str, model: str) -> ProviderLimiter:
+        """
+        Get (or create) the limiter for a provider/model pair.
+
+        Args:
+            provider: LLM provider name
+            model: Model name
+
+        Returns:
+            ProviderLimiter instance
+        """
+        key = f"{provider.lower()}/{model}"
+        with self._lock:
+            if key not in self._limiters:
+                limits = self.models.get(key) or self.models.get(provider.lower(), {})
+                concurrency = {**self.concurrency, **limits.get("concurrency", {})}
+                self._limiters[key] = ProviderLimiter(
+                    requests_per_minute=limits.get(
+                        "requests_per_minute", self.requests_per_minute
+                    ),
+                    tokens_per_minute=limits.get(
+                        "tokens_per_minute", self.tokens_per_minute
+                    ),
+                    concurrency=AdaptiveConcurrency(
+                        initial=concurrency.get("initial", 2),
+                        minimum=concurrency.get("min", 1),
+                        maximum=concurrency.get("max", 8),
+                        latency_inflation=concurrency.get("latency_inflation", 2.0),
+                    ),
+                    state_dir=self.state_dir,
+                    key=key,
+                )
+            return self._limiters[key]
+
+    def call(
+        self,
+        provider: str,
+        model: str,
+        fn: Callable[[], T],
+        estimated_tokens: int = 1,
+        kind: str = "default",
+    ) -> T:
+        """
+        Run an LLM call under the provider/model limits.
+
+        Throttled calls are retried with jittered exponential backoff; all
+        other errors are raised immediately.
+
+        Args:
+            provider: LLM provider name
+            model: Model name
+            fn: Zero-argument callable performing the LLM call
+            estimated_tokens: Estimated tokens consumed by the call
+            kind: Kind of call (e.g. crew name) for the latency baseline
+
+        Returns:
+            Result of fn()
+        """
+        limiter = self.limiter_for(provider, model)
+
+        attempt = 0
+        while True:
+            limiter.acquire(estimated_tokens, sleep=self.sleep)
+            start = time.monotonic()
+            try:
+                result = fn()
+            except Exception as e:
+                throttled = is_throttling_error(e)
+                limiter.release(throttled=throttled, kind=kind)
+                if not throttled or attempt >= self.max_retries:
+                    raise
+                self.sleep(self.backoff_delay(attempt))
+                attempt += 1
+                continue
+
+            limiter.release(latency=time.monotonic() - start, kind=kind)
+            return result
+
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        Compute a "full jitter" exponential backoff delay.
+
+        Args:
+            attempt: Zero-based retry attempt
+
+        Returns:
+            Delay in seconds
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return random.uniform(0, ceiling)
@@ -0,0 +1,100 @@
+"""Append-only NDJSON event log for optimization runs."""
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+
+class RunLog:
+    """
+    Append-only event log with one JSON record per line.
+
+    Every record is flushed to the operating system as soon as it is written,
+    so the file can be tailed while the run is in progress. Records are never
+    rewritten; a crashed run leaves a valid log of all completed steps.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        run_id: str | None = None,
+        include_text: bool = False,
+        fsync: bool = False,
+    ):
+        """
+        Initialize run log and open the file for appending.
+
+        Args:
+            path: Path to the NDJSON log file
+            run_id: Run id added to every record
+            include_text: Include full CV and review texts in the records
+            fsync: Also force every record to disk (slower, crash-safe)
+        """
+        self.path = Path(path)
+        self.run_id = run_id
+        self.include_text = include_text
+        self.fsync = fsync
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+        self._lock = threading.Lock()
+
+    def write(self, event: str, text: dict[str, str] | None = None, **fields: Any):
+        """
+        Append an event record.
+
+        Args:
+            event: Event name (e.g. "review", "revision")
+            text: Full texts, only written if include_text is enabled
+            **fields: JSON-serializable event fields
+        """
+        record = {"ts": datetime.now().isoformat(), "event": event}
+        if self.run_id:
+            record["run_id"] = self.run_id
+        record.update(fields)
+        if text and self.include_text:
+            record.update(text)
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(line)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Close the log file."""
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "RunLog":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @staticmethod
+    def read(path: str | Path) -> list[dict[str, Any]]:
+        """
+        Read all complete records of a log file.
+
+        A partially written last line (e.g. from a crashed run) is skipped.
+
+        Args:
+            path: Path to the NDJSON log file
+
+        Returns:
+            List of event records in write order
+        """
+        records = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return records
@@ -0,0 +1,260 @@
+"""SQLite store for optimization run results."""
+
+import json
+import sqlite3
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from cv_writer.models import ReviewFeedback, RunRecord
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    candidate TEXT NOT NULL,
+    job TEXT NOT NULL,
+    cv_hash TEXT NOT NULL,
+    job_hash TEXT NOT NULL,
+    inputs_hash TEXT NOT NULL,
+    memo_key TEXT NOT NULL DEFAULT '',
+    parent_run_id TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL,
+    final_decision TEXT,
+    iterations INTEGER NOT NULL,
+    config TEXT NOT NULL,
+    timings TEXT NOT NULL,
+    cv_draft TEXT NOT NULL,
+    job_description TEXT NOT NULL,
+    final_cv TEXT NOT NULL,
+    translations TEXT NOT NULL,
+    feedback_history TEXT NOT NULL,
+    output_files TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_candidate ON runs (candidate, created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_cv_hash ON runs (cv_hash, created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_job ON runs (job, created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_job_hash ON runs (job_hash, created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_inputs_hash ON runs (inputs_hash, created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_created_at ON runs (created_at);
+"""
+
+# Columns added after the first release: name -> column definition
+_MIGRATIONS = {
+    "memo_key": "TEXT NOT NULL DEFAULT ''",
+    "parent_run_id": "TEXT NOT NULL DEFAULT ''",
+}
+
+_INDEXES_AFTER_MIGRATION = """
+CREATE INDEX IF NOT EXISTS idx_runs_memo_key ON runs (memo_key, created_at);
+"""
+
+# Final statuses of runs whose results can be reused
+COMPLETED_STATUSES = ("APPROVED", "MAX_ITERATIONS_REACHED")
+
+_JSON_FIELDS = ("config", "timings", "translations", "output_files")
+
+# Summary columns returned by find_runs (large text columns are left out)
+_SUMMARY_COLUMNS = (
+    "run_id, created_at, candidate, job, cv_hash, job_hash, inputs_hash, "
+    "status, final_decision, iterations, timings"
+)
+
+
+def new_run_id(now: datetime | None = None) -> str:
+    """
+    Generate a unique, time-sortable run id.
+
+    Args:
+        now: Timestamp to embed (defaults to the current time)
+
+    Returns:
+        Run id such as "20251113_123456_1a2b3c4d"
+    """
+    now = now or datetime.now()
+    return f"{now.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+
+class RunStore:
+    """
+    Indexed history of optimization runs in a SQLite database.
+
+    Each run is written in a single transaction, so readers never see partial
+    runs. The database uses write-ahead logging, which lets concurrent batch
+    runs write while reports read.
+    """
+
+    def __init__(self, path: str | Path, timeout: float = 30.0):
+        """
+        Initialize run store, creating the database if needed.
+
+        Args:
+            path: Path to the SQLite database file
+            timeout: Seconds to wait for a lock held by another process
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._migrate(conn)
+            conn.executescript(_INDEXES_AFTER_MIGRATION)
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """Add columns missing from databases created by older versions."""
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(runs)")}
+        for name, definition in _MIGRATIONS.items():
+            if name in columns:
+                continue
+            try:
+                conn.execute(f"ALTER TABLE runs ADD COLUMN {name} {definition}")
+            except sqlite3.OperationalError as e:
+                # Another process may have added the column concurrently
+                if "duplicate column" not in str(e):
+                    raise
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection that commits on success and always closes."""
+        conn = sqlite3.connect(self.path, timeout=self.timeout)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def save_run(self, record: RunRecord) -> None:
+        """
+        Store a run.
+
+        Args:
+            record: Run to store
+
+        Raises:
+            ValueError: If a run with the same id already exists
+        """
+        row = record.model_dump(mode="json")
+        for field in (*_JSON_FIELDS, "feedback_history"):
+            row[field] = json.dumps(row[field], ensure_ascii=False)
+
+        columns = ", ".join(row)
+        placeholders = ", ".join(f":{column}" for column in row)
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    f"INSERT INTO runs ({columns}) VALUES ({placeholders})", row
+                )
+        except sqlite3.IntegrityError as e:
+            raise ValueError(f"Run already exists: {record.run_id}") from e
+
+    def get_run(self, run_id: str) -> RunRecord | None:
+        """
+        Load a run by id.
+
+        Args:
+            run_id: Run id (a unique prefix is accepted)
+
+        Returns:
+            Stored run, or None if no single run matches
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM runs WHERE run_id LIKE ? ORDER BY run_id LIMIT 2",
+                (f"{run_id}%",),
+            ).fetchall()
+        if len(rows) != 1:
+            return None
+        return self._to_record(rows[0])
+
+    def find_memoized(self, memo_key: str) -> RunRecord | None:
+        """
+        Load the newest completed run with the given memo key.
+
+        Args:
+            memo_key: Fingerprint of all inputs, result-relevant config and
+                prompt templates
+
+        Returns:
+            Stored run, or None if no completed run matches
+        """
+        if not memo_key:
+            return None
+        placeholders = ", ".join("?" for _ in COMPLETED_STATUSES)
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT * FROM runs WHERE memo_key = ? AND status IN ({placeholders}) "
+                "ORDER BY created_at DESC LIMIT 1",
+                (memo_key, *COMPLETED_STATUSES),
+            ).fetchone()
+        return self._to_record(row) if row is not None else None
+
+    def find_runs(
+        self,
+        candidate: str | None = None,
+        job: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        """
+        Find runs by candidate, job and date, newest first.
+
+        Candidate and job match either the stored label or the content hash.
+
+        Args:
+            candidate: Candidate label or CV hash
+            job: Job label or job description hash
+            since: Only runs created at or after this time
+            until: Only runs created before this time
+            limit: Maximum number of runs to return
+
+        Returns:
+            Run summaries (without CV texts)
+        """
+        clauses = []
+        params: list[Any] = []
+        if candidate:
+            clauses.append("(candidate = ? OR cv_hash = ?)")
+            params += [candidate, candidate]
+        if job:
+            clauses.append("(job = ? OR job_hash = ?)")
+            params += [job, job]
+        if since:
+            clauses.append("created_at >= ?")
+            params.append(since.isoformat())
+        if until:
+            clauses.append("created_at < ?")
+            params.append(until.isoformat())
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {_SUMMARY_COLUMNS} FROM runs {where} "
+                "ORDER BY created_at DESC LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+
+        summaries = []
+        for row in rows:
+            summary = dict(row)
+            summary["timings"] = json.loads(summary["timings"])
+            summaries.append(summary)
+        return summaries
+
+    @staticmethod
+    def _to_record(row: sqlite3.Row) -> RunRecord:
+        """Convert a database row into a RunRecord."""
+        data = dict(row)
+        for field in _JSON_FIELDS:
+            data[field] = json.loads(data[field])
+        data["feedback_history"] = [
+            ReviewFeedback(**feedback)
+            for feedback in json.loads(data["feedback_history"])
+        ]
+        return RunRecord(**data)
@@ -0,0 +1,135 @@
+"""SQLite translation memory for CV segments."""
+
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from cv_writer.utils.fingerprint import content_hash
+
+# Bump when segmentation or the translator prompt changes incompatibly
+MEMORY_VERSION = "1"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS segments (
+    key TEXT PRIMARY KEY,
+    language TEXT NOT NULL,
+    model TEXT NOT NULL,
+    source TEXT NOT NULL,
+    translation TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+"""
+
+# SQLite limits the number of parameters per statement
+_BATCH_SIZE = 500
+
+
+class TranslationMemory:
+    """
+    Translated segments keyed by source text, target language and model.
+
+    A segment is only translated once per language and model; later
+    translations of documents containing the same segment reuse it.
+    """
+
+    def __init__(self, path: str | Path, timeout: float = 30.0):
+        """
+        Initialize translation memory, creating the database if needed.
+
+        Args:
+            path: Path to the SQLite database file
+            timeout: Seconds to wait for a lock held by another process
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection that commits on success and always closes."""
+        conn = sqlite3.connect(self.path, timeout=self.timeout)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def key(source: str, language: str, model: str) -> str:
+        """
+        Compute the memory key of a source segment.
+
+        Args:
+            source: Source segment text
+            language: Target language code
+            model: Translation model ("provider/model")
+
+        Returns:
+            Memory key
+        """
+        return content_hash(
+            MEMORY_VERSION, language.lower(), model, source.strip(), length=32
+        )
+
+    def lookup(self, sources: list[str], language: str, model: str) -> list[str | None]:
+        """
+        Look up translations of source segments.
+
+        Args:
+            sources: Source segment texts
+            language: Target language code
+            model: Translation model ("provider/model")
+
+        Returns:
+            Translation per source segment, None where not in memory
+        """
+        keys = [self.key(source, language, model) for source in sources]
+        found: dict[str, str] = {}
+        with self._connect() as conn:
+            for start in range(0, len(keys), _BATCH_SIZE):
+                batch = keys[start : start + _BATCH_SIZE]
+                placeholders = ", ".join("?" for _ in batch)
+                found.update(
+                    conn.execute(
+                        f"SELECT key, translation FROM segments "
+                        f"WHERE key IN ({placeholders})",
+                        batch,
+                    ).fetchall()
+                )
+        return [found.get(key) for key in keys]
+
+    def store(
+        self, translations: list[tuple[str, str]], language: str, model: str
+    ) -> None:
+        """
+        Store translated segments.
+
+        Args:
+            translations: List of (source segment, translation) pairs
+            language: Target language code
+            model: Translation model ("provider/model")
+        """
+        now = datetime.now().isoformat()
+        rows = [
+            (
+                self.key(source, language, model),
+                language.lower(),
+                model,
+                source,
+                text,
+                now,
+            )
+            for source, text in translations
+        ]
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO segments "
+                "(key, language, model, source, translation, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
@@ -0,0 +1,161 @@
+"""Tests for recording and replaying LLM interactions."""
+
+import os
+import time
+
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+from types import SimpleNamespace  # noqa: E402
+from unittest.mock import patch  # noqa: E402
+
+import pytest  # noqa: E402
+
+from cv_writer.flows import CVOptimizationFlow  # noqa: E402
+from cv_writer.utils.cassette import Cassette  # noqa: E402
+from cv_writer.utils.rate_limiter import is_throttling_error  # noqa: E402
+
+
+class ThrottledError(Exception):
+    status_code = 429
+
+
+def _output(raw: str, prompt_tokens: int = 0) -> SimpleNamespace:
+    usage = SimpleNamespace(model_dump=lambda: {"prompt_tokens": prompt_tokens})
+    return SimpleNamespace(raw=raw, token_usage=usage)
+
+
+def _fake_crew(name: str, answer):
+    """Create a crew class whose kickoff answers with answer(inputs)."""
+
+    def crew(self):
+        return SimpleNamespace(kickoff=lambda inputs: _output(answer(inputs), 10))
+
+    return type(name, (), {"__init__": lambda self, llm: None, "crew": crew})
+
+
+def _raise(error_type):
+    def call():
+        raise error_type("Too Many Requests")
+
+    return call
+
+
+def test_record_and_replay_exact(tmp_path):
+    """Test that replayed calls return recorded outputs, usage and errors."""
+    path = tmp_path / "run.cassette.ndjson"
+    with Cassette(path) as cassette:
+        cassette.wrap("ReviewerCrew", "openai/gpt-4o", {"cv": "a"}, lambda: "ok a")()
+        cassette.record(
+            "WriterCrew", "openai/gpt-4o", {"cv": "b"}, lambda: _output("b2", 42)
+        )
+        with pytest.raises(ThrottledError):
+            cassette.record(
+                "WriterCrew", "openai/gpt-4o", {"cv": "c"}, _raise(ThrottledError)
+            )
+
+    replay = Cassette(path, mode="replay", latency_scale=0)
+    writer = replay.replay("WriterCrew", "openai/gpt-4o", {"cv": "b"})
+    with pytest.raises(RuntimeError) as error:
+        replay.replay("WriterCrew", "openai/gpt-4o", {"cv": "c"})
+    review = replay.wrap("ReviewerCrew", "openai/gpt-4o", {"cv": "a"}, None)()
+
+    assert (review.raw, review.token_usage) == ("ok a", None)
+    assert writer.raw == "b2"
+    assert writer.token_usage.prompt_tokens == 42
+    assert is_throttling_error(error.value)
+    assert replay.matches == {"exact": 3, "fallback": 0}
+    assert replay.remaining == 0
+    assert [i["seq"] for i in replay.interactions] == [1, 2, 3]
+
+
+def test_replay_falls_back_to_recorded_order(tmp_path):
+    """Test that changed inputs get the crew's next call, until none is left."""
+    path = tmp_path / "run.cassette.ndjson"
+    with Cassette(path) as cassette:
+        for answer in ("first", "second"):
+            cassette.record(
+                "ReviewerCrew", "ollama/llama3.1", {"n": answer}, lambda a=answer: a
+            )
+
+    replay = Cassette(path, mode="replay", latency_scale=0)
+
+    assert replay.replay("ReviewerCrew", "openai/gpt-4o", {"n": "x"}).raw == "first"
+    # The exact match was already replayed
+    second = replay.replay("ReviewerCrew", "ollama/llama3.1", {"n": "first"})
+    assert second.raw == "second"
+    with pytest.raises(LookupError):
+        replay.replay("ReviewerCrew", "ollama/llama3.1", {"n": "first"})
+    with pytest.raises(LookupError):
+        replay.replay("WriterCrew", "ollama/llama3.1", {})
+    assert replay.matches == {"exact": 0, "fallback": 2}
+
+
+def test_replay_latency(tmp_path):
+    """Test that replays take the recorded duration only at original latency."""
+    path = tmp_path / "run.cassette.ndjson"
+    with Cassette(path) as cassette:
+        cassette.record("ReviewerCrew", "openai/gpt-4o", {}, lambda: time.sleep(0.2))
+
+    original = Cassette(path, mode="replay")
+    started = time.monotonic()
+    original.replay("ReviewerCrew", "openai/gpt-4o", {})
+    assert time.monotonic() - started >= 0.2
+
+    instant = Cassette(path, mode="replay", latency_scale=0)
+    started = time.monotonic()
+    instant.replay("ReviewerCrew", "openai/gpt-4o", {})
+    assert time.monotonic() - started < 0.1
+
+
+def test_unknown_mode(tmp_path):
+    """Test that an unknown mode is rejected."""
+    with pytest.raises(ValueError):
+        Cassette(tmp_path / "run.cassette.ndjson", mode="rewind")
+
+
+def _run_flow(cassette: Cassette) -> CVOptimizationFlow:
+    flow = CVOptimizationFlow("writer", cassette=cassette)
+    flow.state.job_description = "Python developer"
+    flow.state.cv_draft = "# CV\n\nPython"
+    flow.state.max_iterations = 3
+    flow.initialize_flow()
+    flow.review_cv()
+    while flow.route_decision() == "decision_to_revise":
+        flow.revise_cv()
+        flow.review_cv()
+    flow.finalize_flow()
+    return flow
+
+
+def test_flow_replays_recorded_run_without_crews(tmp_path):
+    """Test that a replayed run reproduces a recorded run offline."""
+    path = tmp_path / "run.cassette.ndjson"
+    reviews = iter(["DECISION: REVISE\nAdd Django", "DECISION: APPROVED"])
+    crews = {
+        "ReviewerCrew": _fake_crew("ReviewerCrew", lambda inputs: next(reviews)),
+        "WriterCrew": _fake_crew(
+            "WriterCrew", lambda inputs: inputs["current_cv"] + ", Django"
+        ),
+    }
+    with (
+        patch(
+            "cv_writer.flows.cv_optimization_flow.ReviewerCrew", crews["ReviewerCrew"]
+        ),
+        patch("cv_writer.flows.cv_optimization_flow.WriterCrew", crews["WriterCrew"]),
+        Cassette(path) as cassette,
+    ):
+        recorded = _run_flow(cassette)
+
+    replay = Cassette(path, mode="replay", latency_scale=0)
+    replayed = _run_flow(replay)
+
+    assert [i["crew"] for i in replay.interactions] == [
+        "ReviewerCrew",
+        "WriterCrew",
+        "ReviewerCrew",
+    ]
+    assert replay.matches == {"exact": 3, "fallback": 0}
+    assert replayed.state.status == recorded.state.status == "APPROVED"
+    assert replayed.state.current_cv == recorded.state.current_cv
+    assert replayed.state.current_cv == "# CV\n\nPython, Django"
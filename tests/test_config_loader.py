@@ -99,3 +99,55 @@ def test_config_env_override(monkeypatch):
     config = Config()
     assert config.llm_provider == "ollama"
     assert config.max_iterations == 7
+
+
+def test_rate_limits_config_defaults():
+    """Test rate limiting configuration default values."""
+    config = Config()
+    assert config.rate_limits_enabled is False
+    assert config.get("rate_limits.requests_per_minute") == 60
+    assert config.get("rate_limits.concurrency.max") == 8
+
+
+def test_crew_llm_config_from_file(tmp_path):
+    """Test loading per-crew LLM and routing configuration from file."""
+    config_file = tmp_path / "test_config.yaml"
+    config_content = """
+crews:
+  reviewer:
+    llm_provider: openai
+    llm_model: gpt-4o-mini
+routing:
+  enabled: true
+  fast_llm_model: gpt-4o-mini
+"""
+    config_file.write_text(config_content)
+
+    config = Config(config_file=str(config_file))
+    assert config.reviewer_llm_provider == "openai"
+    assert config.reviewer_llm_model == "gpt-4o-mini"
+    assert config.writer_llm_provider is None
+    assert config.routing_enabled is True
+    assert config.routing_fast_llm_model == "gpt-4o-mini"
+    assert config.get("routing.fast_crews") == ["reviewer"]
+
+
+def test_crew_llm_env_override(monkeypatch):
+    """Test per-crew LLM environment variable overrides."""
+    monkeypatch.setenv("WRITER_LLM_PROVIDER", "anthropic")
+    monkeypatch.setenv("WRITER_LLM_MODEL", "claude-sonnet-4-5")
+
+    config = Config()
+    assert config.writer_llm_provider == "anthropic"
+    assert config.writer_llm_model == "claude-sonnet-4-5"
+
+
+def test_ollama_env_override(monkeypatch):
+    """Test Ollama keep-alive and parallel slot environment overrides."""
+    monkeypatch.setenv("OLLAMA_KEEP_ALIVE", "-1")
+    monkeypatch.setenv("OLLAMA_NUM_PARALLEL", "4")
+
+    config = Config()
+    assert config.ollama_keep_alive == -1
+    assert config.ollama_num_parallel == 4
+    assert config.ollama_warm_up is True
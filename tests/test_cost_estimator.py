@@ -0,0 +1,138 @@
+"""Tests for the dry-run cost estimator."""
+
+import pytest
+from click.testing import CliRunner
+
+from cv_writer.crews import ReviewerCrew
+from cv_writer.crews.translator_crew import TranslatorCrew
+from cv_writer.main import main
+from cv_writer.utils.cost_estimator import CostEstimator, render_prompt
+from cv_writer.utils.ollama import OllamaModel
+
+JOB = "Senior Python engineer. Requirements: Python, AWS, Kubernetes."
+CV = "# Jane Doe\n\n## Experience\n- Python developer at Acme\n"
+
+LLMS = {
+    "reviewer": ("openai", "gpt-4o"),
+    "writer": ("openai", "gpt-4o"),
+    "translator": ("ollama", "llama3.1"),
+}
+
+
+def test_render_prompt_fills_templates():
+    """Test that prompts contain the inputs and crewai's answer format."""
+    prompt = render_prompt(TranslatorCrew, {"cv_content": CV, "target_language": "de"})
+
+    assert "Python developer at Acme" in prompt
+    assert "{cv_content}" not in prompt
+    assert "Final Answer:" in prompt
+    assert "Your personal goal is:" in prompt
+
+
+def test_estimate_call_prices_tokens():
+    """Test cost and latency of a single call from the tables."""
+    estimator = CostEstimator(
+        prices={"openai/gpt-4o": {"input": 1_000_000, "output": 2_000_000}},
+        latencies={"openai": {"first_token": 1, "prompt_tps": 1_000, "output_tps": 10}},
+    )
+    inputs = {
+        "job_description": JOB,
+        "current_cv": CV,
+        "cv_draft": CV,
+        "supporting_docs": "No additional documents provided.",
+        "draft_changes": "None",
+        "iteration_count": 1,
+        "max_iterations": 3,
+    }
+
+    call = estimator.estimate_call(ReviewerCrew, ("openai", "gpt-4o"), inputs, 100)
+
+    assert call["crew"] == "ReviewerCrew"
+    assert call["input_tokens"] > 100
+    assert call["cost"] == pytest.approx(call["input_tokens"] + 200)
+    assert call["seconds"] == pytest.approx(1 + call["input_tokens"] / 1_000 + 10)
+    unknown = estimator.estimate_call(ReviewerCrew, ("openai", "new"), inputs, 100)
+    assert unknown["cost"] is None
+
+
+def test_estimate_run_scenarios():
+    """Test call counts, tokens and wall time per iteration count."""
+    estimator = CostEstimator(review_output_tokens=500)
+
+    estimate = estimator.estimate_run(
+        job_description=JOB,
+        current_cv=CV,
+        cv_draft=CV,
+        supporting_docs=["Certificate: AWS Solutions Architect"],
+        llms=LLMS,
+        iterations=[1, 3],
+        max_iterations=3,
+        candidates=2,
+        translate_to="de",
+    )
+
+    calls = estimate["calls"]
+    best, worst = estimate["scenarios"]
+    assert calls["write"]["input_tokens"] > calls["review"]["input_tokens"]
+    assert best["calls"] == 2
+    assert worst["calls"] == 3 + 2 * 2 + 1
+    assert worst["llms"]["openai/gpt-4o"]["calls"] == 7
+    assert worst["llms"]["ollama/llama3.1"]["cost"] == 0.0
+    assert worst["output_tokens"] == (
+        3 * 500
+        + 4 * calls["write"]["output_tokens"]
+        + calls["translate"]["output_tokens"]
+    )
+    assert worst["cost"] == pytest.approx(
+        3 * calls["review"]["cost"] + 4 * calls["write"]["cost"]
+    )
+    # Candidates run concurrently, so they add no wall time
+    assert worst["seconds"] == pytest.approx(
+        3 * calls["review"]["seconds"]
+        + 2 * calls["write"]["seconds"]
+        + calls["translate"]["seconds"]
+    )
+
+
+def test_estimate_run_unknown_price():
+    """Test that the total cost is unknown if a used model has no price."""
+    estimate = CostEstimator().estimate_run(
+        job_description=JOB,
+        current_cv=CV,
+        cv_draft=CV,
+        supporting_docs=[],
+        llms={**LLMS, "writer": ("openai", "custom-model")},
+        iterations=[1, 2],
+        max_iterations=2,
+    )
+
+    best, typical = estimate["scenarios"]
+    assert best["cost"] is not None
+    assert typical["cost"] is None
+    assert typical["llms"]["openai/custom-model"]["cost"] is None
+
+
+def test_dry_run_does_not_warm_up_ollama(tmp_path, monkeypatch):
+    """Test that --dry-run neither probes nor preloads Ollama models."""
+    calls = []
+    monkeypatch.setattr(
+        OllamaModel, "status", lambda self: calls.append("status") or {}
+    )
+    monkeypatch.setattr(
+        OllamaModel,
+        "preload_in_background",
+        lambda self: calls.append("preload_in_background"),
+    )
+    job = tmp_path / "job.txt"
+    job.write_text(JOB)
+    cv = tmp_path / "cv.md"
+    cv.write_text(CV)
+
+    result = CliRunner().invoke(
+        main,
+        ["-j", str(job), "-c", str(cv), "--llm-provider", "ollama", "--dry-run"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "DRY RUN" in result.output
+    assert calls == []
@@ -0,0 +1,478 @@
+"""Tests for CV optimization flow steps (crew calls are stubbed)."""
+
+import os
+import re
+
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+from pathlib import Path  # noqa: E402
+from unittest.mock import patch  # noqa: E402
+
+import pytest  # noqa: E402
+import yaml  # noqa: E402
+
+from cv_writer.crews.writer_crew import WriterCrew  # noqa: E402
+from cv_writer.flows import CVOptimizationFlow  # noqa: E402
+from cv_writer.tools.requirement_extractor import RequirementExtractor  # noqa: E402
+from cv_writer.utils.deadline import Deadline  # noqa: E402
+from cv_writer.utils.metrics import RUN_ITERATIONS, RUNS  # noqa: E402
+from cv_writer.utils.prompt_budget import PromptBudget  # noqa: E402
+from cv_writer.utils.run_log import RunLog  # noqa: E402
+from cv_writer.utils.translation_memory import TranslationMemory  # noqa: E402
+
+
+class FakeCrews:
+    """Stand-in for _kickoff_crew returning canned outputs per crew."""
+
+    def __init__(self, reviews: list[str], writes: dict[str, str] | None = None):
+        self.reviews = list(reviews)
+        self.writes = writes or {}
+        self.calls: list[tuple[str, dict]] = []
+        self.translate = None
+        self.section_reviews: dict[str, str] = {}
+
+    def __call__(self, crew_class, llm, inputs):
+        name = crew_class.__name__
+        self.calls.append((name, inputs))
+        if name == "ReviewerCrew":
+            return self.reviews.pop(0)
+        if name == "TranslatorCrew":
+            if self.translate is not None:
+                return self.translate(inputs["cv_content"])
+            return f"[de] {inputs['cv_content']}"
+        if name == "SectionReviewerCrew":
+            title = inputs["section_title"]
+            return self.section_reviews.get(title, "DECISION: APPROVED")
+        if name == "RequirementsCrew":
+            return '{"title": "Python developer", "must_have": ["Python"]}'
+        if name == "SectionWriterCrew":
+            return f"{inputs['section'].rstrip()}, revised"
+        if llm in self.writes:
+            if isinstance(self.writes[llm], Exception):
+                raise self.writes[llm]
+            return self.writes[llm]
+        return f"revised {inputs['current_cv']}"
+
+    def names(self) -> list[str]:
+        return [name for name, _ in self.calls]
+
+
+@pytest.fixture
+def make_flow():
+    """Create a flow with stubbed crews and basic inputs."""
+    patches = []
+
+    def factory(
+        reviews: list[str], writes: dict[str, str] | None = None, **kwargs
+    ) -> tuple[CVOptimizationFlow, FakeCrews]:
+        fake = FakeCrews(reviews, writes)
+        patcher = patch.object(
+            CVOptimizationFlow, "_kickoff_crew", lambda flow, *args: fake(*args)
+        )
+        patcher.start()
+        patches.append(patcher)
+
+        flow = CVOptimizationFlow(object(), **kwargs)
+        flow.state.job_description = "Python developer"
+        flow.state.cv_draft = "# CV\n\nPython"
+        flow.state.translate_to = "de"
+        return flow, fake
+
+    yield factory
+    for patcher in patches:
+        patcher.stop()
+
+
+def test_speculative_translation_used_on_approval(make_flow):
+    """Test that an approved first draft reuses the speculative translation."""
+    flow, fake = make_flow(["DECISION: APPROVED"], speculative_translation=True)
+
+    flow.initialize_flow()
+    flow.review_cv()
+    assert flow.route_decision() == "decision_to_finalize"
+    flow.translate_cv()
+    flow.finalize_flow()
+
+    assert fake.names().count("TranslatorCrew") == 1
+    assert flow.state.translated_cv == "[de] # CV\n\nPython"
+
+
+def test_speculative_translation_discarded_on_revision(make_flow):
+    """Test that a stale speculative translation is not used."""
+    flow, fake = make_flow(
+        ["DECISION: REVISE", "DECISION: APPROVED"], speculative_translation=True
+    )
+
+    flow.initialize_flow()
+    flow.review_cv()
+    assert flow.route_decision() == "decision_to_revise"
+    flow.revise_cv()
+    flow.review_cv()
+    assert flow.route_decision() == "decision_to_finalize"
+    flow.translate_cv()
+    flow.finalize_flow()
+
+    assert flow.state.translated_cv == f"[de] {flow.state.current_cv}"
+    assert flow.state.current_cv.startswith("revised")
+
+
+def test_translation_without_speculation(make_flow):
+    """Test that translation only runs in the translation phase by default."""
+    flow, fake = make_flow(["DECISION: APPROVED"])
+
+    flow.initialize_flow()
+    flow.review_cv()
+    assert "TranslatorCrew" not in fake.names()
+    flow.translate_cv()
+
+    assert fake.names() == ["ReviewerCrew", "TranslatorCrew"]
+
+
+def test_best_of_n_keeps_highest_coverage_candidate(make_flow):
+    """Test that best-of-N writing keeps the candidate covering most keywords."""
+    flow, fake = make_flow(
+        ["DECISION: REVISE"],
+        writes={"cold": "# CV\n\nJava", "hot": "# CV\n\nPython developer"},
+        candidate_llms=["cold", "hot"],
+    )
+
+    flow.initialize_flow()
+    flow.review_cv()
+    flow.route_decision()
+    flow.revise_cv()
+
+    assert fake.names().count("WriterCrew") == 2
+    assert flow.state.current_cv == "# CV\n\nPython developer"
+
+
+def test_best_of_n_reuses_reviewer_scoring(make_flow):
+    """Test that the winning candidate's review is reused by review_cv."""
+    flow, fake = make_flow(
+        ["DECISION: REVISE", "DECISION: REVISE", "DECISION: APPROVED"],
+        candidate_llms=["a", "b"],
+        candidate_scoring="reviewer",
+    )
+
+    flow.initialize_flow()
+    flow.review_cv()
+    flow.route_decision()
+    flow.revise_cv()
+    reviews_before = fake.names().count("ReviewerCrew")
+    flow.review_cv()
+
+    assert reviews_before == 3
+    assert fake.names().count("ReviewerCrew") == 3
+    assert flow.state.final_decision == "APPROVED"
+
+
+@pytest.mark.parametrize("crew", ["reviewer_crew", "writer_crew"])
+def test_prompt_puts_run_constant_inputs_first(crew):
+    """Test that per-iteration inputs come after the cacheable prompt prefix."""
+    tasks_file = Path(__file__).parents[1] / "src/cv_writer/crews" / crew
+    tasks = yaml.safe_load((tasks_file / "config/tasks.yaml").read_text())
+    description = next(iter(tasks.values()))["description"]
+
+    constant = [
+        "{job_description}",
+        "{cv_draft}",
+        "{supporting_docs}",
+        "{draft_changes}",
+    ]
+    first_variable = description.index("{current_cv}")
+    assert all(description.index(name) < first_variable for name in constant)
+
+
+def test_run_log_records_each_step(make_flow, tmp_path):
+    """Test that the flow writes one event log record per step."""
+    run_log = RunLog(tmp_path / "run.ndjson")
+    flow, _ = make_flow(["DECISION: REVISE", "DECISION: APPROVED"], run_log=run_log)
+
+    flow.initialize_flow()
+    flow.review_cv()
+    flow.route_decision()
+    flow.revise_cv()
+    flow.review_cv()
+    flow.route_decision()
+    flow.translate_cv()
+    flow.finalize_flow()
+    run_log.close()
+
+    records = RunLog.read(tmp_path / "run.ndjson")
+    assert [r["event"] for r in records] == [
+        "start",
+        "review",
+        "revision",
+        "review",
+        "translation",
+        "finish",
+    ]
+    assert records[1]["decision"] == "REVISE"
+    assert records[2]["cv_chars"] == len(flow.state.current_cv)
+    assert set(records[-1]["timings"]) == {"review", "write", "translate"}
+
+
+def test_prompt_budget_trims_and_records(make_flow):
+    """Test that crew inputs are fitted and reductions are recorded once."""
+    budget = PromptBudget(
+        context_windows={"unknown": 6_000}, overhead_tokens=0, output_reserve_tokens=0
+    )
+    flow, _ = make_flow([], prompt_budget=budget)
+    inputs = {
+        "job_description": "Python developer",
+        "current_cv": flow.state.cv_draft,
+        "cv_draft": flow.state.cv_draft,
+        "supporting_docs": " ".join(f"word{i}" for i in range(6000)),
+        "latest_feedback": "More detail",
+    }
+
+    for _ in range(2):
+        flow._crew_call(WriterCrew, object(), inputs)
+
+    assert len(flow.state.prompt_reductions) == 1
+    assert flow.state.prompt_reductions[0]["field"] == "supporting_docs"
+    assert flow.state.prompt_reductions[0]["crew"] == "WriterCrew"
+
+
+def test_requirement_profile_replaces_job_description(make_flow, tmp_path):
+    """Test that crews receive the extracted requirement profile."""
+    flow, fake = make_flow(
+        ["DECISION: APPROVED"],
+        requirement_extractor=RequirementExtractor(tmp_path),
+        requirements_llm="cheap",
+    )
+
+    flow.initialize_flow()
+    flow.review_cv()
+
+    assert fake.names() == ["RequirementsCrew", "ReviewerCrew"]
+    assert flow.state.requirements.must_have == ["Python"]
+    review_inputs = fake.calls[1][1]
+    assert review_inputs["job_description"] == flow.state.requirements.to_markdown()
+
+
+def test_keyword_gate_skips_review_of_regressed_revision(make_flow):
+    """Test that a revision losing job keywords is sent back without LLM review."""
+    flow, fake = make_flow(
+        ["DECISION: REVISE"],
+        writes={"writer": "# CV\n\nJava"},
+        writer_llm="writer",
+        keyword_gate=True,
+    )
+
+    flow.initialize_flow()
+    flow.review_cv()
+    flow.route_decision()
+    flow.revise_cv()
+    flow.review_cv()
+
+    assert fake.names().count("ReviewerCrew") == 1
+    assert [f.keyword_coverage for f in flow.state.feedback_history] == [0.5, 0.0]
+    assert flow.state.final_decision == "REVISE"
+    assert "restore these job keywords" in flow.state.feedback_history[-1].comments
+    assert flow.route_decision() == "decision_to_revise"
+
+
+def test_min_keyword_coverage_overrides_approval(make_flow):
+    """Test that an approved CV below the coverage threshold is revised."""
+    flow, _ = make_flow(["DECISION: APPROVED"], min_keyword_coverage=0.9)
+
+    flow.initialize_flow()
+    flow.review_cv()
+
+    assert flow.route_decision() == "decision_to_revise"
+    feedback = flow.state.feedback_history[-1]
+    assert feedback.decision == "REVISE"
+    assert "developer" in feedback.comments
+
+
+def test_translation_memory_only_sends_changed_segments(make_flow, tmp_path):
+    """Test that unchanged CV segments are reused from the translation memory."""
+    flow, fake = make_flow([], translation_memory=TranslationMemory(tmp_path / "tm.db"))
+    fake.translate = lambda text: re.sub(r"(?m)^(?!<!--)(?=\S)", "[de] ", text)
+
+    first = flow._translate("# CV\n\n- Python\n- Django\n", "de")
+    second = flow._translate("# CV\n\n- Python\n- FastAPI\n", "de")
+
+    assert first == "[de] # CV\n\n[de] - Python\n[de] - Django"
+    assert second == "[de] # CV\n\n[de] - Python\n[de] - FastAPI"
+    sent = [inputs["cv_content"] for name, inputs in fake.calls]
+    assert sent[1] == "<!-- seg:2 -->\n- FastAPI"
+
+    # Unchanged CVs need no translator call at all
+    flow._translate("# CV\n\n- Python\n- FastAPI\n", "de")
+    assert len(fake.calls) == 2
+
+
+def test_from_run_starts_from_previous_optimized_cv(make_flow):
+    """Test that a continued run reviews the previous CV and its draft edits."""
+    flow, fake = make_flow(["DECISION: APPROVED"])
+    flow.state.previous_cv = "# CV\n\nSenior Java developer"
+    flow.state.previous_cv_draft = "# CV\n\nJava"
+
+    flow.initialize_flow()
+    flow.review_cv()
+
+    assert flow.route_decision() == "decision_to_finalize"
+    review_inputs = fake.calls[0][1]
+    assert review_inputs["current_cv"] == "# CV\n\nSenior Java developer"
+    assert "<<<\nPython\n>>>" in review_inputs["draft_changes"]
+    assert "Removed from or replaced" in review_inputs["draft_changes"]
+
+
+def test_section_review_reviews_sections_in_parallel(make_flow):
+    """Test that section review mode reduces per-section reviews."""
+    flow, fake = make_flow([], review_mode="sections")
+    flow.state.cv_draft = "# Jane\n\n## Summary\nPython\n\n## Skills\nDjango\n"
+    fake.section_reviews["Skills"] = "DECISION: REVISE\n- [HIGH] Add PostgreSQL"
+
+    flow.initialize_flow()
+    flow.review_cv()
+
+    assert fake.names() == ["SectionReviewerCrew"] * 3
+    titles = sorted(inputs["section_title"] for _, inputs in fake.calls)
+    assert titles == ["Jane", "Skills", "Summary"]
+    skills_inputs = next(i for _, i in fake.calls if i["section_title"] == "Skills")
+    assert skills_inputs["original_section"] == "## Skills\nDjango\n"
+    assert flow.state.final_decision == "REVISE"
+    assert (
+        "- [HIGH] **Skills**: Add PostgreSQL"
+        in flow.state.feedback_history[-1].comments
+    )
+
+
+def test_section_writing_rewrites_only_named_sections(make_flow):
+    """Test that section write mode keeps untouched sections byte for byte."""
+    flow, fake = make_flow(
+        ["DECISION: REVISE\n- [HIGH] **Skills**: Add PostgreSQL"],
+        write_mode="sections",
+    )
+    flow.state.cv_draft = "# Jane\n\n## Summary\nPython  \n\n## Skills\nDjango\n\n"
+
+    flow.initialize_flow()
+    flow.review_cv()
+    flow.revise_cv()
+
+    assert fake.names() == ["ReviewerCrew", "SectionWriterCrew"]
+    inputs = fake.calls[1][1]
+    assert inputs["section_title"] == "Skills"
+    assert inputs["section_feedback"] == "- [HIGH] **Skills**: Add PostgreSQL"
+    assert (
+        flow.state.current_cv
+        == "# Jane\n\n## Summary\nPython  \n\n## Skills\nDjango, revised\n\n"
+    )
+
+
+def test_section_writing_keeps_unmapped_action_items(make_flow):
+    """Test that items naming no section reach the header and touched sections."""
+    flow, fake = make_flow(
+        ["DECISION: REVISE\n- Rework the Skills section\n- Mention Kubernetes"],
+        write_mode="sections",
+    )
+    flow.state.cv_draft = "# Jane\n\n## Summary\nPython\n\n## Skills\nDjango\n"
+
+    flow.initialize_flow()
+    flow.review_cv()
+    flow.revise_cv()
+
+    assert fake.names() == ["ReviewerCrew"] + ["SectionWriterCrew"] * 2
+    feedback = {i["section_title"]: i["section_feedback"] for _, i in fake.calls[1:]}
+    assert feedback == {
+        "Jane": "- Mention Kubernetes",
+        "Skills": "- Rework the Skills section\n- Mention Kubernetes",
+    }
+
+
+def test_section_writing_tells_repeated_titles_apart(make_flow):
+    """Test that repeated section titles are matched to their own original."""
+    flow, fake = make_flow(
+        ["DECISION: REVISE\n- [HIGH] **Projects**: Add metrics"],
+        write_mode="sections",
+    )
+    flow.state.cv_draft = "# Jane\n\n## Projects\nShop\n\n## Projects\nBlog\n"
+
+    flow.initialize_flow()
+    flow.review_cv()
+    flow.revise_cv()
+
+    originals = [inputs["original_section"] for _, inputs in fake.calls[1:]]
+    assert sorted(originals) == ["## Projects\nBlog\n", "## Projects\nShop\n\n"]
+
+
+def test_section_writing_falls_back_to_full_rewrite(make_flow):
+    """Test that feedback naming no section rewrites the whole CV."""
+    flow, fake = make_flow(
+        ["DECISION: REVISE\nMore detail please."], write_mode="sections"
+    )
+    flow.state.cv_draft = "# Jane\n\n## Summary\nPython\n\n## Skills\nDjango\n"
+
+    flow.initialize_flow()
+    flow.review_cv()
+    flow.revise_cv()
+
+    assert fake.names() == ["ReviewerCrew", "WriterCrew"]
+
+
+def test_deadline_finalizes_when_cycle_does_not_fit(make_flow):
+    """Test that the flow stops revising when the next cycle would be late."""
+    now = [0.0]
+    deadline = Deadline(100, clock=lambda: now[0])
+    deadline.record("write", 30)
+    flow, fake = make_flow(["DECISION: REVISE\nAdd Django"], deadline=deadline)
+
+    flow.initialize_flow()
+    flow.review_cv()
+    assert flow.route_decision() == "decision_to_revise"
+
+    now[0] = 50
+    assert flow.route_decision() == "decision_to_finalize"
+    assert flow.state.status == "DEADLINE_REACHED"
+
+
+def test_deadline_during_revision_keeps_current_cv(make_flow):
+    """Test that a revision cut off by the deadline finalizes the current CV."""
+    now = [0.0]
+    flow, fake = make_flow(
+        ["DECISION: REVISE\nAdd Django"], deadline=Deadline(100, clock=lambda: now[0])
+    )
+    fake.writes[flow.writer_llm] = TimeoutError("WriterCrew did not finish")
+
+    flow.initialize_flow()
+    flow.review_cv()
+    assert flow.route_decision() == "decision_to_revise"
+    now[0] = 100
+    flow.revise_cv()
+    flow.review_cv()
+
+    assert fake.names() == ["ReviewerCrew", "WriterCrew"]
+    assert flow.state.iteration_count == 1
+    assert flow.route_decision() == "decision_to_finalize"
+    assert flow.state.status == "DEADLINE_REACHED"
+    assert flow.state.current_cv == "# CV\n\nPython"
+
+
+def test_call_timeout_without_deadline_fails(make_flow):
+    """Test that a timed-out call is an error when no deadline is set."""
+    flow, fake = make_flow(["DECISION: REVISE\nAdd Django"])
+    fake.writes[flow.writer_llm] = TimeoutError("WriterCrew did not finish")
+
+    flow.initialize_flow()
+    flow.review_cv()
+    with pytest.raises(TimeoutError):
+        flow.revise_cv()
+
+
+def test_finished_runs_are_counted(make_flow):
+    """Test that the flow reports finished runs and their iterations."""
+    flow, _ = make_flow(["DECISION: APPROVED"])
+    flow.state.translate_to = None
+    approved = RUNS.value(status="APPROVED")
+    runs = RUN_ITERATIONS.count()
+
+    flow.initialize_flow()
+    flow.review_cv()
+    flow.route_decision()
+    flow.finalize_flow()
+
+    assert RUNS.value(status="APPROVED") == approved + 1
+    assert RUN_ITERATIONS.count() == runs + 1
@@ -0,0 +1,78 @@
+"""Tests for CV segmentation."""
+
+import pytest
+
+from cv_writer.tools.cv_sections import (
+    diff_segments,
+    join_segments,
+    mark_segments,
+    parse_marked,
+    split_sections,
+    split_segments,
+)
+
+CV = """# Jane Doe
+
+## Experience
+### Backend Developer
+- Built APIs
+  with FastAPI
+- Ran PostgreSQL
+
+Summary paragraph
+over two lines
+
+
+"""
+
+
+def test_split_segments_round_trip():
+    """Test that headings, list items and paragraphs become segments."""
+    segments = split_segments(CV)
+
+    assert [body for body, _ in segments] == [
+        "# Jane Doe",
+        "## Experience",
+        "### Backend Developer",
+        "- Built APIs\n  with FastAPI",
+        "- Ran PostgreSQL",
+        "Summary paragraph\nover two lines",
+    ]
+    assert join_segments(segments) == CV
+
+
+def test_marked_segments_round_trip():
+    """Test marking segments and parsing them back."""
+    segments = {0: "# Jane Doe", 3: "- Built APIs\n  with FastAPI"}
+
+    assert parse_marked("Translation:\n" + mark_segments(segments)) == segments
+
+
+def test_parse_marked_rejects_missing_or_repeated_markers():
+    """Test that answers without usable markers are rejected."""
+    with pytest.raises(ValueError):
+        parse_marked("# Jane Doe")
+    with pytest.raises(ValueError):
+        parse_marked("<!-- seg:1 -->\na\n<!-- seg:1 -->\nb")
+
+
+def test_diff_segments_reports_changed_segments():
+    """Test segment diff between two CV drafts."""
+    old = "# Jane Doe\n\n- Built APIs\n- Ran MySQL\n\nSummary"
+    new = "# Jane Doe\n\n- Built APIs\n- Ran PostgreSQL\n- Led a team\n\nSummary"
+
+    added, removed = diff_segments(old, new)
+
+    assert added == ["- Ran PostgreSQL", "- Led a team"]
+    assert removed == ["- Ran MySQL"]
+    assert diff_segments(old, old) == ([], [])
+
+
+def test_split_sections_by_repeated_heading_level():
+    """Test splitting a CV into header and top-level sections."""
+    sections = split_sections(CV + "## Skills\n- Python\n")
+
+    assert [title for title, _ in sections] == ["Jane Doe", "Experience", "Skills"]
+    assert sections[1][1].startswith("## Experience\n### Backend Developer")
+    assert "".join(text for _, text in sections) == CV + "## Skills\n- Python\n"
+    assert split_sections("Plain text") == [("", "Plain text")]
@@ -0,0 +1,65 @@
+"""Tests for per-call timeouts and run deadlines."""
+
+import time
+
+import pytest
+
+from cv_writer.utils.deadline import Deadline, call_with_timeout
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_call_with_timeout_abandons_hung_call():
+    """Test that a call exceeding its timeout raises TimeoutError."""
+    started = time.monotonic()
+
+    with pytest.raises(TimeoutError, match="ReviewerCrew did not finish"):
+        call_with_timeout(lambda: time.sleep(5), 0.05, name="ReviewerCrew")
+
+    assert time.monotonic() - started < 1
+
+
+def test_call_with_timeout_returns_result_and_errors():
+    """Test that results and errors of finished calls are passed through."""
+    assert call_with_timeout(lambda: "ok", 1) == "ok"
+    assert call_with_timeout(lambda: "ok", None) == "ok"
+    with pytest.raises(ValueError, match="bad"):
+        call_with_timeout(lambda: (_ for _ in ()).throw(ValueError("bad")), 1)
+
+
+def test_deadline_bounds_call_timeouts():
+    """Test that call timeouts never exceed the remaining run time."""
+    clock = FakeClock()
+    deadline = Deadline(100, clock=clock)
+
+    assert deadline.timeout(300) == 100
+    clock.now = 80
+    assert deadline.timeout(10) == 10
+    assert deadline.timeout() == 20
+    clock.now = 100
+    assert deadline.expired()
+    with pytest.raises(TimeoutError, match="deadline"):
+        deadline.timeout(10)
+
+
+def test_deadline_estimates_phases_from_longest_observation():
+    """Test that unobserved phases are estimated from the slowest phase."""
+    clock = FakeClock()
+    deadline = Deadline(100, clock=clock)
+    deadline.record("review", 20)
+    deadline.record("review", 30)
+    deadline.record("write", 25)
+
+    assert deadline.estimate("review") == 30
+    assert deadline.estimate("translate") == 30
+    assert deadline.fits("write", "review")
+    clock.now = 50
+    assert not deadline.fits("write", "review")
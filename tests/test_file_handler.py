@@ -1,5 +1,7 @@
 """Tests for file handler."""
 
+import stat
+
 from cv_writer.models import ReviewFeedback
 from cv_writer.utils.file_handler import FileHandler
 
@@ -103,3 +105,31 @@ def test_read_file(tmp_path):
 
     result = FileHandler.read_file(str(test_file))
     assert result == test_content
+
+
+def test_save_cv_never_overwrites(tmp_path):
+    """Test that saves with the same file name get unique paths."""
+    paths = [
+        FileHandler.save_cv(f"CV {i}", str(tmp_path), "cv_{run_id}.md", run_id="run")
+        for i in range(3)
+    ]
+
+    assert [p.name for p in paths] == ["cv_run.md", "cv_run_2.md", "cv_run_3.md"]
+    assert [p.read_text() for p in paths] == ["CV 0", "CV 1", "CV 2"]
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_write_atomic_keeps_usual_permissions(tmp_path):
+    """Test that atomic writes do not leave owner-only files behind."""
+    new_file = tmp_path / "new.md"
+    FileHandler.write_atomic(new_file, "new")
+    plain = tmp_path / "plain.md"
+    plain.write_text("plain")
+    existing = tmp_path / "existing.md"
+    existing.write_text("old")
+    existing.chmod(0o640)
+    FileHandler.write_atomic(existing, "replaced")
+
+    assert stat.S_IMODE(new_file.stat().st_mode) == stat.S_IMODE(plain.stat().st_mode)
+    assert stat.S_IMODE(existing.stat().st_mode) == 0o640
+    assert existing.read_text() == "replaced"
@@ -0,0 +1,154 @@
+"""Tests for hedged requests and circuit breaker."""
+
+import threading
+import time
+
+import pytest
+
+from cv_writer.utils.hedging import CircuitBreaker, HedgingPolicy, LatencyTracker
+
+
+def test_latency_tracker_percentile():
+    """Test latency percentile computation."""
+    tracker = LatencyTracker()
+    assert tracker.percentile(95) is None
+
+    for seconds in range(1, 101):
+        tracker.record(float(seconds))
+    assert tracker.percentile(50) == pytest.approx(50, abs=1)
+    assert tracker.percentile(95) == pytest.approx(95, abs=1)
+
+
+def test_circuit_breaker_opens_and_recovers():
+    """Test circuit breaker state transitions."""
+    now = {"t": 0.0}
+    breaker = CircuitBreaker(
+        failure_threshold=2, reset_timeout=10, clock=lambda: now["t"]
+    )
+
+    breaker.record_failure()
+    assert breaker.allow_request() is True
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.allow_request() is False
+
+    now["t"] = 11.0
+    assert breaker.state == "half_open"
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_circuit_breaker_admits_single_half_open_trial():
+    """Test that concurrent callers of a half-open circuit get one trial."""
+    now = {"t": 0.0}
+    breaker = CircuitBreaker(
+        failure_threshold=1, reset_timeout=10, clock=lambda: now["t"]
+    )
+    breaker.record_failure()
+    now["t"] = 11.0
+
+    barrier = threading.Barrier(8)
+    admitted = []
+
+    def caller():
+        barrier.wait()
+        admitted.append(breaker.allow_request())
+
+    threads = [threading.Thread(target=caller) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(admitted) == [False] * 7 + [True]
+
+    # A failed trial reopens the circuit; the next trial follows the timeout
+    breaker.record_failure()
+    assert breaker.allow_request() is False
+    now["t"] = 22.0
+    assert breaker.allow_request() is True
+    assert breaker.allow_request() is False
+
+    # An abandoned trial is replaced after another reset timeout
+    now["t"] = 33.0
+    assert breaker.allow_request() is True
+    breaker.record_success()
+    assert breaker.allow_request() is True
+    assert breaker.allow_request() is True
+
+
+def test_hedge_delay_uses_percentile():
+    """Test hedge delay falls back to initial delay and is clamped."""
+    policy = HedgingPolicy(initial_delay=30, min_delay=1, max_delay=60, min_samples=3)
+    assert policy.hedge_delay("ReviewerCrew") == 30
+
+    for seconds in (2.0, 3.0, 4.0):
+        policy.tracker("ReviewerCrew").record(seconds)
+    assert policy.hedge_delay("ReviewerCrew") == 4.0
+
+
+def test_run_returns_fast_primary():
+    """Test that a fast primary call needs no hedge."""
+    policy = HedgingPolicy()
+    secondary_calls = []
+
+    result = policy.run(
+        ("openai/gpt-4o", lambda: "primary"),
+        ("anthropic/claude", lambda: secondary_calls.append(1) or "secondary"),
+    )
+
+    assert result == "primary"
+    assert secondary_calls == []
+
+
+def test_run_hedges_slow_primary():
+    """Test that a slow primary call is hedged to the secondary target."""
+    policy = HedgingPolicy(initial_delay=0.05, min_delay=0.01)
+    release = threading.Event()
+
+    def slow_primary():
+        release.wait(2)
+        return "primary"
+
+    start = time.monotonic()
+    result = policy.run(
+        ("openai/gpt-4o", slow_primary), ("anthropic/claude", lambda: "secondary")
+    )
+    release.set()
+
+    assert result == "secondary"
+    assert time.monotonic() - start < 1
+
+
+def test_run_fails_over_on_error():
+    """Test that a failing primary call fails over to the secondary target."""
+    policy = HedgingPolicy(initial_delay=10, failure_threshold=1)
+
+    def failing_primary():
+        raise RuntimeError("provider down")
+
+    result = policy.run(
+        ("openai/gpt-4o", failing_primary), ("anthropic/claude", lambda: "secondary")
+    )
+    assert result == "secondary"
+    assert policy.breaker("openai/gpt-4o").allow_request() is False
+
+    # With the primary circuit open, the secondary target is used directly
+    primary_calls = []
+    result = policy.run(
+        ("openai/gpt-4o", lambda: primary_calls.append(1) or "primary"),
+        ("anthropic/claude", lambda: "secondary"),
+    )
+    assert result == "secondary"
+    assert primary_calls == []
+
+
+def test_run_raises_when_all_targets_fail():
+    """Test that the last error is raised if every attempt fails."""
+    policy = HedgingPolicy(initial_delay=10)
+
+    def failing():
+        raise RuntimeError("provider down")
+
+    with pytest.raises(RuntimeError, match="provider down"):
+        policy.run(("openai/gpt-4o", failing))
@@ -0,0 +1,105 @@
+"""Tests for local job fit ranking."""
+
+import random
+import time
+
+import numpy as np
+import pytest
+
+from cv_writer.tools import job_ranker
+from cv_writer.tools.job_ranker import JobRanker
+
+CV = """# Jane Doe
+Python developer building Django services on AWS.
+Kubernetes deployments, PostgreSQL databases and CI/CD pipelines.
+"""
+
+JOBS = [
+    "Java engineer. Spring Boot, Maven and Oracle.",
+    "Senior Python engineer. Django and AWS required, Kubernetes a plus. Python!",
+    "Head chef for a busy kitchen. Menu planning and cooking.",
+    "Data analyst with Excel reporting skills and some Python.",
+]
+
+
+@pytest.mark.parametrize("method", ["tfidf", "bm25"])
+def test_rank_orders_jobs_by_fit(method):
+    """Test that the best matching posting ranks first and unrelated last."""
+    ranking = JobRanker(method).rank(CV, JOBS)
+
+    assert [match["index"] for match in ranking] == [1, 3, 0, 2]
+    assert ranking[-1]["score"] == 0.0
+    assert ranking[-1]["keywords"] == []
+    assert set(ranking[0]["keywords"]) == {"python", "django", "aws", "kubernetes"}
+    assert ranking[1]["keywords"] == ["python"]
+
+
+def test_tfidf_scores_are_cosine_similarities():
+    """Test that TF-IDF scores are 1 for an identical text and within 0-1."""
+    ranking = JobRanker("tfidf").rank(CV, [*JOBS, CV], top_k=2)
+
+    assert len(ranking) == 2
+    assert ranking[0]["index"] == 4
+    assert ranking[0]["score"] == pytest.approx(1.0)
+    assert 0 < ranking[1]["score"] < 1
+
+
+def test_rank_keeps_input_order_of_ties():
+    """Test that equally fitting jobs keep their input order."""
+    ranking = JobRanker("bm25").rank(CV, ["Cooking", "Python", "Baking", "Python"])
+
+    assert [match["index"] for match in ranking] == [1, 3, 0, 2]
+    assert JobRanker().rank(CV, []) == []
+
+
+def test_unknown_method_and_missing_embeddings(monkeypatch):
+    """Test that unusable methods are rejected when the ranker is created."""
+    with pytest.raises(ValueError, match="Unknown ranking method"):
+        JobRanker("cosine")
+
+    monkeypatch.setattr(job_ranker, "SentenceTransformer", None)
+    with pytest.raises(ValueError, match="sentence-transformers"):
+        JobRanker("embedding")
+
+
+def test_embedding_method_uses_local_model(monkeypatch):
+    """Test that embedding scores are cosine similarities of the vectors."""
+    loaded = []
+
+    class FakeModel:
+        def __init__(self, name):
+            loaded.append(name)
+
+        def encode(self, texts, normalize_embeddings, convert_to_numpy):
+            assert normalize_embeddings
+            vectors = np.array(
+                [
+                    [1.0, "python" in text.lower(), "chef" in text.lower()]
+                    for text in texts
+                ]
+            )
+            return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    monkeypatch.setattr(job_ranker, "SentenceTransformer", FakeModel)
+    ranker = JobRanker("embedding", embedding_model="local-model")
+
+    ranking = ranker.rank(CV, JOBS)
+    ranker.rank(CV, JOBS)
+
+    assert loaded == ["local-model"]
+    assert [match["index"] for match in ranking][:2] == [1, 3]
+    assert "python" in ranking[0]["keywords"]
+
+
+def test_rank_thousand_postings():
+    """Test that 1,000 postings are ranked in seconds."""
+    rng = random.Random(0)
+    words = [f"term{i}" for i in range(3000)]
+    jobs = [" ".join(rng.choices(words, k=400)) for _ in range(1000)]
+    jobs[700] += " Python Django AWS Kubernetes PostgreSQL"
+
+    started = time.monotonic()
+    ranking = JobRanker("bm25").rank(CV, jobs, top_k=5)
+
+    assert time.monotonic() - started < 10
+    assert ranking[0]["index"] == 700
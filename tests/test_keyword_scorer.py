@@ -0,0 +1,98 @@
+"""Tests for keyword coverage scorer."""
+
+from pathlib import Path
+
+from cv_writer.tools.keyword_scorer import KeywordCoverageScorer, stem, tokenize
+
+
+def test_tokenize_keeps_technology_names():
+    """Test tokenization of technology names and stopword removal."""
+    tokens = tokenize("Experience with C++, C#, Node.js and CI-CD for the team.")
+    assert "c++" in tokens
+    assert "c#" in tokens
+    assert "node.js" in tokens
+    assert "ci-cd" in tokens
+    assert "the" not in tokens
+    assert "with" not in tokens
+
+
+def test_score_coverage():
+    """Test keyword coverage of CVs."""
+    scorer = KeywordCoverageScorer("We use Python Django PostgreSQL Kubernetes")
+    assert scorer.score("Python and Django developer") == 0.5
+    assert scorer.score("Python Django PostgreSQL Kubernetes") == 1.0
+    assert scorer.missing_keywords("Python and Django developer") == [
+        "postgresql",
+        "kubernetes",
+    ]
+
+
+def test_score_empty_job_description():
+    """Test scoring with no usable keywords."""
+    scorer = KeywordCoverageScorer("the and of")
+    assert scorer.score("Python") == 0.0
+
+
+def test_stemming_matches_inflections():
+    """Test that inflected forms of job keywords count as covered."""
+    scorer = KeywordCoverageScorer("Managing microservices and deployments")
+    assert scorer.score("Managed a microservice deployment") == 1.0
+    assert stem("technologies") == stem("technology")
+    assert stem("node.js") == "node.js"
+
+
+def test_repeated_phrases_become_keywords():
+    """Test that phrases occurring twice are scored as keywords."""
+    scorer = KeywordCoverageScorer(
+        "Machine learning engineer\nDeploy machine learning models"
+    )
+    assert "machine learning" in scorer.keywords
+    assert "machine learning" in scorer.missing_keywords("Machine tools, learning")
+
+
+def test_score_many_matches_single_scores():
+    """Test batched scoring of several CV versions."""
+    scorer = KeywordCoverageScorer("Python Django\nPython PostgreSQL\nKubernetes")
+    cvs = ["Python", "Django and Kubernetes", "Python Django PostgreSQL Kubernetes"]
+    scores = scorer.score_many(cvs)
+    assert scores.shape == (3,)
+    assert list(scores) == [scorer.score(cv) for cv in cvs]
+    assert scores[2] == 1.0
+
+
+def test_example_job_description_skills_rank_first():
+    """Test that real skills outrank headings, metadata and boilerplate."""
+    job_description = (
+        Path(__file__).parent.parent / "examples" / "example_job_description.txt"
+    ).read_text()
+    scorer = KeywordCoverageScorer(job_description)
+
+    skills = {"python", "react", "typescript", "aws", "docker", "kubernetes", "sql"}
+    assert skills <= set(scorer.keywords[:30])
+    boilerplate = {
+        "techcorp",
+        "inc",
+        "location",
+        "type",
+        "re",
+        "seeking",
+        "description",
+        "key",
+        "responsibilities",
+        "using",
+    }
+    assert not boilerplate & set(scorer.keywords)
+
+
+def test_presence_of_many_cvs():
+    """Test the keyword presence matrix of a batch of CVs."""
+    scorer = KeywordCoverageScorer("We use Python, Django and AWS")
+    matrix = scorer.presence(["Django on AWS", "", "Cooking", "python python"])
+
+    assert matrix.tolist() == [
+        [False, True, True],
+        [False, False, False],
+        [False, False, False],
+        [True, False, False],
+    ]
+    assert scorer.presence([]).shape == (0, 3)
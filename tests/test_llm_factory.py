@@ -1,9 +1,14 @@
 """Tests for LLM factory."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 import pytest
 
+from cv_writer.config import Config
+from cv_writer.loadtest import StubLLMServer
+from cv_writer.main import _create_candidate_llms
 from cv_writer.utils.llm_factory import LLMFactory
 
 
@@ -49,3 +54,171 @@ def test_create_ollama_llm():
     """Test creating Ollama LLM (no API key required)."""
     llm = LLMFactory.create_llm("ollama", "llama3.1", temperature=0.7)
     assert llm is not None
+
+
+@patch.dict("os.environ", {"OPENAI_API_KEY": "test_key"})
+def test_describe_llm():
+    """Test determining provider and model of an LLM instance."""
+    openai_llm = LLMFactory.create_llm("openai", "gpt-4o", temperature=0.7)
+    ollama_llm = LLMFactory.create_llm("ollama", "llama3.1", temperature=0.7)
+
+    assert LLMFactory.describe_llm(openai_llm) == ("openai", "gpt-4o")
+    assert LLMFactory.describe_llm(ollama_llm) == ("ollama", "llama3.1")
+    assert LLMFactory.describe_llm(object())[0] == "unknown"
+
+
+@patch.dict("os.environ", {"OPENAI_API_KEY": "test_key", "ANTHROPIC_API_KEY": "k"})
+def test_create_llm_with_prompt_caching():
+    """Test that prompt caching adds provider-specific request parameters."""
+    openai_llm = LLMFactory.create_llm("openai", "gpt-4o", prompt_caching=True)
+    anthropic_llm = LLMFactory.create_llm(
+        "anthropic", "claude-sonnet-4-5", prompt_caching=True
+    )
+    plain_llm = LLMFactory.create_llm("openai", "gpt-4o")
+
+    assert openai_llm.model_kwargs == {"prompt_cache_key": "cv-writer"}
+    assert anthropic_llm.model_kwargs == {"cache_control": {"type": "ephemeral"}}
+    assert plain_llm.model_kwargs == {}
+
+
+def test_create_ollama_llm_with_keep_alive():
+    """Test passing the keep-alive and endpoint to Ollama clients."""
+    llm = LLMFactory.create_llm(
+        "ollama", "llama3.1", base_url="http://gpu-box:11434", keep_alive="30m"
+    )
+
+    assert llm.keep_alive == "30m"
+    assert llm.base_url == "http://gpu-box:11434"
+
+
+@pytest.fixture
+def llm_pool():
+    """Start and end a test with an empty client pool."""
+    LLMFactory.close_pool()
+    yield
+    LLMFactory.close_pool()
+
+
+@patch.dict("os.environ", {"OPENAI_API_KEY": "test_key"})
+def test_pooled_llms_are_shared(llm_pool):
+    """Test that pooled instances are shared per argument set."""
+    first = LLMFactory.create_llm("openai", "gpt-4o", pooled=True)
+    second = LLMFactory.create_llm("openai", "gpt-4o", pooled=True)
+    hotter = LLMFactory.create_llm("openai", "gpt-4o", temperature=1.0, pooled=True)
+    unpooled = LLMFactory.create_llm("openai", "gpt-4o")
+
+    assert first is second
+    assert hotter is not first
+    assert unpooled is not first
+    assert first.http_client is hotter.http_client
+    assert unpooled.http_client is None
+
+
+@patch.dict("os.environ", {"OPENAI_API_KEY": "test_key"})
+def test_pooled_llm_creation_is_thread_safe(llm_pool):
+    """Test that concurrent callers get a single pooled instance."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        llms = list(
+            executor.map(
+                lambda _: LLMFactory.create_llm("openai", "gpt-4o", pooled=True),
+                range(16),
+            )
+        )
+
+    assert all(llm is llms[0] for llm in llms)
+
+
+@patch.dict("os.environ", {"OPENAI_API_KEY": "test_key"})
+def test_crew_llm_shares_pooled_connections(llm_pool):
+    """Test that crew LLMs of pooled instances share one HTTP client."""
+    LLMFactory.configure_pool(max_connections=4)
+    pooled = LLMFactory.create_llm("openai", "gpt-4o", pooled=True)
+    unpooled = LLMFactory.create_llm("openai", "gpt-4o")
+
+    first = LLMFactory.crew_llm(pooled)
+    second = LLMFactory.crew_llm(pooled)
+
+    assert first is not second
+    assert first.model == "gpt-4o"
+    assert first.client._client is pooled.http_client
+    assert second.client._client is pooled.http_client
+    assert LLMFactory.crew_llm(unpooled).client._client is not pooled.http_client
+    LLMFactory.configure_pool()
+
+
+@patch.dict("os.environ", {"OPENAI_API_KEY": "test_key", "ANTHROPIC_API_KEY": "k"})
+def test_crew_llm_sends_prompt_caching_parameters(llm_pool):
+    """Test that the LLM handed to crews sends the prompt caching hints."""
+    messages = [{"role": "user", "content": "Review this CV"}]
+    openai_llm = LLMFactory.crew_llm(
+        LLMFactory.create_llm("openai", "gpt-4o", prompt_caching=True, pooled=True)
+    )
+    anthropic_llm = LLMFactory.crew_llm(
+        LLMFactory.create_llm("anthropic", "claude-sonnet-4-5", prompt_caching=True)
+    )
+    plain_llm = LLMFactory.crew_llm(LLMFactory.create_llm("openai", "gpt-4o"))
+
+    openai_params = openai_llm._prepare_completion_params(messages)
+    anthropic_params = anthropic_llm._prepare_completion_params(messages)
+
+    assert openai_params["prompt_cache_key"] == "cv-writer"
+    assert openai_params["temperature"] == 0.7
+    assert anthropic_params["cache_control"] == {"type": "ephemeral"}
+    assert anthropic_params["model"] == "claude-sonnet-4-5"
+    assert "prompt_cache_key" not in plain_llm._prepare_completion_params(messages)
+    assert LLMFactory.crew_llm("gpt-4o") == "gpt-4o"
+
+
+@patch.dict("os.environ", {"OPENAI_API_KEY": "test_key"})
+def test_candidate_crew_llms_carry_temperature_and_seed():
+    """Test that best-of-N crew LLMs send distinct temperatures and seeds."""
+    cfg = Config()
+    cfg.set("llm.provider", "openai")
+    cfg.set("llm.model", "gpt-4o")
+    cfg.set("optimizer.candidates", 3)
+
+    crew_llms = [LLMFactory.crew_llm(llm) for llm in _create_candidate_llms(cfg)]
+    params = [
+        llm._prepare_completion_params([{"role": "user", "content": "CV"}])
+        for llm in crew_llms
+    ]
+
+    assert [p["seed"] for p in params] == [0, 1, 2]
+    assert len({p["temperature"] for p in params}) == 3
+
+
+@patch.dict("os.environ", {"OPENAI_API_KEY": "test_key"})
+def test_crew_llm_calls_configured_endpoint(llm_pool):
+    """Test that crew calls reach base_url without changing the environment."""
+    os.environ.pop("OPENAI_BASE_URL", None)
+    with StubLLMServer(latency=0, tokens_per_second=0, approve_rate=1) as server:
+        llm = LLMFactory.create_llm("openai", "gpt-4o", base_url=server.url)
+        answer = LLMFactory.crew_llm(llm).call("Start with DECISION:")
+
+        assert server.stats()["requests"] == 1
+
+    assert "DECISION: APPROVED" in answer
+    assert "OPENAI_BASE_URL" not in os.environ
+
+
+def test_crew_llm_sends_ollama_keep_alive(monkeypatch):
+    """Test that Ollama crew calls carry keep-alive, seed and endpoint."""
+    built = []
+    monkeypatch.setattr(
+        "cv_writer.utils.llm_factory.LLM", lambda **params: built.append(params)
+    )
+    llm = LLMFactory.create_llm(
+        "ollama", "llama3.1", base_url="http://gpu-box:11434", keep_alive="30m", seed=2
+    )
+
+    LLMFactory.crew_llm(llm)
+
+    assert built == [
+        {
+            "model": "ollama/llama3.1",
+            "temperature": 0.7,
+            "seed": 2,
+            "base_url": "http://gpu-box:11434",
+            "keep_alive": "30m",
+        }
+    ]
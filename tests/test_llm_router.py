@@ -0,0 +1,44 @@
+"""Tests for LLM routing policy."""
+
+from cv_writer.utils.llm_router import LLMRouter
+
+
+def test_router_uses_fast_llm_for_early_reviews():
+    """Test that early reviews are routed to the fast model."""
+    router = LLMRouter(fast_llm="fast")
+    assert router.select("reviewer", "strong", iteration=1, prompt_chars=100) == "fast"
+
+
+def test_router_keeps_crew_llm_for_other_crews():
+    """Test that crews not listed in fast_crews keep their own model."""
+    router = LLMRouter(fast_llm="fast", fast_crews=["reviewer"])
+    assert router.select("writer", "strong", iteration=1, prompt_chars=100) == "strong"
+
+
+def test_router_final_iteration_uses_strong_llm():
+    """Test that the final iteration always uses the crew's model."""
+    router = LLMRouter(fast_llm="fast", fast_crews=["reviewer", "writer"])
+    assert (
+        router.select("writer", "strong", iteration=2, prompt_chars=100, final=True)
+        == "strong"
+    )
+
+    router = LLMRouter(fast_llm="fast", final_iteration_strong=False)
+    assert (
+        router.select("reviewer", "strong", iteration=3, prompt_chars=100, final=True)
+        == "fast"
+    )
+
+
+def test_router_prompt_size_and_iteration_limits():
+    """Test prompt size and iteration thresholds."""
+    router = LLMRouter(
+        fast_llm="fast", max_fast_prompt_chars=1000, fast_max_iteration=1
+    )
+    assert router.select("reviewer", "strong", iteration=1, prompt_chars=500) == "fast"
+    assert (
+        router.select("reviewer", "strong", iteration=1, prompt_chars=5000) == "strong"
+    )
+    assert (
+        router.select("reviewer", "strong", iteration=2, prompt_chars=500) == "strong"
+    )
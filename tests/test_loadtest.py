@@ -0,0 +1,146 @@
+"""Tests for the load-test harness and stub LLM server."""
+
+import http.client
+import json
+import urllib.error
+import urllib.request
+from types import SimpleNamespace
+
+import pytest
+
+from cv_writer.loadtest import StubLLMServer, percentile, run_load_test
+from cv_writer.loadtest.stub_server import FINAL_ANSWER
+
+
+def _post(url: str, payload: dict) -> urllib.request.Request:
+    return urllib.request.Request(
+        f"{url}/chat/completions",
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+
+
+def test_stub_server_completion():
+    """Test that the stub answers like an OpenAI chat completion."""
+    with StubLLMServer(latency=0, tokens_per_second=0, approve_rate=1) as server:
+        request = _post(
+            server.url,
+            {
+                "model": "gpt-4o",
+                "messages": [{"role": "user", "content": "Start with DECISION:"}],
+            },
+        )
+        with urllib.request.urlopen(request, timeout=5) as response:
+            body = json.loads(response.read())
+
+        assert server.stats()["requests"] == 1
+        assert server.stats()["connections"] == 1
+
+    content = body["choices"][0]["message"]["content"]
+    assert body["model"] == "gpt-4o"
+    assert content.startswith(FINAL_ANSWER)
+    assert "DECISION: APPROVED" in content
+    assert body["usage"]["completion_tokens"] > 0
+
+
+def test_stub_server_streams_events():
+    """Test that stream requests get server-sent events ending with [DONE]."""
+    with StubLLMServer(latency=0, tokens_per_second=0, completion_tokens=20) as server:
+        request = _post(
+            server.url,
+            {"messages": [{"role": "user", "content": "Write a CV"}], "stream": True},
+        )
+        with urllib.request.urlopen(request, timeout=5) as response:
+            assert response.headers["Content-Type"] == "text/event-stream"
+            events = [
+                line[len("data: ") :]
+                for line in response.read().decode("utf-8").splitlines()
+                if line.startswith("data: ")
+            ]
+
+        assert server.stats()["streamed"] == 1
+
+    assert events[-1] == "[DONE]"
+    chunks = [json.loads(event) for event in events[:-1]]
+    text = "".join(chunk["choices"][0]["delta"].get("content", "") for chunk in chunks)
+    assert text.startswith(FINAL_ANSWER)
+    assert chunks[-1]["choices"][0]["finish_reason"] == "stop"
+
+
+def test_stub_server_throttles():
+    """Test that throttled requests get HTTP 429 with a Retry-After hint."""
+    with StubLLMServer(latency=0, throttle_rate=1, retry_after=2) as server:
+        request = _post(server.url, {"messages": []})
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(request, timeout=5)
+
+        assert server.stats()["throttled"] == 1
+
+    assert error.value.code == 429
+    assert error.value.headers["Retry-After"] == "2"
+
+
+def test_percentile():
+    """Test nearest-rank percentiles."""
+    samples = [float(i) for i in range(1, 11)]
+
+    assert percentile(samples, 50) == 5.0
+    assert percentile(samples, 90) == 9.0
+    assert percentile(samples, 99) == 10.0
+    assert percentile([3.0], 50) == 3.0
+    assert percentile([], 50) is None
+
+
+def test_run_load_test_aggregates_runs():
+    """Test that finished and failed runs are counted in the report."""
+    created = []
+
+    class FakeFlow:
+        def __init__(self, fail: bool):
+            self.fail = fail
+            self.state = SimpleNamespace(
+                job_description="", cv_draft="", max_iterations=0, status=""
+            )
+
+        def kickoff(self):
+            if self.fail:
+                raise TimeoutError("Run deadline of 1s reached")
+            self.state.status = "APPROVED"
+
+    def make_flow():
+        flow = FakeFlow(fail=len(created) % 4 == 3)
+        created.append(flow)
+        return flow
+
+    report = run_load_test(make_flow, "Job", "CV", runs=8, concurrency=1)
+
+    assert report.runs == 8
+    assert len(report.durations) == 6
+    assert report.statuses == {"APPROVED": 6}
+    assert report.error_rate == 0.25
+    assert all(flow.state.max_iterations == 2 for flow in created)
+    assert all(flow.state.cv_draft == "CV" for flow in created)
+    summary = report.summary()
+    assert "Error rate: 25.0% (2 failed)" in summary
+    assert "TimeoutError: Run deadline of 1s reached" in summary
+
+
+def test_stub_server_keeps_connections_alive():
+    """Test that clients can reuse one connection for several requests."""
+    with StubLLMServer(latency=0, tokens_per_second=0) as server:
+        host, port = server.url.split("//")[1].split("/")[0].split(":")
+        connection = http.client.HTTPConnection(host, int(port), timeout=5)
+        for _ in range(3):
+            connection.request(
+                "POST",
+                "/v1/chat/completions",
+                body=json.dumps({"messages": []}),
+                headers={"Content-Type": "application/json"},
+            )
+            assert connection.getresponse().read()
+        connection.close()
+
+        stats = server.stats()
+
+    assert stats["requests"] == 3
+    assert stats["connections"] == 1
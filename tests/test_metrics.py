@@ -0,0 +1,117 @@
+"""Tests for the Prometheus-style metrics registry."""
+
+import urllib.request
+
+import pytest
+
+from cv_writer.tools.document_parser import DocumentParser
+from cv_writer.utils.metrics import DOCUMENT_PARSE_SECONDS, ERRORS, MetricsRegistry
+
+
+def test_render_counters_and_histograms():
+    """Test rendering in the Prometheus text exposition format."""
+    registry = MetricsRegistry()
+    calls = registry.counter("llm_calls_total", "LLM calls", ("crew",))
+    latency = registry.histogram("llm_seconds", "Latency", buckets=(1.0, 10.0))
+    calls.inc(crew="ReviewerCrew")
+    calls.inc(2, crew='Writer"Crew')
+    latency.observe(0.5)
+    latency.observe(4)
+
+    text = registry.render()
+
+    assert "# TYPE llm_calls_total counter" in text
+    assert 'llm_calls_total{crew="ReviewerCrew"} 1' in text
+    assert 'llm_calls_total{crew="Writer\\"Crew"} 2' in text
+    assert 'llm_seconds_bucket{le="1"} 1' in text
+    assert 'llm_seconds_bucket{le="10"} 2' in text
+    assert 'llm_seconds_bucket{le="+Inf"} 2' in text
+    assert "llm_seconds_sum 4.5" in text
+    assert "llm_seconds_count 2" in text
+
+
+def test_labels_must_match():
+    """Test that samples with wrong label names are rejected."""
+    registry = MetricsRegistry()
+    counter = registry.counter("runs_total", "Runs", ("status",))
+
+    with pytest.raises(ValueError, match="expects labels"):
+        counter.inc(state="APPROVED")
+    assert registry.counter("runs_total", "Runs", ("status",)) is counter
+    with pytest.raises(ValueError, match="registered differently"):
+        registry.histogram("runs_total", "Runs")
+
+
+def test_textfile_accumulates_across_processes(tmp_path):
+    """Test that text files add up the metrics of separate runs."""
+    path = tmp_path / "cv_writer.prom"
+    first, second = MetricsRegistry(), MetricsRegistry()
+    for registry in (first, second):
+        registry.counter("runs_total", "Runs", ("status",)).inc(status="APPROVED")
+        registry.histogram("run_seconds", "Run time", buckets=(10.0,)).observe(3)
+
+    first.write_textfile(path)
+    second.write_textfile(path)
+    # A repeated write only adds what was counted since the last one
+    second.counter("runs_total", "Runs", ("status",)).inc(status="APPROVED")
+    second.write_textfile(path)
+
+    totals = MetricsRegistry()
+    totals.counter("runs_total", "Runs", ("status",))
+    totals.histogram("run_seconds", "Run time", buckets=(10.0,))
+    values = totals.parse(path.read_text(encoding="utf-8"))
+    assert values["runs_total"] == {("APPROVED",): [3.0]}
+    assert values["run_seconds"] == {(): [2.0, 2.0, 6.0]}
+
+
+def test_metrics_endpoint_serves_registry():
+    """Test the local /metrics endpoint."""
+    registry = MetricsRegistry()
+    registry.counter("runs_total", "Runs").inc()
+    server = registry.serve(0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            body = response.read().decode("utf-8")
+            content_type = response.headers["Content-Type"]
+    finally:
+        server.shutdown()
+
+    assert "runs_total 1" in body
+    assert content_type.startswith("text/plain; version=0.0.4")
+
+
+def test_document_parser_records_parse_metrics(tmp_path):
+    """Test that parsing is timed by file type and failures are counted."""
+    path = tmp_path / "cv.md"
+    path.write_text("# CV", encoding="utf-8")
+    parsed = DOCUMENT_PARSE_SECONDS.count(source="md")
+    errors = ERRORS.value(component="document_parser")
+
+    DocumentParser.parse_file(str(path))
+    (tmp_path / "cv.docx").write_bytes(b"")
+    with pytest.raises(ValueError, match="Unsupported"):
+        DocumentParser.parse_file(str(tmp_path / "cv.docx"))
+
+    assert DOCUMENT_PARSE_SECONDS.count(source="md") == parsed + 1
+    assert ERRORS.value(component="document_parser") == errors + 1
+
+
+def test_metrics_endpoint_is_reused_on_the_same_port():
+    """Test that serving twice on one port returns the running server."""
+    registry = MetricsRegistry()
+    first = registry.serve(0)
+    try:
+        port = first.server_address[1]
+        assert registry.serve(port) is first
+    finally:
+        first.shutdown()
+        first.server_close()
+
+    # A stopped server is replaced
+    second = registry.serve(port)
+    try:
+        assert second is not first
+    finally:
+        second.shutdown()
+        second.server_close()
@@ -0,0 +1,145 @@
+"""Tests for Ollama keep-alive, warm-up and slot management."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from cv_writer.utils.ollama import OllamaModel, apply_slot_limits, slot_limiter
+from cv_writer.utils.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def ollama_server():
+    """Fake Ollama server that loads models on /api/generate."""
+    loaded: dict[str, object] = {}
+    requests_seen: list[dict] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            models = [
+                {"name": name, "expires_at": "2026-10-19T12:30:00Z", "size_vram": 1}
+                for name in loaded
+            ]
+            self._send(200, {"models": models})
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            requests_seen.append(body)
+            if body["model"] == "missing":
+                self._send(404, {"error": "model 'missing' not found"})
+                return
+            loaded[f"{body['model']}:latest"] = body.get("keep_alive")
+            self._send(200, {"model": body["model"], "done": True})
+
+        def _send(self, status, payload):
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}", loaded, requests_seen
+    server.shutdown()
+    server.server_close()
+
+
+def test_probe_detects_cold_and_warm_model(ollama_server):
+    """Test that the probe reports a model as loaded only after a preload."""
+    url, loaded, requests_seen = ollama_server
+    model = OllamaModel("llama3.1", base_url=url, keep_alive=-1)
+
+    assert model.status() == {"reachable": True, "loaded": False}
+    assert model.is_warm() is False
+
+    assert model.preload() >= 0
+    status = model.status()
+
+    assert status["loaded"] is True
+    assert status["expires_at"] == "2026-10-19T12:30:00Z"
+    assert requests_seen == [{"model": "llama3.1", "keep_alive": -1}]
+    assert loaded == {"llama3.1:latest": -1}
+
+
+def test_probe_unreachable_server():
+    """Test that an unreachable server is reported instead of raised."""
+    model = OllamaModel("llama3.1", base_url="http://127.0.0.1:9", timeout=1)
+
+    assert model.status() == {"reachable": False, "loaded": False}
+
+
+def test_preload_in_background(ollama_server):
+    """Test that background preloads report their result through a future."""
+    url, _, _ = ollama_server
+
+    ready = OllamaModel("llama3.1", base_url=url).preload_in_background()
+    missing = OllamaModel("missing", base_url=url).preload_in_background()
+
+    assert ready.result(timeout=5) >= 0
+    with pytest.raises(requests.exceptions.HTTPError):
+        missing.result(timeout=5)
+
+
+def test_slot_limiter_caps_only_ollama():
+    """Test that the slot limiter queues Ollama calls beyond the server slots."""
+    limiter = slot_limiter(2)
+    in_flight = {"ollama": 0, "openai": 0}
+    peak = {"ollama": 0, "openai": 0}
+    lock = threading.Lock()
+
+    def call(provider):
+        def run():
+            with lock:
+                in_flight[provider] += 1
+                peak[provider] = max(peak[provider], in_flight[provider])
+            time.sleep(0.05)
+            with lock:
+                in_flight[provider] -= 1
+
+        limiter.call(provider, "model", run)
+
+    threads = [
+        threading.Thread(target=call, args=(provider,))
+        for provider in ("ollama", "openai")
+        for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak["ollama"] == 2
+    assert peak["openai"] == 6
+
+
+def test_slot_limits_apply_to_configured_model_keys():
+    """Test that per-model Ollama limits keep their quota but get the slot cap."""
+    limiter = RateLimiter(
+        models={
+            "ollama/llama3.1": {
+                "requests_per_minute": 30,
+                "concurrency": {"initial": 6, "max": 8},
+            }
+        }
+    )
+
+    apply_slot_limits(limiter, ["llama3.1", "qwen2.5"], 2)
+    configured = limiter.limiter_for("ollama", "llama3.1")
+    other = limiter.limiter_for("ollama", "qwen2.5")
+
+    assert configured.requests.capacity == 30
+    assert configured.concurrency.maximum == 2
+    assert configured.concurrency.limit == 2
+    assert other.concurrency.maximum == 2
+    assert limiter.limiter_for("openai", "gpt-4o").concurrency.maximum == 8
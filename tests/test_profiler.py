@@ -0,0 +1,60 @@
+"""Tests for the per-phase profiler."""
+
+import pstats
+
+import pytest
+
+from cv_writer.utils.profiler import PhaseProfiler
+
+
+def busy_work() -> list[str]:
+    """Burn some CPU and allocate memory."""
+    return [str(i) * 10 for i in range(20_000)]
+
+
+def test_phases_are_profiled_and_aggregated(tmp_path):
+    """Test that every phase occurrence gets a profile file and is aggregated."""
+    profiler = PhaseProfiler(tmp_path, "run1", top=5)
+    try:
+        for _ in range(2):
+            with profiler.phase("review"):
+                busy_work()
+        with profiler.phase("write"):
+            busy_work()
+    finally:
+        profiler.close()
+
+    review = profiler.phases["review"]
+    assert review.calls == 2
+    assert review.cpu_seconds > 0
+    assert review.peak_bytes > 0
+    assert [p.name for p in review.profile_files] == [
+        "run1.review-1.prof",
+        "run1.review-2.prof",
+    ]
+    assert pstats.Stats(str(review.profile_files[0])).total_calls > 0
+
+
+def test_summary_lists_phases_and_top_functions(tmp_path):
+    """Test the summary table and its written file."""
+    profiler = PhaseProfiler(tmp_path, "run1", top=5)
+    with profiler.phase("parse"):
+        busy_work()
+    profiler.close()
+
+    summary = profiler.summary()
+    assert summary.splitlines()[0].split()[:2] == ["PHASE", "CALLS"]
+    assert "parse: top 5 functions by self time" in summary
+    assert "busy_work" in summary
+    assert profiler.write_summary().read_text().startswith("PHASE")
+
+
+def test_nested_phases_are_rejected(tmp_path):
+    """Test that only one phase can be profiled at a time."""
+    profiler = PhaseProfiler(tmp_path, "run1")
+    try:
+        profiler.start("review")
+        with pytest.raises(RuntimeError, match="review"):
+            profiler.start("write")
+    finally:
+        profiler.close()
@@ -0,0 +1,93 @@
+"""Tests for the prompt budget governor."""
+
+import pytest
+
+from cv_writer.utils.prompt_budget import (
+    PromptBudget,
+    compress_text,
+    count_tokens,
+    truncate_tokens,
+)
+
+WORDS = " ".join(f"word{i}" for i in range(2000))
+
+
+def make_inputs(supporting_docs: str = "", job_description: str = "Python") -> dict:
+    """Create writer inputs with a small CV."""
+    return {
+        "job_description": job_description,
+        "current_cv": "# CV\n\nPython developer",
+        "cv_draft": "# CV\n\nPython developer",
+        "supporting_docs": supporting_docs,
+        "latest_feedback": "Add more detail",
+    }
+
+
+def test_context_window_lookup():
+    """Test longest-prefix context window lookup with overrides."""
+    budget = PromptBudget(context_windows={"ollama/llama3.1": 32_768})
+
+    assert budget.context_window("openai", "gpt-4o-mini") == 128_000
+    assert budget.context_window("anthropic", "claude-sonnet-4-5") == 200_000
+    assert budget.context_window("ollama", "llama3.1") == 32_768
+    assert budget.context_window("ollama", "mistral") == 4_096
+    assert budget.context_window("unknown", "model") == 8_192
+
+
+def test_truncate_and_compress():
+    """Test token truncation and lossless compression helpers."""
+    assert count_tokens(truncate_tokens(WORDS, 100)) <= 100
+    assert truncate_tokens("short", 100) == "short"
+    assert compress_text("Apply  now!\n\n\nApply now!\nPython") == "Apply now!\nPython"
+
+
+def test_inputs_within_budget_are_unchanged():
+    """Test that fitting inputs are returned as they are."""
+    inputs = make_inputs(supporting_docs="A certificate")
+    fitted, reductions = PromptBudget().fit(inputs, "openai", "gpt-4o")
+
+    assert fitted is inputs
+    assert reductions == []
+
+
+def test_supporting_docs_trimmed_first():
+    """Test that supporting documents are trimmed before the job description."""
+    budget = PromptBudget(
+        context_windows={"ollama": 4_000}, overhead_tokens=500, output_reserve_tokens=0
+    )
+    inputs = make_inputs(supporting_docs=WORDS, job_description="Python " * 50)
+
+    fitted, reductions = budget.fit(inputs, "ollama", "llama3.1")
+
+    assert [r["field"] for r in reductions] == ["supporting_docs"]
+    assert reductions[0]["tokens_after"] < reductions[0]["tokens_before"]
+    assert fitted["job_description"] == inputs["job_description"]
+    assert fitted["current_cv"] == inputs["current_cv"]
+    assert sum(count_tokens(v) for v in fitted.values()) <= 3_500
+
+
+def test_job_description_compressed_after_docs():
+    """Test that the job description is compressed and trimmed if needed."""
+    budget = PromptBudget(
+        context_windows={"ollama": 1_500},
+        overhead_tokens=200,
+        output_reserve_tokens=0,
+        min_job_description_tokens=100,
+    )
+    inputs = make_inputs(supporting_docs=WORDS, job_description=WORDS)
+
+    fitted, reductions = budget.fit(inputs, "ollama", "llama3.1")
+
+    assert [r["field"] for r in reductions] == ["supporting_docs", "job_description"]
+    assert reductions[1]["action"] == "trimmed"
+    assert fitted["latest_feedback"] == inputs["latest_feedback"]
+
+
+def test_cv_is_never_trimmed():
+    """Test that an oversized CV raises instead of being cut."""
+    budget = PromptBudget(context_windows={"ollama": 1_000}, overhead_tokens=0)
+    inputs = make_inputs()
+    inputs["current_cv"] = WORDS
+
+    with pytest.raises(ValueError, match="ollama/llama3.1"):
+        budget.fit(inputs, "ollama", "llama3.1")
@@ -0,0 +1,149 @@
+"""Tests for rate limiter."""
+
+import pytest
+
+from cv_writer.utils.rate_limiter import (
+    AdaptiveConcurrency,
+    RateLimiter,
+    TokenBucket,
+    estimate_tokens,
+    is_throttling_error,
+)
+
+
+class ThrottledError(Exception):
+    """Fake provider error carrying an HTTP status code."""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"Error code: {status_code}")
+        self.status_code = status_code
+
+
+def test_estimate_tokens():
+    """Test token estimation heuristic."""
+    assert estimate_tokens("") == 1
+    assert estimate_tokens("a" * 400) == 100
+
+
+def test_is_throttling_error():
+    """Test detection of throttling errors."""
+    assert is_throttling_error(ThrottledError(429)) is True
+    assert is_throttling_error(Exception("Rate limit reached for gpt-4o")) is True
+    assert is_throttling_error(ThrottledError(500)) is False
+    assert is_throttling_error(ValueError("bad input")) is False
+
+
+def test_token_bucket_wait_time():
+    """Test that reservations beyond capacity require waiting."""
+    bucket = TokenBucket(capacity=10, refill_per_second=5)
+    assert bucket.reserve(10) == 0.0
+    wait = bucket.reserve(5)
+    assert wait == pytest.approx(1.0, abs=0.05)
+
+
+def test_token_bucket_shared_state(tmp_path):
+    """Test that buckets sharing a state file share the budget."""
+    state_file = tmp_path / "openai__gpt-4o.requests.json"
+    first = TokenBucket(capacity=2, refill_per_second=0.001, state_file=state_file)
+    second = TokenBucket(capacity=2, refill_per_second=0.001, state_file=state_file)
+
+    assert first.reserve(1) == 0.0
+    assert second.reserve(1) == 0.0
+    assert first.reserve(1) > 0
+
+
+def test_adaptive_concurrency_increase_and_decrease():
+    """Test AIMD behavior of the concurrency controller."""
+    controller = AdaptiveConcurrency(initial=2, minimum=1, maximum=4)
+
+    for _ in range(10):
+        controller.acquire()
+        controller.release(latency=1.0)
+    assert controller.limit > 2
+
+    controller.acquire()
+    controller.release(throttled=True)
+    assert controller.limit <= 2
+
+    limit = controller.limit
+    controller.acquire()
+    controller.release(latency=10.0)
+    assert controller.limit <= max(1, limit)
+
+
+def test_adaptive_concurrency_baseline_per_kind():
+    """Test that slow calls of one crew do not count as congestion of another."""
+    controller = AdaptiveConcurrency(initial=2, minimum=1, maximum=8)
+
+    for _ in range(5):
+        controller.acquire()
+        controller.release(latency=2.0, kind="ReviewerCrew")
+        controller.acquire()
+        controller.release(latency=30.0, kind="WriterCrew")
+    assert controller.limit > 2
+
+    limit = controller.limit
+    controller.acquire()
+    controller.release(latency=30.0, kind="ReviewerCrew")
+    assert controller.limit < limit
+
+
+def test_rate_limiter_retries_throttled_calls():
+    """Test that throttled calls are retried with backoff."""
+    sleeps = []
+    limiter = RateLimiter(max_retries=3, sleep=sleeps.append)
+    attempts = {"count": 0}
+
+    def flaky_call():
+        attempts["count"] += 1
+        if attempts["count"] < 3:
+            raise ThrottledError(429)
+        return "ok"
+
+    assert limiter.call("openai", "gpt-4o", flaky_call) == "ok"
+    assert attempts["count"] == 3
+    assert len(sleeps) == 2
+
+
+def test_rate_limiter_gives_up_after_max_retries():
+    """Test that throttling errors are raised after max retries."""
+    limiter = RateLimiter(max_retries=1, sleep=lambda _: None)
+
+    def always_throttled():
+        raise ThrottledError(429)
+
+    with pytest.raises(ThrottledError):
+        limiter.call("openai", "gpt-4o", always_throttled)
+
+
+def test_rate_limiter_does_not_retry_other_errors():
+    """Test that non-throttling errors are raised immediately."""
+    limiter = RateLimiter(max_retries=3, sleep=lambda _: None)
+    attempts = {"count": 0}
+
+    def failing_call():
+        attempts["count"] += 1
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        limiter.call("openai", "gpt-4o", failing_call)
+    assert attempts["count"] == 1
+
+
+def test_rate_limiter_model_overrides():
+    """Test per provider/model limit overrides."""
+    limiter = RateLimiter(
+        requests_per_minute=60,
+        models={
+            "openai/gpt-4o": {"requests_per_minute": 500},
+            "anthropic": {"tokens_per_minute": 40000},
+        },
+    )
+
+    assert limiter.limiter_for("openai", "gpt-4o").requests.capacity == 500
+    assert limiter.limiter_for("openai", "gpt-4o-mini").requests.capacity == 60
+    anthropic = limiter.limiter_for("anthropic", "claude-sonnet-4-5")
+    assert anthropic.tokens.capacity == 40000
+    assert limiter.limiter_for("openai", "gpt-4o") is limiter.limiter_for(
+        "OpenAI", "gpt-4o"
+    )
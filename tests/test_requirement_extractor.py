@@ -0,0 +1,110 @@
+"""Tests for requirement profile extraction."""
+
+import pytest
+
+from cv_writer.tools.requirement_extractor import (
+    RequirementExtractor,
+    extract_local,
+    parse_profile,
+)
+
+JOB_DESCRIPTION = """Senior Backend Engineer
+
+About us
+We are a fast-growing fintech company with a great culture.
+
+What you'll do:
+- Design and build Python microservices
+- Own our PostgreSQL data layer
+
+Requirements
+- 5+ years of experience with Python
+- Strong knowledge of Django or FastAPI
+- Experience with Kubernetes is a plus
+
+Nice to have
+- Terraform
+
+Benefits
+- Free lunch
+"""
+
+
+def test_extract_local_sections():
+    """Test heuristic extraction of sections, seniority and experience."""
+    profile = extract_local(JOB_DESCRIPTION)
+
+    assert profile.title == "Senior Backend Engineer"
+    assert profile.seniority == "senior"
+    assert profile.min_years_experience == 5
+    assert profile.must_have == [
+        "5+ years of experience with Python",
+        "Strong knowledge of Django or FastAPI",
+    ]
+    assert profile.nice_to_have == ["Experience with Kubernetes is a plus", "Terraform"]
+    assert "Own our PostgreSQL data layer" in profile.responsibilities
+    assert "python" in profile.keywords
+    assert "lunch" not in profile.keywords
+    assert "fintech" not in profile.keywords
+
+
+def test_profile_markdown_is_compact():
+    """Test that the profile is shorter than the posting and drops boilerplate."""
+    markdown = extract_local(JOB_DESCRIPTION).to_markdown()
+
+    assert markdown.startswith("# Senior Backend Engineer")
+    assert "## Must have" in markdown
+    assert "Free lunch" not in markdown
+
+
+def test_parse_profile_from_llm_output():
+    """Test parsing JSON wrapped in text or code fences."""
+    raw = '```json\n{"title": "Engineer", "must_have": ["Python"], "seniority": null}\n```'
+    profile = parse_profile(raw)
+
+    assert profile.title == "Engineer"
+    assert profile.must_have == ["Python"]
+    with pytest.raises(ValueError):
+        parse_profile("I cannot help with that.")
+
+
+def test_extractor_caches_by_content(tmp_path):
+    """Test that a posting is extracted once and then served from the cache."""
+    calls = []
+
+    def llm_extract(text: str) -> str:
+        calls.append(text)
+        return '{"title": "Engineer", "must_have": ["Python"]}'
+
+    first, cached_first = RequirementExtractor(tmp_path).extract(
+        JOB_DESCRIPTION, llm_extract
+    )
+    # A new extractor (e.g. the next batch run) reads the file cache
+    second, cached_second = RequirementExtractor(tmp_path).extract(
+        JOB_DESCRIPTION + "\n", llm_extract
+    )
+
+    assert calls == [JOB_DESCRIPTION]
+    assert (cached_first, cached_second) == (False, True)
+    assert first == second
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+def test_extractor_caches_llm_profiles_per_model(tmp_path):
+    """Test that LLM profiles of different models are cached separately."""
+    calls = []
+
+    def llm_extract(text: str) -> str:
+        calls.append(text)
+        return '{"title": "Engineer", "must_have": ["Python"]}'
+
+    extractor = RequirementExtractor(tmp_path)
+    extractor.extract(JOB_DESCRIPTION, llm_extract, "openai/gpt-4o-mini")
+    _, cached = extractor.extract(JOB_DESCRIPTION, llm_extract, "ollama/llama3.1")
+    _, cached_again = extractor.extract(JOB_DESCRIPTION, llm_extract, "ollama/llama3.1")
+
+    assert len(calls) == 2
+    assert (cached, cached_again) == (False, True)
+    assert extractor.cache_key(JOB_DESCRIPTION, "local", "x") == extractor.cache_key(
+        JOB_DESCRIPTION, "local"
+    )
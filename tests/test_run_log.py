@@ -0,0 +1,51 @@
+"""Tests for the append-only run event log."""
+
+from cv_writer.utils.run_log import RunLog
+
+
+def test_records_are_visible_immediately(tmp_path):
+    """Test that each record can be read while the log is still open."""
+    path = tmp_path / "run.events.ndjson"
+    log = RunLog(path, run_id="run1")
+
+    log.write("review", iteration=1, decision="REVISE")
+    records = RunLog.read(path)
+    log.close()
+
+    assert len(records) == 1
+    assert records[0]["event"] == "review"
+    assert records[0]["run_id"] == "run1"
+    assert records[0]["decision"] == "REVISE"
+
+
+def test_texts_only_logged_when_enabled(tmp_path):
+    """Test that full texts are left out unless include_text is set."""
+    with RunLog(tmp_path / "short.ndjson") as log:
+        log.write("revision", text={"cv": "# CV"}, cv_chars=4)
+    with RunLog(tmp_path / "full.ndjson", include_text=True) as log:
+        log.write("revision", text={"cv": "# CV"}, cv_chars=4)
+
+    assert "cv" not in RunLog.read(tmp_path / "short.ndjson")[0]
+    assert RunLog.read(tmp_path / "full.ndjson")[0]["cv"] == "# CV"
+
+
+def test_read_skips_truncated_last_line(tmp_path):
+    """Test that a partially written record does not break reading."""
+    path = tmp_path / "run.ndjson"
+    with RunLog(path) as log:
+        log.write("start")
+    with open(path, "a") as f:
+        f.write('{"event": "rev')
+
+    assert [r["event"] for r in RunLog.read(path)] == ["start"]
+
+
+def test_log_is_append_only(tmp_path):
+    """Test that reopening a log appends instead of truncating."""
+    path = tmp_path / "run.ndjson"
+    with RunLog(path) as log:
+        log.write("start")
+    with RunLog(path) as log:
+        log.write("finish")
+
+    assert [r["event"] for r in RunLog.read(path)] == ["start", "finish"]
@@ -0,0 +1,149 @@
+"""Tests for the run results store."""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from cv_writer.models import ReviewFeedback, RunRecord
+from cv_writer.utils.fingerprint import config_hash, content_hash, files_hash
+from cv_writer.utils.run_store import RunStore, new_run_id
+
+
+def make_record(**kwargs) -> RunRecord:
+    """Create a run record with test defaults."""
+    defaults = {
+        "run_id": new_run_id(),
+        "candidate": "jane_doe",
+        "job": "backend_engineer",
+        "cv_hash": content_hash("cv"),
+        "job_hash": content_hash("job"),
+        "status": "APPROVED",
+        "iterations": 2,
+        "final_cv": "# Jane Doe",
+    }
+    defaults.update(kwargs)
+    return RunRecord(**defaults)
+
+
+def test_new_run_id_is_unique():
+    """Test that run ids created in the same second differ."""
+    now = datetime(2025, 11, 13, 12, 34, 56)
+    first, second = new_run_id(now), new_run_id(now)
+
+    assert first != second
+    assert first.startswith("20251113_123456_")
+
+
+def test_content_hash_is_stable():
+    """Test fingerprints are stable and separate parts unambiguously."""
+    assert content_hash("abc") == content_hash("abc")
+    assert content_hash("ab", "c") != content_hash("a", "bc")
+    assert config_hash({"a": 1, "b": 2}) == config_hash({"b": 2, "a": 1})
+
+
+def test_save_and_get_run(tmp_path):
+    """Test storing and loading a complete run."""
+    store = RunStore(tmp_path / "runs.db")
+    record = make_record(
+        config={"llm": {"provider": "openai"}},
+        timings={"review": 1.5},
+        translations={"de": "# Jane Doe (de)"},
+        feedback_history=[
+            ReviewFeedback(iteration=1, decision="APPROVED", comments="Good")
+        ],
+    )
+    store.save_run(record)
+
+    loaded = store.get_run(record.run_id)
+    assert loaded == record
+    assert store.get_run(record.run_id[:20]) == record
+    assert store.get_run("missing") is None
+
+
+def test_save_run_rejects_duplicate_id(tmp_path):
+    """Test that a run id cannot be stored twice."""
+    store = RunStore(tmp_path / "runs.db")
+    record = make_record()
+    store.save_run(record)
+
+    with pytest.raises(ValueError, match="already exists"):
+        store.save_run(record)
+
+
+def test_find_runs_by_candidate_job_and_date(tmp_path):
+    """Test indexed lookup of run summaries."""
+    store = RunStore(tmp_path / "runs.db")
+    now = datetime.now()
+    store.save_run(make_record(created_at=now - timedelta(days=10)))
+    store.save_run(make_record(candidate="john_roe", cv_hash=content_hash("cv2")))
+    store.save_run(make_record(job="data_engineer"))
+
+    assert len(store.find_runs()) == 3
+    assert len(store.find_runs(candidate="jane_doe")) == 2
+    assert len(store.find_runs(candidate=content_hash("cv2"))) == 1
+    assert len(store.find_runs(job="backend_engineer")) == 2
+    assert len(store.find_runs(since=now - timedelta(days=1))) == 2
+
+    newest = store.find_runs(candidate="jane_doe")[0]
+    assert newest["job"] == "data_engineer"
+    assert "final_cv" not in newest
+
+
+def test_files_hash_ignores_order_and_location(tmp_path):
+    """Test that template hashes depend on relative names and contents only."""
+    for root in (tmp_path / "a", tmp_path / "b"):
+        (root / "crew").mkdir(parents=True)
+        (root / "crew" / "tasks.yaml").write_text("task", encoding="utf-8")
+        (root / "crew" / "agents.yaml").write_text("agent", encoding="utf-8")
+
+    first = files_hash((tmp_path / "a").glob("*/*.yaml"), root=tmp_path / "a")
+    second = files_hash(
+        sorted((tmp_path / "b").glob("*/*.yaml"), reverse=True), root=tmp_path / "b"
+    )
+    assert first == second
+
+    (tmp_path / "b" / "crew" / "tasks.yaml").write_text("changed", encoding="utf-8")
+    assert files_hash((tmp_path / "b").glob("*/*.yaml"), root=tmp_path / "b") != first
+
+
+def test_find_memoized_returns_newest_completed_run(tmp_path):
+    """Test memoized lookup by memo key, skipping incomplete runs."""
+    store = RunStore(tmp_path / "runs.db")
+    now = datetime.now()
+    store.save_run(make_record(memo_key="key", created_at=now - timedelta(hours=1)))
+    newest = make_record(memo_key="key", created_at=now, final_cv="# Newest")
+    store.save_run(newest)
+    store.save_run(
+        make_record(memo_key="key", created_at=now + timedelta(hours=1), status="")
+    )
+
+    found = store.find_memoized("key")
+
+    assert found.run_id == newest.run_id
+    assert found.final_cv == "# Newest"
+    assert store.find_memoized("other") is None
+    assert store.find_memoized("") is None
+
+
+def test_old_database_gets_memo_key_column(tmp_path):
+    """Test that databases created before memoization are migrated."""
+    path = tmp_path / "runs.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE runs (run_id TEXT PRIMARY KEY, created_at TEXT NOT NULL, "
+        "candidate TEXT NOT NULL, job TEXT NOT NULL, cv_hash TEXT NOT NULL, "
+        "job_hash TEXT NOT NULL, inputs_hash TEXT NOT NULL, status TEXT NOT NULL, "
+        "final_decision TEXT, iterations INTEGER NOT NULL, config TEXT NOT NULL, "
+        "timings TEXT NOT NULL, cv_draft TEXT NOT NULL, "
+        "job_description TEXT NOT NULL, final_cv TEXT NOT NULL, "
+        "translations TEXT NOT NULL, feedback_history TEXT NOT NULL, "
+        "output_files TEXT NOT NULL)"
+    )
+    conn.commit()
+    conn.close()
+
+    store = RunStore(path)
+    store.save_run(make_record(memo_key="key"))
+
+    assert store.find_memoized("key") is not None
@@ -0,0 +1,105 @@
+"""Tests for combining section reviews."""
+
+from cv_writer.tools.section_review import (
+    is_approved,
+    map_feedback_to_sections,
+    parse_action_items,
+    reduce_section_reviews,
+    unmapped_action_items,
+)
+
+
+def test_parse_action_items():
+    """Test extraction of prioritized action items."""
+    review = "DECISION: REVISE\nThe summary is vague.\n- [low] Fix typo\n* [HIGH] Add Kubernetes"
+
+    assert parse_action_items(review) == [
+        ("LOW", "Fix typo"),
+        ("HIGH", "Add Kubernetes"),
+    ]
+
+
+def test_reduce_orders_items_by_priority():
+    """Test that section verdicts are reduced into one prioritized review."""
+    review = reduce_section_reviews(
+        [
+            ("", "DECISION: APPROVED"),
+            ("Summary", "DECISION: REVISE\n- [LOW] Shorten\n- [HIGH] Mention Python"),
+            ("Skills", "DECISION: REVISE\n- [MEDIUM] Group by topic"),
+        ]
+    )
+
+    assert not is_approved(review)
+    assert "1 of 3 sections approved" in review
+    items = [line for line in review.splitlines() if line.startswith("- [")]
+    assert items == [
+        "- [HIGH] **Summary**: Mention Python",
+        "- [MEDIUM] **Skills**: Group by topic",
+        "- [LOW] **Summary**: Shorten",
+    ]
+    assert "### Header" not in review
+
+
+def test_reduce_approves_when_all_sections_approve():
+    """Test that the CV is approved only if every section is."""
+    review = reduce_section_reviews(
+        [("Summary", "DECISION: APPROVED"), ("Skills", "Decision: approved")]
+    )
+
+    assert review.startswith("DECISION: APPROVED")
+
+
+def test_map_feedback_prefers_labeled_items():
+    """Test that labeled action items are mapped to their sections only."""
+    feedback = (
+        "DECISION: REVISE\n"
+        "The experience section is fine.\n"
+        "- [HIGH] **Skills**: Add PostgreSQL\n"
+        "- [LOW] **Summary**: Shorten"
+    )
+
+    assert map_feedback_to_sections(
+        feedback, ["", "Summary", "Experience", "Skills"]
+    ) == {
+        "Summary": ["- [LOW] **Summary**: Shorten"],
+        "Skills": ["- [HIGH] **Skills**: Add PostgreSQL"],
+    }
+
+
+def test_map_feedback_maps_header_label_to_untitled_section():
+    """Test that items labeled "Header" go to the section without a title."""
+    feedback = "- [HIGH] **Header**: Add a LinkedIn link\n- [LOW] **Skills**: Sort"
+
+    assert map_feedback_to_sections(feedback, ["", "Skills"]) == {
+        "": ["- [HIGH] **Header**: Add a LinkedIn link"],
+        "Skills": ["- [LOW] **Skills**: Sort"],
+    }
+
+
+def test_unmapped_action_items():
+    """Test that action items naming no section are reported."""
+    labeled = "- [HIGH] **Projects**: Add one\n- [LOW] **Skills**: Sort"
+    free_form = (
+        "Overall solid.\n"
+        "- Mention Kubernetes throughout\n"
+        "2. Rework the Skills section\n"
+        "- [HIGH] Quantify results"
+    )
+
+    assert unmapped_action_items(labeled, ["Summary", "Skills"]) == [
+        "- [HIGH] **Projects**: Add one"
+    ]
+    assert unmapped_action_items(free_form, ["Summary", "Skills"]) == [
+        "- Mention Kubernetes throughout",
+        "- [HIGH] Quantify results",
+    ]
+
+
+def test_map_feedback_matches_section_mentions():
+    """Test that unlabeled feedback is mapped by whole-word title mentions."""
+    feedback = "Rework the Skills section.\nThe summary lacks metrics.\nSkillset ok."
+
+    assert map_feedback_to_sections(feedback, ["Summary", "Skills"]) == {
+        "Summary": ["The summary lacks metrics."],
+        "Skills": ["Rework the Skills section."],
+    }
@@ -0,0 +1,23 @@
+"""Tests for the translation memory."""
+
+from cv_writer.utils.translation_memory import TranslationMemory
+
+
+def test_lookup_returns_stored_translations(tmp_path):
+    """Test storing and looking up translated segments."""
+    memory = TranslationMemory(tmp_path / "tm.db")
+    memory.store([("## Experience", "## Berufserfahrung")], "de", "openai/gpt-4o")
+
+    assert memory.lookup(["## Experience", "## Skills"], "DE", "openai/gpt-4o") == [
+        "## Berufserfahrung",
+        None,
+    ]
+
+
+def test_entries_are_separated_by_language_and_model(tmp_path):
+    """Test that other languages and models do not share translations."""
+    memory = TranslationMemory(tmp_path / "tm.db")
+    memory.store([("Skills", "Kenntnisse")], "de", "openai/gpt-4o")
+
+    assert memory.lookup(["Skills"], "fr", "openai/gpt-4o") == [None]
+    assert memory.lookup(["Skills"], "de", "ollama/llama3") == [None]